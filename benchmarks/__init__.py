@@ -0,0 +1,12 @@
+"""Performance benchmarks of every metafeature group of pymfe.
+
+The benchmarks run over synthetic datasets (check ``datasets`` module) of
+several shapes, timing the ``fit`` and ``extract`` methods of ``MFE`` and
+every precomputation and feature-extraction method of each group, and
+recording the peak memory allocated. The results are written as JSON, so
+they can be compared against a stored baseline (check ``compare`` module).
+
+Usage:
+    python -m benchmarks run --output current.json
+    python -m benchmarks compare baseline.json current.json
+"""
@@ -0,0 +1,129 @@
+"""Command line interface of the benchmarks.
+
+Check ``python -m benchmarks --help`` for the available commands.
+"""
+import typing as t
+import argparse
+import json
+import sys
+
+from benchmarks import compare
+from benchmarks import datasets
+from benchmarks import imports
+from benchmarks import run
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Run the benchmarks and write the report."""
+    configs = datasets.iter_configs(
+        num_inst=args.num_inst,
+        num_attr=args.num_attr,
+        num_classes=args.num_classes,
+        cat_ratios=args.cat_ratios,
+        max_values=args.max_values or None)
+
+    report = run.run(configs,
+                     groups=args.groups,
+                     repeat=args.repeat,
+                     measure_memory=not args.no_memory,
+                     random_state=args.random_state,
+                     verbose=args.verbose)
+
+    with open(args.output, "w") as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
+
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    """Compare two reports, failing if any regression is found."""
+    regressions = compare.compare(
+        baseline=compare.load(args.baseline),
+        current=compare.load(args.current),
+        threshold=args.threshold,
+        min_time=args.min_time,
+        min_memory=args.min_memory)
+
+    if regressions:
+        print("{0} regression(s) found:".format(len(regressions)))
+        print(compare.format_regressions(regressions))
+        return 1
+
+    print("No regressions found.")
+    return 0
+
+
+def _imports(args: argparse.Namespace) -> int:
+    """Measure the import time, failing if any heavy module is loaded."""
+    report = imports.run(repeat=args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+
+    failed = False
+
+    for scenario, result in sorted(report.items()):
+        print("{0}: {1:.4f}s, heavy modules loaded: {2}".format(
+            scenario, result["time"],
+            ", ".join(result["heavy_modules"]) or "none"))
+        failed = failed or bool(result["heavy_modules"])
+
+    return int(failed)
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Parse the command line arguments and run the selected command."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    parser_run = subparsers.add_parser("run", help="run the benchmarks")
+    parser_run.add_argument("--output", "-o", required=True,
+                            help="path of the JSON report")
+    parser_run.add_argument("--num-inst", type=int, nargs="+",
+                            default=datasets.NUM_INST)
+    parser_run.add_argument("--num-attr", type=int, nargs="+",
+                            default=datasets.NUM_ATTR)
+    parser_run.add_argument("--num-classes", type=int, nargs="+",
+                            default=datasets.NUM_CLASSES)
+    parser_run.add_argument("--cat-ratios", type=float, nargs="+",
+                            default=datasets.CAT_RATIOS)
+    parser_run.add_argument("--max-values", type=int,
+                            default=datasets.MAX_VALUES,
+                            help="skip datasets with more values (0 to run "
+                            "every dataset)")
+    parser_run.add_argument("--groups", nargs="+", default=run.GROUPS)
+    parser_run.add_argument("--repeat", type=int, default=1)
+    parser_run.add_argument("--random-state", type=int, default=0)
+    parser_run.add_argument("--no-memory", action="store_true",
+                            help="do not measure the peak memory")
+    parser_run.add_argument("--verbose", "-v", action="store_true")
+    parser_run.set_defaults(func=_run)
+
+    parser_compare = subparsers.add_parser(
+        "compare", help="compare a report against a baseline")
+    parser_compare.add_argument("baseline", help="baseline JSON report")
+    parser_compare.add_argument("current", help="current JSON report")
+    parser_compare.add_argument("--threshold", type=float,
+                                default=compare.THRESHOLD)
+    parser_compare.add_argument("--min-time", type=float,
+                                default=compare.MIN_TIME)
+    parser_compare.add_argument("--min-memory", type=int,
+                                default=compare.MIN_MEMORY)
+    parser_compare.set_defaults(func=_compare)
+
+    parser_imports = subparsers.add_parser(
+        "imports", help="measure the import time and heavy modules loaded")
+    parser_imports.add_argument("--output", "-o",
+                                help="path of the JSON report")
+    parser_imports.add_argument("--repeat", type=int, default=1)
+    parser_imports.set_defaults(func=_imports)
+
+    args = parser.parse_args(argv)
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Compare benchmark reports to detect performance regressions.
+
+Attributes:
+    THRESHOLD (:obj:`float`): default relative increase of a measurement
+        considered a regression.
+
+    MIN_TIME (:obj:`float`): default minimum time, in seconds, of a baseline
+        measurement to be compared. Shorter times are too noisy.
+
+    MIN_MEMORY (:obj:`int`): default minimum peak memory, in bytes, of a
+        baseline measurement to be compared.
+"""
+import typing as t
+import json
+
+THRESHOLD = 0.25
+
+MIN_TIME = 0.01
+
+MIN_MEMORY = 1 << 20
+
+_TypeMetricKey = t.Tuple[str, str, str]
+"""Type annotation for (config, group, metric) keys of the measurements."""
+
+
+def load(path: str) -> t.Dict[str, t.Any]:
+    """Load a benchmark report from a JSON file."""
+    with open(path, "r") as report_file:
+        return json.load(report_file)
+
+
+def flatten(report: t.Dict[str, t.Any]) -> t.Dict[_TypeMetricKey, float]:
+    """Get every measurement of ``report`` keyed by (config, group, metric).
+
+    The metric names are ``fit``, ``extract``, ``peak_memory`` and, for each
+    method, ``precompute.<method name>`` or ``features.<method name>``.
+    """
+    measurements = {}  # type: t.Dict[_TypeMetricKey, float]
+
+    for result in report["results"]:
+        config, group = result["config"], result["group"]
+
+        for metric in ("fit", "extract", "peak_memory"):
+            if result.get(metric) is not None:
+                measurements[(config, group, metric)] = result[metric]
+
+        for stage in ("precompute", "features"):
+            for mtd_name, value in result.get(stage, {}).items():
+                measurements[(config, group, ".".join((stage, mtd_name)))] = (
+                    value)
+
+    return measurements
+
+
+def compare(
+        baseline: t.Dict[str, t.Any],
+        current: t.Dict[str, t.Any],
+        threshold: float = THRESHOLD,
+        min_time: float = MIN_TIME,
+        min_memory: int = MIN_MEMORY,
+) -> t.List[t.Tuple[_TypeMetricKey, float, float]]:
+    """Find the measurements of ``current`` worse than the ``baseline`` ones.
+
+    Only measurements present in both reports are compared.
+
+    Args:
+        threshold (:obj:`float`, optional): a measurement is a regression if
+            it is greater than its baseline value times (1 + ``threshold``).
+
+        min_time (:obj:`float`, optional): time measurements whose baseline
+            value is smaller than this value are ignored.
+
+        min_memory (:obj:`int`, optional): memory measurements whose base-
+            line value is smaller than this value are ignored.
+
+    Returns:
+        list: the regressions found, as (key, baseline value, current value)
+            tuples sorted by key.
+    """
+    baseline_vals = flatten(baseline)
+    current_vals = flatten(current)
+
+    regressions = []  # type: t.List[t.Tuple[_TypeMetricKey, float, float]]
+
+    for key in sorted(set(baseline_vals).intersection(current_vals)):
+        base_val, cur_val = baseline_vals[key], current_vals[key]
+
+        min_val = min_memory if key[2] == "peak_memory" else min_time
+
+        if base_val >= min_val and cur_val > base_val * (1.0 + threshold):
+            regressions.append((key, base_val, cur_val))
+
+    return regressions
+
+
+def format_regressions(
+        regressions: t.Sequence[t.Tuple[_TypeMetricKey, float, float]]
+) -> str:
+    """Build a human-readable report of the regressions found."""
+    return "\n".join(
+        "{0} [{1}] {2}: {3:.6g} -> {4:.6g} (+{5:.1%})".format(
+            config, group, metric, base_val, cur_val,
+            cur_val / base_val - 1.0)
+        for (config, group, metric), base_val, cur_val in regressions)
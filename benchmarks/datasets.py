@@ -0,0 +1,109 @@
+"""Synthetic datasets used by the benchmarks.
+
+Attributes:
+    NUM_INST (:obj:`tuple` of :obj:`int`): default numbers of instances.
+
+    NUM_ATTR (:obj:`tuple` of :obj:`int`): default numbers of attributes.
+
+    NUM_CLASSES (:obj:`tuple` of :obj:`int`): default numbers of classes.
+
+    CAT_RATIOS (:obj:`tuple` of :obj:`float`): default ratios of categorical
+        attributes.
+
+    MAX_VALUES (:obj:`int`): default maximum number of values (instances
+        times attributes) of a dataset. Bigger configurations are skipped.
+"""
+import typing as t
+import itertools
+
+import numpy as np
+
+NUM_INST = (1000, 100000, 1000000)
+
+NUM_ATTR = (10, 100, 1000)
+
+NUM_CLASSES = (2, 10)
+
+CAT_RATIOS = (0.0, 0.5)
+
+MAX_VALUES = 10000000
+
+
+class DatasetConfig(t.NamedTuple):
+    """Shape of a synthetic dataset."""
+    num_inst: int
+    num_attr: int
+    num_classes: int
+    cat_ratio: float
+
+    @property
+    def key(self) -> str:
+        """Identifier of the configuration used in the benchmark reports."""
+        return "n={0},p={1},classes={2},cat={3}".format(*self)
+
+
+def iter_configs(
+        num_inst: t.Iterable[int] = NUM_INST,
+        num_attr: t.Iterable[int] = NUM_ATTR,
+        num_classes: t.Iterable[int] = NUM_CLASSES,
+        cat_ratios: t.Iterable[float] = CAT_RATIOS,
+        max_values: t.Optional[int] = MAX_VALUES,
+) -> t.Iterator[DatasetConfig]:
+    """Iterate over every combination of the dataset shape options.
+
+    Args:
+        max_values (:obj:`int`, optional): configurations with more values
+            (instances times attributes) are skipped. If :obj:`NoneType`, no
+            configuration is skipped.
+    """
+    for config in itertools.product(num_inst, num_attr, num_classes,
+                                    cat_ratios):
+        config = DatasetConfig(*config)
+
+        if (max_values is None
+                or config.num_inst * config.num_attr <= max_values):
+            yield config
+
+
+def make_dataset(
+        config: DatasetConfig,
+        num_cat_levels: int = 5,
+        random_state: t.Optional[int] = None,
+) -> t.Tuple[np.ndarray, np.ndarray, t.List[int]]:
+    """Generate a synthetic classification dataset.
+
+    The numeric attributes are normally distributed, shifted by the class
+    of each instance, and the categorical attributes are integer codes whose
+    distribution also depends on the class.
+
+    Args:
+        config (:obj:`DatasetConfig`): shape of the dataset.
+
+        num_cat_levels (:obj:`int`, optional): number of distinct values of
+            each categorical attribute.
+
+        random_state (:obj:`int`, optional): seed of the random numbers.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray, list): the independent attributes, the
+            target attribute and the indexes of the categorical attributes
+            (the last columns of the independent attributes), to be given as
+            ``cat_cols`` argument of ``MFE.fit``.
+    """
+    random_gen = np.random.RandomState(random_state)
+
+    num_cat = int(round(config.num_attr * config.cat_ratio))
+    num_num = config.num_attr - num_cat
+
+    y = random_gen.randint(config.num_classes, size=config.num_inst)
+
+    X = np.empty((config.num_inst, config.num_attr), dtype=float)
+
+    X[:, :num_num] = random_gen.standard_normal((config.num_inst, num_num))
+    X[:, :num_num] += 0.5 * y[:, np.newaxis]
+
+    X[:, num_num:] = np.mod(
+        random_gen.randint(num_cat_levels, size=(config.num_inst, num_cat))
+        + y[:, np.newaxis], num_cat_levels)
+
+    return X, y, list(range(num_num, config.num_attr))
@@ -0,0 +1,77 @@
+"""Measure the import time and the heavy modules loaded by ``pymfe``.
+
+Each measurement runs in a fresh Python interpreter, so no module is cached
+by a previous import. The report is a dictionary such as:
+
+    {
+        "import": {"time": 0.08, "heavy_modules": []},
+        "general": {"time": 0.11, "heavy_modules": []}
+    }
+
+where ``import`` measures ``import pymfe.mfe``, and ``general`` also fits
+and extracts the ``general`` metafeatures from a small numeric dataset.
+
+Attributes:
+    HEAVY_MODULES (:obj:`tuple` of :obj:`str`): third-party packages which
+        must not be loaded by these scenarios.
+"""
+import typing as t
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ("sklearn", "scipy", "pandas", "patsy")
+
+_SCENARIOS = {
+    "import": "import pymfe.mfe",
+    "general": "\n".join((
+        "import numpy as np",
+        "import pymfe.mfe",
+        "X = np.random.RandomState(0).rand(100, 5)",
+        "y = np.arange(100) % 2",
+        "mfe = pymfe.mfe.MFE(groups='general', summary='mean')",
+        "mfe.fit(X, y).extract()",
+    )),
+}
+
+_SCRIPT = """
+import json
+import sys
+import time
+
+_start = time.perf_counter()
+exec(compile({code!r}, "<benchmark>", "exec"))
+_time = time.perf_counter() - _start
+
+print(json.dumps({{
+    "time": _time,
+    "heavy_modules": sorted(
+        name for name in {heavy!r} if name in sys.modules),
+}}))
+"""
+
+
+def measure(scenario: str, repeat: int = 1) -> t.Dict[str, t.Any]:
+    """Run ``scenario`` in fresh interpreters.
+
+    Returns:
+        dict: the minimum wall time, in seconds, of every repetition, and
+            the sorted names of the heavy modules loaded.
+    """
+    script = _SCRIPT.format(code=_SCENARIOS[scenario], heavy=HEAVY_MODULES)
+    results = []
+
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", script])
+        results.append(json.loads(output.decode().strip().splitlines()[-1]))
+
+    return {
+        "time": min(res["time"] for res in results),
+        "heavy_modules": results[0]["heavy_modules"],
+    }
+
+
+def run(repeat: int = 1) -> t.Dict[str, t.Dict[str, t.Any]]:
+    """Measure every scenario."""
+    return {scenario: measure(scenario, repeat=repeat)
+            for scenario in _SCENARIOS}
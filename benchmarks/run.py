@@ -0,0 +1,171 @@
+"""Run the benchmarks and build the JSON report.
+
+The report is a dictionary with two keys: ``meta``, describing the environ-
+ment of the run, and ``results``, a list with an entry for each dataset con-
+figuration and metafeature group, such as:
+
+    {
+        "config": "n=1000,p=10,classes=2,cat=0.0",
+        "group": "statistical",
+        "fit": 0.012,
+        "extract": 0.104,
+        "peak_memory": 1843200,
+        "precompute": {"precompute_statistical_cor_cov": 0.001, ...},
+        "features": {"mean": 0.0002, ...}
+    }
+
+Times are wall times in seconds (the minimum of every repetition), and the
+peak memory is the maximum number of bytes allocated while fitting and ex-
+tracting, as traced by ``tracemalloc``.
+
+Attributes:
+    GROUPS (:obj:`tuple` of :obj:`str`): default metafeature groups.
+"""
+import typing as t
+import collections
+import datetime
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from pymfe.mfe import MFE
+from pymfe import callbacks
+from benchmarks import datasets
+
+GROUPS = (
+    "general",
+    "statistical",
+    "info-theory",
+    "model-based",
+    "landmarking",
+)
+
+
+class _MethodTimer(callbacks.MFECallback):
+    """Keep the wall time of every precomputation and feature method."""
+
+    def __init__(self) -> None:
+        self.times = collections.defaultdict(
+            dict)  # type: t.Dict[str, t.Dict[str, float]]
+
+    def on_precompute_end(self, event: callbacks.CallbackEvent) -> None:
+        self.times["precompute"][event.name] = event.wall_time
+
+    def on_feature_end(self, event: callbacks.CallbackEvent) -> None:
+        self.times["features"][event.name] = event.wall_time
+
+
+def _min_times(all_times: t.Sequence[t.Dict[str, float]]) -> t.Dict[str, float]:
+    """Get the minimum time of every method among all repetitions."""
+    return {
+        name: min(times[name] for times in all_times if name in times)
+        for name in sorted(set().union(*all_times))
+    }
+
+
+def benchmark_group(
+        X: np.ndarray,
+        y: np.ndarray,
+        cat_cols: t.Sequence[int],
+        group: str,
+        repeat: int = 1,
+        measure_memory: bool = True,
+        random_state: t.Optional[int] = None) -> t.Dict[str, t.Any]:
+    """Benchmark a single metafeature group on a single dataset.
+
+    Args:
+        repeat (:obj:`int`, optional): number of times every measurement is
+            repeated. The minimum time of all repetitions is kept.
+
+        measure_memory (:obj:`bool`, optional): if True, fit and extract once
+            more with ``tracemalloc`` enabled to measure the peak memory, so
+            the time measurements are not affected by it.
+
+    Returns:
+        dict: the measurements of the group. Check the module documentation.
+    """
+    fit_times, extract_times = [], []
+    precomp_times, feature_times = [], []
+
+    for _ in range(repeat):
+        timer = _MethodTimer()
+        model = MFE(groups=group, random_state=random_state,
+                    callbacks=[timer])
+
+        time_start = time.perf_counter()
+        model.fit(X, y, cat_cols=cat_cols, suppress_warnings=True)
+        fit_times.append(time.perf_counter() - time_start)
+
+        time_start = time.perf_counter()
+        model.extract(suppress_warnings=True)
+        extract_times.append(time.perf_counter() - time_start)
+
+        precomp_times.append(timer.times["precompute"])
+        feature_times.append(timer.times["features"])
+
+    peak_memory = None  # type: t.Optional[int]
+
+    if measure_memory:
+        tracemalloc.start()
+
+        try:
+            MFE(groups=group, random_state=random_state).fit(
+                X, y, cat_cols=cat_cols,
+                suppress_warnings=True).extract(suppress_warnings=True)
+
+            _, peak_memory = tracemalloc.get_traced_memory()
+
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "fit": min(fit_times),
+        "extract": min(extract_times),
+        "peak_memory": peak_memory,
+        "precompute": _min_times(precomp_times),
+        "features": _min_times(feature_times),
+    }
+
+
+def run(configs: t.Iterable[datasets.DatasetConfig],
+        groups: t.Sequence[str] = GROUPS,
+        repeat: int = 1,
+        measure_memory: bool = True,
+        random_state: int = 0,
+        verbose: bool = False) -> t.Dict[str, t.Any]:
+    """Run the benchmarks of every group on every dataset configuration.
+
+    Returns:
+        dict: the benchmark report. Check the module documentation.
+    """
+    results = []  # type: t.List[t.Dict[str, t.Any]]
+
+    for config in configs:
+        X, y, cat_cols = datasets.make_dataset(config,
+                                               random_state=random_state)
+
+        for group in groups:
+            if verbose:
+                print("Running {0} on {1}...".format(group, config.key))
+
+            results.append({
+                "config": config.key,
+                "group": group,
+                **benchmark_group(X, y, cat_cols, group,
+                                  repeat=repeat,
+                                  measure_memory=measure_memory,
+                                  random_state=random_state),
+            })
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
@@ -0,0 +1,348 @@
+"""A module dedicated to the persistent cache of extracted metafeatures.
+
+Every cache entry is a pickle file inside the cache directory, named after
+its key. Each entry keeps the summarized results of a single feature-ex-
+traction method for a single dataset and configuration, so extracting new
+metafeatures from a dataset only computes what is missing in the cache.
+
+The cache size is limited by evicting the least recently used entries (the
+modification time of an entry is updated every time it is read).
+
+Attributes:
+    CACHE_FILE_EXT (:obj:`str`): extension of the cache entry files.
+
+    FINGERPRINT_CHUNK_SIZE (:obj:`int`): default number of rows hashed at a
+        time while computing the fingerprint of a dataset.
+"""
+import typing as t
+import hashlib
+import pickle
+import os
+import tempfile
+
+import numpy as np
+
+import pymfe._codes as _codes
+
+CACHE_FILE_EXT = ".pkl"
+
+FINGERPRINT_CHUNK_SIZE = 65536
+
+
+def get_key(*components: t.Any) -> str:
+    """Build a cache key combining all ``components``.
+
+    Args:
+        *components: values identifying the cache entry. Arrays are combined
+            by its type, shape and raw content, and :obj:`tuple`, :obj:`list`
+            and :obj:`dict` values item by item (check ``_update_hash_key``).
+            Any other value is combined using its string representation, so
+            any value whose representation depends on its identity (e.g., an
+            object memory address) should not be used.
+
+    Returns:
+        str: hexadecimal digest of the components.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+
+    for component in components:
+        _update_hash_key(hasher, component)
+
+    return hasher.hexdigest()
+
+
+def _update_hash_key(hasher: t.Any, component: t.Any) -> None:
+    """Hash a single cache key ``component``.
+
+    Every component is tagged by its type and size, so, e.g., a :obj:`list`
+    and a :obj:`tuple` with the same items, or nested sequences with the
+    same flattened items, give distinct keys. The string representation is
+    never used for arrays, as it summarizes large arrays.
+    """
+    if isinstance(component, np.ndarray):
+        hasher.update("ndarray{0}{1}".format(
+            component.dtype.str, component.shape).encode("utf-8"))
+
+        if component.dtype.hasobject:
+            # The raw buffer of object arrays holds only pointers
+            for item in component.ravel().tolist():
+                _update_hash_key(hasher, item)
+
+        else:
+            hasher.update(memoryview(
+                np.ascontiguousarray(component)).cast("B"))
+
+    elif isinstance(component, (tuple, list)):
+        hasher.update("{0}{1}".format(type(component).__name__,
+                                      len(component)).encode("utf-8"))
+
+        for item in component:
+            _update_hash_key(hasher, item)
+
+    elif isinstance(component, dict):
+        hasher.update("dict{0}".format(len(component)).encode("utf-8"))
+
+        for key, value in sorted(component.items(),
+                                 key=lambda item: repr(item[0])):
+            _update_hash_key(hasher, key)
+            _update_hash_key(hasher, value)
+
+    else:
+        hasher.update(repr(component).encode("utf-8"))
+
+    hasher.update(b"\x00")
+
+
+def fingerprint_data(
+        X: np.ndarray,
+        y: np.ndarray,
+        attr_indexes_num: t.Sequence[int],
+        attr_indexes_cat: t.Sequence[int],
+        cat_codes: t.Optional[np.ndarray] = None,
+        chunk_size: int = FINGERPRINT_CHUNK_SIZE) -> str:
+    """Compute a deterministic content fingerprint of the fitted data.
+
+    The data is hashed by typed blocks: the numeric columns of ``X`` as con-
+    tiguous :obj:`np.float64` buffers, every categorical column of ``X`` by
+    its integer codes and its small table of distinct values (check ``_up-
+    date_hash_codes``), and ``y`` by its raw bytes or, if it has type ``ob-
+    ject``, by the string representation of each value (check ``_update_ha-
+    sh_column``). The rows are hashed in chunks, so at most a chunk of the
+    data is converted at a time, and nothing is converted if ``X`` is alre-
+    ady a C-contiguous :obj:`np.float64` array with only numeric columns.
+    Numeric columns with non-numeric values are hashed just like ``y``.
+
+    Args:
+        X (:obj:`np.ndarray`): fitted independent attributes.
+
+        y (:obj:`np.ndarray`): fitted target attribute.
+
+        attr_indexes_num (:obj:`Sequence` of :obj:`int`): numeric column in-
+            dexes of ``X``.
+
+        attr_indexes_cat (:obj:`Sequence` of :obj:`int`): categorical column
+            indexes of ``X``.
+
+        cat_codes (:obj:`np.ndarray`, optional): integer codes of the catego-
+            rical columns of ``X``, in the same order of ``attr_indexes_cat``,
+            as computed while fitting the data (check ``_codes.factorize``).
+            If :obj:`NoneType`, every categorical column is factorized here.
+
+        chunk_size (:obj:`int`, optional): number of rows hashed at a time.
+
+    Returns:
+        str: hexadecimal digest of the data.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+
+    hasher.update(repr((X.shape, tuple(attr_indexes_num),
+                        tuple(attr_indexes_cat))).encode("utf-8"))
+
+    if attr_indexes_num:
+        if len(attr_indexes_num) == X.shape[1]:
+            # Slicing rows only, so every chunk is a view of ``X``
+            col_selector = slice(None)  # type: t.Any
+
+        else:
+            col_selector = np.asarray(attr_indexes_num)
+
+        try:
+            num_hasher = hashlib.blake2b(digest_size=20)
+
+            for ind_start in range(0, X.shape[0], chunk_size):
+                chunk = X[ind_start:ind_start + chunk_size, col_selector]
+                num_hasher.update(
+                    memoryview(np.ascontiguousarray(chunk, dtype=np.float64)))
+
+            hasher.update(num_hasher.digest())
+
+        except (ValueError, TypeError):
+            # Some 'numeric' column has non-numeric values (e.g., the user
+            # set it as non-categorical), hence it is hashed by its values
+            for ind_attr in attr_indexes_num:
+                _update_hash_column(hasher, X[:, ind_attr], chunk_size)
+
+    for ind_col, ind_attr in enumerate(attr_indexes_cat):
+        if cat_codes is None:
+            codes, _ = _codes.factorize_col(X[:, ind_attr])
+
+        else:
+            codes = cat_codes[:, ind_col]
+
+        _update_hash_codes(hasher, X[:, ind_attr], codes, chunk_size)
+
+    _update_hash_column(hasher, y, chunk_size)
+
+    return hasher.hexdigest()
+
+
+def _update_hash_codes(hasher: t.Any,
+                       values: np.ndarray,
+                       codes: np.ndarray,
+                       chunk_size: int) -> None:
+    """Hash the column ``values`` by its integer ``codes``.
+
+    The codes are renumbered by the first appearance of each distinct value,
+    so the hashed bytes do not depend on how ``values`` was factorized, and
+    hashed as :obj:`np.int64` raw bytes, in chunks of ``chunk_size``. The
+    distinct values, in the same order, are hashed by ``_update_hash_column``.
+    Values equal to each other (e.g., ``1`` and ``1.0``) share a single code,
+    just like in the fitted data.
+    """
+    num_codes = int(codes.max()) + 1 if codes.size else 0
+
+    first_inds = np.full(num_codes, fill_value=-1, dtype=np.int64)
+
+    for ind_start in range(0, codes.size, chunk_size):
+        chunk = codes[ind_start:ind_start + chunk_size]
+        unseen = np.flatnonzero(first_inds[chunk] < 0)
+
+        if unseen.size:
+            new_codes, new_inds = np.unique(chunk[unseen], return_index=True)
+            first_inds[new_codes] = ind_start + unseen[new_inds]
+
+    # Codes without instances (if any) are renumbered last
+    first_inds[first_inds < 0] = codes.size
+
+    order = np.argsort(first_inds, kind="stable")
+    ranks = np.empty(num_codes, dtype=np.int64)
+    ranks[order] = np.arange(num_codes)
+
+    first_inds = first_inds[order]
+
+    hasher.update(b"codes\x00")
+    _update_hash_column(hasher, values[first_inds[first_inds < codes.size]],
+                        chunk_size)
+
+    for ind_start in range(0, codes.size, chunk_size):
+        chunk = codes[ind_start:ind_start + chunk_size]
+        hasher.update(memoryview(ranks[chunk]).cast("B"))
+
+
+def _update_hash_column(hasher: t.Any,
+                        values: np.ndarray,
+                        chunk_size: int) -> None:
+    """Hash the one-dimensional array ``values`` in chunks of ``chunk_size``.
+
+    Arrays of a fixed-size data type are hashed by its raw bytes, tagged by
+    the data type. Arrays of type ``object`` (e.g., mixing :obj:`int` and
+    :obj:`str` values) are hashed by the string representation of every
+    value, converting a single chunk at a time. The hashed bytes do not de-
+    pend on ``chunk_size``.
+    """
+    hasher.update(values.dtype.str.encode("utf-8"))
+    hasher.update(b"\x00")
+
+    for ind_start in range(0, values.size, chunk_size):
+        chunk = values[ind_start:ind_start + chunk_size]
+
+        if values.dtype.hasobject:
+            hasher.update("".join("{0!r}\x00".format(val)
+                                  for val in chunk.tolist()).encode("utf-8"))
+
+        else:
+            hasher.update(memoryview(np.ascontiguousarray(chunk)).cast("B"))
+
+
+def _get_entry_path(cache_dir: str, key: str) -> str:
+    """Path of the cache entry file with the given ``key``."""
+    return os.path.join(cache_dir, key + CACHE_FILE_EXT)
+
+
+def load(cache_dir: str, key: str) -> t.Optional[t.Any]:
+    """Load a cache entry.
+
+    Args:
+        cache_dir (:obj:`str`): path of the cache directory.
+
+        key (:obj:`str`): key of the cache entry.
+
+    Returns:
+        any: the cached value. If there is no entry with the given ``key``
+            (or the entry is not readable), return :obj:`NoneType`.
+    """
+    entry_path = _get_entry_path(cache_dir, key)
+
+    try:
+        with open(entry_path, "rb") as entry_file:
+            value = pickle.load(entry_file)
+
+        # Mark the entry as recently used for the eviction policy
+        os.utime(entry_path)
+
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    return value
+
+
+def store(cache_dir: str,
+          key: str,
+          value: t.Any,
+          max_size: t.Optional[int] = None) -> None:
+    """Store a cache entry, evicting the old entries if needed.
+
+    The entry is first written to a temporary file and then moved to its
+    path, so concurrent readers never find partially written entries.
+
+    Args:
+        cache_dir (:obj:`str`): path of the cache directory. It is created if
+            it does not exist.
+
+        key (:obj:`str`): key of the cache entry.
+
+        value (any): picklable value to be stored.
+
+        max_size (:obj:`int`, optional): maximum size, in bytes, of all cache
+            entries together. Check ``evict`` function for more information.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    file_desc, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+
+    try:
+        with os.fdopen(file_desc, "wb") as entry_file:
+            pickle.dump(value, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, _get_entry_path(cache_dir, key))
+
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    if max_size is not None:
+        evict(cache_dir, max_size)
+
+
+def evict(cache_dir: str, max_size: int) -> None:
+    """Remove the least recently used entries until the cache fits in size.
+
+    Args:
+        cache_dir (:obj:`str`): path of the cache directory.
+
+        max_size (:obj:`int`): maximum size, in bytes, of all cache entries
+            together.
+    """
+    entries = []  # type: t.List[t.Tuple[float, int, str]]
+
+    with os.scandir(cache_dir) as dir_it:
+        for entry in dir_it:
+            if entry.is_file() and entry.name.endswith(CACHE_FILE_EXT):
+                entry_stat = entry.stat()
+                entries.append(
+                    (entry_stat.st_mtime, entry_stat.st_size, entry.path))
+
+    total_size = sum(entry_size for _, entry_size, _ in entries)
+
+    for _, entry_size, entry_path in sorted(entries):
+        if total_size <= max_size:
+            break
+
+        try:
+            os.remove(entry_path)
+
+        except FileNotFoundError:
+            # Already removed by some concurrent process
+            pass
+
+        total_size -= entry_size
@@ -0,0 +1,289 @@
+"""A module dedicated to the integer codes of categorical attributes.
+
+While fitting data, every categorical (and discretized numeric) column is
+factorized once into integer codes ``0, ..., k - 1``, where ``k`` is the
+number of distinct values of the column (its cardinality). The codes of all
+columns are kept in a single array with the smallest integer type able to
+hold them (:obj:`np.int8`, :obj:`np.int16` or :obj:`np.int32`), so the fre-
+quencies of any column are counted with ``np.bincount`` instead of sorting
+its values again.
+"""
+import typing as t
+
+import numpy as np
+
+_CODE_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _fits_bincount(min_val: int, max_val: int, size: int) -> bool:
+    """Checks if integers in [min_val, max_val] are cheap to ``np.bincount``.
+
+    Avoids allocating a huge array of counts for a few integers with a wide
+    range of values (e.g., identifiers).
+    """
+    return int(max_val) - int(min_val) <= 4 * size + 1024
+
+
+def code_dtype(max_cardinality: int) -> np.dtype:
+    """Get the smallest integer type for codes up to ``max_cardinality``."""
+    for dtype in _CODE_DTYPES:
+        if max_cardinality <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    raise ValueError("Too many distinct values ({0}) to be factorized."
+                     .format(max_cardinality))
+
+
+def _compact_codes(values: np.ndarray) -> t.Tuple[np.ndarray, int]:
+    """Renumber the non-negative integers ``values`` to consecutive codes.
+
+    The relative order of the values is kept, so the codes are the same as
+    the ones given by ``np.unique``, but counted in linear time.
+    """
+    present = np.bincount(values) > 0
+    new_codes = np.cumsum(present) - 1
+
+    return new_codes[values], int(new_codes[-1]) + 1
+
+
+def _factorize_by_hash(col: np.ndarray) -> t.Tuple[np.ndarray, int]:
+    """Factorize ``col`` with values that can not be compared to each other.
+
+    The distinct values are still sorted whenever possible. Otherwise, they
+    are numbered by its first appearance.
+    """
+    inds = {}  # type: t.Dict[t.Any, int]
+    col_inds = np.fromiter((inds.setdefault(val, len(inds))
+                            for val in col.tolist()),
+                           dtype=np.int64, count=col.size)
+
+    try:
+        sorted_vals = sorted(inds)
+
+    except TypeError:
+        return col_inds, len(inds)
+
+    new_codes = np.empty(len(inds), dtype=np.int64)
+    new_codes[[inds[val] for val in sorted_vals]] = np.arange(len(inds))
+
+    return new_codes[col_inds], len(inds)
+
+
+def factorize_col(col: np.ndarray) -> t.Tuple[np.ndarray, int]:
+    """Factorize a single column ``col`` into integer codes.
+
+    Integer (and boolean) columns with a small range of values, such as the
+    discretized numeric attributes or the codes of a :obj:`pd.Categorical`,
+    are factorized in linear time. Every other column is factorized with
+    ``np.unique``, so the codes follow the sorted order of its values.
+
+    Returns:
+        tuple(np.ndarray, int): the code of each value of ``col`` and the
+            number of distinct values (the cardinality of ``col``).
+    """
+    if col.size == 0:
+        return np.zeros(0, dtype=np.int64), 0
+
+    if col.dtype.kind == "b":
+        col = col.astype(np.int64)
+
+    if col.dtype.kind in "iu":
+        min_val = int(col.min())
+
+        if _fits_bincount(min_val, col.max(), col.size):
+            return _compact_codes(col.astype(np.int64) - min_val)
+
+    try:
+        uniques, codes = np.unique(col, return_inverse=True)
+
+    except TypeError:
+        return _factorize_by_hash(col)
+
+    return codes.ravel(), uniques.size
+
+
+def factorize(
+        *blocks: t.Optional[np.ndarray]) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Factorize every column of the two-dimensional arrays ``blocks``.
+
+    Args:
+        *blocks (:obj:`np.ndarray`, optional): two-dimensional arrays with the
+            same number of rows. Arrays with :obj:`NoneType` value are ignor-
+            ed.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): the codes of the columns of every ar-
+            ray in ``blocks``, side by side, with the smallest integer type
+            which holds them (check ``code_dtype``), and the cardinality of
+            each column.
+    """
+    cols = [
+        block[:, ind] for block in blocks if block is not None
+        for ind in range(block.shape[1])
+    ]
+
+    num_inst = next((block.shape[0] for block in blocks if block is not None),
+                    0)
+
+    col_codes, cardinalities = [], []
+
+    for col in cols:
+        codes, cardinality = factorize_col(col)
+        col_codes.append(codes)
+        cardinalities.append(cardinality)
+
+    cat_cardinalities = np.array(cardinalities, dtype=int)
+
+    codes = np.empty((num_inst, len(cols)),
+                     dtype=code_dtype(max(cardinalities, default=0)))
+
+    for ind, col in enumerate(col_codes):
+        codes[:, ind] = col
+
+    return codes, cat_cardinalities
+
+
+def as_codes(
+        data: np.ndarray,
+        cardinalities: t.Optional[np.ndarray] = None,
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Get the codes of ``data`` and its cardinalities.
+
+    ``data`` is factorized (check ``factorize``) only if it is not already
+    made of codes with the given ``cardinalities``.
+    """
+    if (cardinalities is not None and len(cardinalities) == data.shape[1]
+            and is_codes(data)):
+        return data, cardinalities
+
+    return factorize(data)
+
+
+def is_codes(values: np.ndarray) -> bool:
+    """Checks if ``values`` may be counted with ``np.bincount``."""
+    if values.dtype.kind not in "iu":
+        return False
+
+    if values.size == 0:
+        return True
+
+    return values.min() >= 0 and _fits_bincount(0, values.max(), values.size)
+
+
+def value_counts(values: np.ndarray) -> np.ndarray:
+    """Absolute frequency of each distinct value in ``values``.
+
+    If ``values`` are integer codes (check ``is_codes``), the frequencies are
+    counted with ``np.bincount``. Otherwise, they are the same of ``np.uni-
+    que``, in the sorted order of the distinct values.
+    """
+    if is_codes(values):
+        freqs = np.bincount(values)
+        return freqs[freqs > 0]
+
+    _, freqs = np.unique(values, return_counts=True)
+
+    return freqs
+
+
+def count_distinct(values: np.ndarray) -> int:
+    """Number of distinct values in ``values``, as ``np.unique`` counts.
+
+    Integer codes (check ``is_codes``) are counted with ``np.bincount``, and
+    :obj:`object` values with a :obj:`set`, whenever they are hashable. All
+    :obj:`np.nan` values count as a single distinct value.
+    """
+    if is_codes(values):
+        return int(np.count_nonzero(np.bincount(values)))
+
+    if values.dtype.kind in "fc":
+        nan_mask = np.isnan(values)
+
+        if nan_mask.any():
+            return np.unique(values[~nan_mask]).size + 1
+
+    if values.dtype.kind == "O":
+        try:
+            return len(set(values.tolist()))
+
+        except TypeError:
+            # Unhashable values
+            pass
+
+    return np.unique(values).size
+
+
+def contingency_table(codes_x: np.ndarray, codes_y: np.ndarray,
+                      card_x: int, card_y: int) -> np.ndarray:
+    """Joint absolute frequencies of the codes ``codes_x`` and ``codes_y``.
+
+    Returns:
+        np.ndarray: table of shape (``card_x``, ``card_y``) whose cell (i, j)
+            is the number of instances with codes ``i`` in ``codes_x`` and
+            ``j`` in ``codes_y``, counted by a single ``np.bincount`` over
+            ``codes_x * card_y + codes_y``.
+    """
+    joint_codes = codes_x.astype(np.int64) * card_y + codes_y
+
+    return np.bincount(joint_codes, minlength=card_x * card_y).reshape(
+        card_x, card_y)
+
+
+def contingency_tables(codes: np.ndarray,
+                       cardinalities: np.ndarray,
+                       codes_y: np.ndarray,
+                       card_y: int) -> t.List[np.ndarray]:
+    """Contingency table between each column of ``codes`` and ``codes_y``.
+
+    The tables of all columns are laid side by side in a single array of
+    counts, so they are counted by a single ``np.bincount`` call (check
+    ``contingency_table``).
+
+    Args:
+        codes (:obj:`np.ndarray`): two-dimensional array of codes.
+
+        cardinalities (:obj:`np.ndarray`): number of distinct codes of each
+            column of ``codes``.
+
+        codes_y (:obj:`np.ndarray`): one-dimensional array of codes with the
+            same number of rows of ``codes`` (e.g., the codes of the classes).
+
+        card_y (:obj:`int`): number of distinct codes of ``codes_y``.
+
+    Returns:
+        list: a table of shape (``cardinalities[i]``, ``card_y``) for each
+            column ``i`` of ``codes``. The tables are views of the same ar-
+            ray of counts.
+    """
+    offsets = np.concatenate(
+        ([0], np.cumsum(np.asarray(cardinalities, dtype=np.int64) * card_y)))
+
+    joint_codes = (codes.astype(np.int64) * card_y +
+                   codes_y.reshape(-1, 1) + offsets[:-1])
+
+    counts = np.bincount(joint_codes.ravel(), minlength=offsets[-1])
+
+    return [
+        counts[offsets[ind]:offsets[ind + 1]].reshape(-1, card_y)
+        for ind in range(codes.shape[1])
+    ]
+
+
+def one_hot(codes: np.ndarray, cardinalities: np.ndarray) -> np.ndarray:
+    """Binarize the columns of ``codes`` with a model matrix without intercept.
+
+    The first column has one binary attribute per distinct code. As in
+    ``patsy`` formulas with no intercept term, every other column drops its
+    first code to keep the model matrix full rank.
+    """
+    num_inst, num_col = codes.shape
+    dummies = []
+
+    for ind in range(num_col):
+        col_dummies = np.zeros((num_inst, int(cardinalities[ind])),
+                               dtype=float)
+        col_dummies[np.arange(num_inst), codes[:, ind]] = 1.0
+
+        dummies.append(col_dummies if ind == 0 else col_dummies[:, 1:])
+
+    return np.hstack(dummies)
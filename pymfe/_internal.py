@@ -12,9 +12,17 @@ Attributes:
     VALID_SUMMARY (:obj:``tuple`` of :obj:``str``): Supported summary
         functions to combine metafeature values.
 
-    VALID_MFECLASSES (:obj:``tuple`` of Classes): Metafeature extractors
-        predefined classes, where to perform the search of metafeature-ex-
-        traction methods.
+    VALID_MFECLASSES (:obj:``tuple`` of :obj:``str``): import paths (in the
+        form ``module:class``) of the metafeature extractors predefined clas-
+        ses, where to perform the search of metafeature-extraction methods,
+        in the same order of ``VALID_GROUPS``. Each class (and the packages
+        it depends on) is only imported when its group is first used. Check
+        ``get_mfe_class`` function.
+
+    MTD_REGISTRY (:obj:``Mapping``): process-wide registry of the metafea-
+        ture-extraction and precomputation methods of each group, built on
+        demand, the first time each group is used. Check ``get_registry``
+        function.
 
     VALID_TIMEOPT (:obj:``tuple`` of :obj:``str``): valid options for time
         measurements while extracting metafeatures.
@@ -22,6 +30,12 @@ Attributes:
     VALID_RESCALE (:obj:``tuple`` of :obj:``str``): valid options for res-
         caling numeric data while fitting dataset.
 
+    VALID_PARALLEL_BACKEND (:obj:``tuple`` of :obj:``str``): valid options
+        for the pool of workers used in the parallel metafeature extraction.
+
+    VALID_DTYPE (:obj:``tuple`` of :obj:``str``): valid floating point types
+        of the fitted numeric data.
+
     MTF_PREFIX (:obj:``str``): prefix of metafeature-extraction method
         names for classes in ``VALID_MFECLASSES``. For example, the metafeature
         called ``inst_nr`` is implemented in the method named ``[MTF_PREFIX]_-
@@ -50,22 +64,22 @@ Attributes:
 """
 import typing as t
 import inspect
+import types
 import collections
+import collections.abc
+import threading
 import warnings
 import time
 import sys
+import os
+import concurrent.futures
 
 import numpy as np
-import sklearn.preprocessing
-import patsy
 
 import pymfe._summary as _summary
-import pymfe.general as general
-import pymfe.statistical as statistical
-import pymfe.info_theory as info_theory
-import pymfe.landmarking as landmarking
-import pymfe.model_based as model_based
-import pymfe.scoring as scoring
+import pymfe._codes as _codes
+import pymfe._lazy as _lazy
+import pymfe.callbacks as _callbacks
 
 VALID_VALUE_PREFIX = "VALID_"
 
@@ -80,12 +94,12 @@ VALID_GROUPS = (
 VALID_SUMMARY = (*_summary.SUMMARY_METHODS, )  # type: t.Tuple[str, ...]
 
 VALID_MFECLASSES = (
-    landmarking.MFELandmarking,
-    general.MFEGeneral,
-    statistical.MFEStatistical,
-    model_based.MFEModelBased,
-    info_theory.MFEInfoTheory,
-)  # type: t.Tuple
+    "pymfe.landmarking:MFELandmarking",
+    "pymfe.general:MFEGeneral",
+    "pymfe.statistical:MFEStatistical",
+    "pymfe.model_based:MFEModelBased",
+    "pymfe.info_theory:MFEInfoTheory",
+)  # type: t.Tuple[str, ...]
 
 VALID_TIMEOPT = (
     "avg",
@@ -95,17 +109,36 @@ VALID_TIMEOPT = (
 )
 
 _RESCALE_SCALERS = {
-    "standard": sklearn.preprocessing.StandardScaler,
-    "min-max": sklearn.preprocessing.MinMaxScaler,
-    "robust": sklearn.preprocessing.RobustScaler,
+    "standard": "sklearn.preprocessing:StandardScaler",
+    "min-max": "sklearn.preprocessing:MinMaxScaler",
+    "robust": "sklearn.preprocessing:RobustScaler",
 }
 
 VALID_RESCALE = (*_RESCALE_SCALERS, )
 
+VALID_PARALLEL_BACKEND = (
+    "auto",
+    "process",
+    "thread",
+)
+
+VALID_DTYPE = (
+    "float32",
+    "float64",
+)
+
 TIMEOPT_AVG_PREFIX = "avg"
 
 TIMEOPT_SUMMARY_SUFFIX = "summ"
 
+_VALID_SCORING = {
+    "accuracy": "pymfe.scoring:accuracy",
+    "balanced-accuracy": "pymfe.scoring:balanced_accuracy",
+    "f1": "pymfe.scoring:f1",
+    "kappa": "pymfe.scoring:kappa",
+    "auc": "pymfe.scoring:auc",
+}
+
 MTF_PREFIX = "ft_"
 
 PRECOMPUTE_PREFIX = "precompute_"
@@ -116,6 +149,10 @@ TypeMtdTuple = t.Tuple[str, t.Callable[[], t.Any]]
 TypeExtMtdTuple = t.Tuple[str, t.Callable[[], t.Any], t.Sequence]
 """Type annotation which extends TypeMtdTuple with extra field (``Args``)"""
 
+TypeBindingPlan = t.Tuple[t.Dict[str, t.Any], t.Tuple[str, ...],
+                          t.Tuple[str, ...]]
+"""Type annotation of a method argument-binding plan (``compile_mtd_kwargs``)"""
+
 _TYPE_NUMERIC = (
     int,
     float,
@@ -218,6 +255,25 @@ def _check_values_in_group(value: t.Union[str, t.Iterable[str]],
     return tuple(in_group), tuple(not_in_group)
 
 
+def get_mfe_class(group: str) -> t.Any:
+    """Get the metafeature extractor class of ``group``, importing it.
+
+    Args:
+        group (:obj:`str`): a group in ``VALID_GROUPS``.
+
+    Returns:
+        Class: the metafeature extractor class of ``group``.
+
+    Raises:
+        ValueError: if ``group`` is not in ``VALID_GROUPS``.
+    """
+    if group not in VALID_GROUPS:
+        raise ValueError('Unknown group "{0}". Please select values in '
+                         "{1}.".format(group, VALID_GROUPS))
+
+    return _lazy.import_object(VALID_MFECLASSES[VALID_GROUPS.index(group)])
+
+
 def _get_prefixed_mtds_from_class(class_obj: t.Any,
                                   prefix: str) -> t.List[TypeMtdTuple]:
     """Get all class methods from ``class_obj`` prefixed with ``prefix``.
@@ -247,6 +303,73 @@ def _get_prefixed_mtds_from_class(class_obj: t.Any,
     return feat_mtd_list
 
 
+_MTD_REGISTRY = {}  # type: t.Dict[str, t.Mapping[str, t.Tuple]]
+_MTD_REGISTRY_INFO = {}  # type: t.Dict[t.Callable, t.Tuple]
+_MTD_REGISTRY_LOCK = threading.Lock()
+
+MTD_REGISTRY = types.MappingProxyType(_MTD_REGISTRY)
+
+
+def get_registry(group: str) -> t.Mapping[str, t.Tuple[TypeExtMtdTuple, ...]]:
+    """Get the registered methods of ``group``, building its registry once.
+
+    The class of ``group`` is walked with ``inspect`` only the first time
+    this function is called with it, in the current process. The result is
+    immutable and shared by every ``MFE`` instance.
+
+    Args:
+        group (:obj:`str`): a group in ``VALID_GROUPS``.
+
+    Returns:
+        mapping: immutable mapping from each prefix (``MTF_PREFIX`` and ``PRE-
+            COMPUTE_PREFIX``) to a tuple of (`mtd_name`, `mtd_callable`, `mtd-
+            _args`) tuples of the methods of ``group`` with that prefix.
+
+    Raises:
+        ValueError: if ``group`` is not in ``VALID_GROUPS``.
+    """
+    registry = _MTD_REGISTRY.get(group)
+
+    if registry is not None:
+        return registry
+
+    mfe_class = get_mfe_class(group)
+
+    with _MTD_REGISTRY_LOCK:
+        registry = _MTD_REGISTRY.get(group)
+
+        if registry is None:
+            registry = types.MappingProxyType({
+                prefix: tuple(
+                    (mtd_name, mtd_callable, _extract_mtd_args(mtd_callable))
+                    for mtd_name, mtd_callable in
+                    _get_prefixed_mtds_from_class(mfe_class, prefix))
+                for prefix in (MTF_PREFIX, PRECOMPUTE_PREFIX)
+            })
+
+            for mtd_tuples in registry.values():
+                for _, mtd_callable, mtd_args in mtd_tuples:
+                    _MTD_REGISTRY_INFO[mtd_callable] = (group, mtd_args)
+
+            _MTD_REGISTRY[group] = registry
+
+    return registry
+
+
+def get_mtd_args(mtd_callable: t.Callable) -> t.Tuple[str, ...]:
+    """Get the argument names of ``mtd_callable``.
+
+    The arguments of registered methods (check ``get_registry``) are not
+    extracted again. Any other callable is inspected.
+    """
+    mtd_info = _MTD_REGISTRY_INFO.get(mtd_callable)
+
+    if mtd_info is not None:
+        return mtd_info[1]
+
+    return _extract_mtd_args(mtd_callable)
+
+
 def _get_all_prefixed_mtds(
         prefix: str,
         groups: t.Tuple[str, ...],
@@ -293,11 +416,11 @@ def _get_all_prefixed_mtds(
         return {"methods": tuple(), "groups": tuple()}
 
     methods_by_group = {
-        ft_type_id: _get_prefixed_mtds_from_class(
-            class_obj=mfe_class,
-            prefix=prefix)
+        ft_type_id: tuple(
+            (mtd_name, mtd_callable)
+            for mtd_name, mtd_callable, _ in get_registry(ft_type_id)[prefix])
 
-        for ft_type_id, mfe_class in zip(VALID_GROUPS, VALID_MFECLASSES)
+        for ft_type_id in VALID_GROUPS
         if ft_type_id in groups
     }
 
@@ -306,7 +429,7 @@ def _get_all_prefixed_mtds(
 
     for group_name in methods_by_group:
         group_mtds = methods_by_group[group_name]
-        gathered_methods += group_mtds
+        gathered_methods.extend(group_mtds)
 
         if update_groups_by:
             group_mtds_names = {
@@ -366,6 +489,36 @@ def _extract_mtd_args(ft_mtd_callable: t.Callable) -> t.Tuple[str, ...]:
     return mtd_callable_args
 
 
+def is_thread_friendly(mtd_name: str, mtd_callable: t.Callable) -> bool:
+    """Checks if a feature-extraction method is hinted to run within threads.
+
+    The hint is given by the ``THREAD_FRIENDLY_MTDS`` attribute of the class
+    in ``VALID_MFECLASSES`` which the method belongs to. Methods from classes
+    without this attribute are assumed to not be thread-friendly.
+
+    Args:
+        mtd_name (:obj:`str`): name of the feature-extraction method.
+
+        mtd_callable (:obj:`callable`): callable of the feature-extraction me-
+            thod, expected to be a class method.
+
+    Returns:
+        bool: True if ``mtd_name`` is listed as thread-friendly in its class.
+    """
+    mfe_class = getattr(mtd_callable, "__self__", None)
+    return mtd_name in getattr(mfe_class, "THREAD_FRIENDLY_MTDS", tuple())
+
+
+def returns_array(mtd_callable: t.Callable) -> bool:
+    """Checks if a feature-extraction method is annotated to return an array.
+
+    The feature values returned by these methods are expected to be summa-
+    rized, while any other return value is kept as a single value.
+    """
+    return_type = inspect.signature(mtd_callable).return_annotation
+    return return_type is np.ndarray
+
+
 def summarize(
         features: t.Union[np.ndarray, t.Sequence],
         callable_sum: t.Callable,
@@ -400,18 +553,108 @@ def summarize(
         AttributeError: if ``callable_sum`` is invalid.
         TypeError: if ``features``  is not a sequence.
     """
+    processed_feat = clean_feature_values(features, remove_nan=remove_nan)
+
+    if callable_args is None:
+        callable_args = {}
+
+    try:
+        metafeature = callable_sum(processed_feat, **callable_args)
+
+    except (TypeError, ValueError, ZeroDivisionError):
+        metafeature = np.nan
+
+    return metafeature
+
+
+def clean_feature_values(features: t.Union[np.ndarray, t.Sequence],
+                         remove_nan: bool = True) -> np.ndarray:
+    """Get ``features`` as an array ready to be summarized.
+
+    Args:
+        features (:obj:`Sequence` of numerics): values to summarize.
+
+        remove_nan (:obj:`bool`, optional): if True, remove all elements of
+            ``features`` which are not numeric (check ``isnumeric``), and
+            cast the remaining ones to :obj:`np.float32`. If ``features``
+            (either an array or a sequence) is converted to an array of a
+            numeric type, its values are not checked element by element.
+
+    Returns:
+        np.ndarray: the cleaned values.
+    """
     processed_feat = np.array(features)
 
     if remove_nan:
-        numeric_vals = list(map(isnumeric, features))
-        processed_feat = processed_feat[numeric_vals]
+        # Only arrays of objects (e.g., with None or strings) may hold non-
+        # numeric values
+        is_numeric_array = (processed_feat.dtype.kind in "biuf"
+                            and (processed_feat.ndim == 1
+                                 or np.prod(processed_feat.shape[1:]) > 0))
+
+        if not is_numeric_array:
+            numeric_vals = list(map(isnumeric, features))
+            processed_feat = processed_feat[numeric_vals]
+
         processed_feat = processed_feat.astype(np.float32)
 
-    if callable_args is None:
-        callable_args = {}
+    return processed_feat
+
+
+def as_value_array(values: t.Union[np.ndarray, t.Sequence]) -> np.ndarray:
+    """Get metafeature values as a one-dimensional array.
 
+    Args:
+        values (:obj:`Sequence`): values returned by a summary function, or
+            a sequence with a single non-summarized value.
+
+    Returns:
+        np.ndarray: a flattened :obj:`np.float64` array if ``values`` is an
+            array of a numeric type, or a sequence of numerics only (check
+            ``isnumeric``). Otherwise (e.g., non-summarized sequences), an
+            array of objects holding each value as it is.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "biuf":
+            return values.astype(np.float64).ravel()
+
+        return values.astype(object).ravel()
+
+    if all(isinstance(val, _TYPE_NUMERIC) for val in values):
+        return np.array(values, dtype=np.float64)
+
+    value_arr = np.empty(len(values), dtype=object)
+
+    for ind, val in enumerate(values):
+        value_arr[ind] = val
+
+    return value_arr
+
+
+def summarize_stats(
+        sum_stats: _summary.SummaryStats,
+        sm_mtd_name: str,
+        callable_sum: t.Callable,
+        callable_args: t.Optional[t.Dict[str, t.Any]] = None,
+        ) -> t.Union[t.Sequence, TypeNumeric]:
+    """Returns the values of ``sum_stats`` summarized by ``sm_mtd_name``.
+
+    Unlike ``summarize``, the values are cleaned only once (check ``clean-
+    _feature_values``) for every summary function, and the intermediate va-
+    lues of ``sum_stats`` are shared by them (check ``_summary.call_summa-
+    ry``).
+
+    Returns:
+        float: value of summarized feature values, if possible. May return
+            :obj:`np.nan` if summary function call invokes TypeError, Value-
+            Error or ZeroDivisionError.
+    """
     try:
-        metafeature = callable_sum(processed_feat, **callable_args)
+        metafeature = _summary.call_summary(
+            stats=sum_stats,
+            summary_name=sm_mtd_name,
+            summary_callable=callable_sum,
+            summary_args=callable_args)
 
     except (TypeError, ValueError, ZeroDivisionError):
         metafeature = np.nan
@@ -419,11 +662,72 @@ def summarize(
     return metafeature
 
 
+def get_mtd_group(mtd_callable: t.Callable) -> t.Optional[str]:
+    """Get the metafeature group which ``mtd_callable`` belongs to, if any."""
+    mtd_info = _MTD_REGISTRY_INFO.get(mtd_callable)
+
+    if mtd_info is not None:
+        return mtd_info[0]
+
+    mfe_class = getattr(mtd_callable, "__self__", None)
+
+    class_path = "{0}:{1}".format(
+        getattr(mfe_class, "__module__", None),
+        getattr(mfe_class, "__qualname__", None))
+
+    if class_path in VALID_MFECLASSES:
+        return VALID_GROUPS[VALID_MFECLASSES.index(class_path)]
+
+    return None
+
+
+def _get_feat_value_or_error(
+        mtd_name: str,
+        mtd_args: t.Dict[str, t.Any],
+        mtd_callable: t.Callable,
+        suppress_warnings: bool = False,
+) -> t.Tuple[t.Any, t.Optional[Exception]]:
+    """Same as ``get_feat_value``, also returning the error handled, if any."""
+    try:
+        return mtd_callable(**mtd_args), None
+
+    except (TypeError, ValueError, ZeroDivisionError) as type_e:
+        if not suppress_warnings:
+            warnings.warn(
+                "Error extracting {0}: \n{1}.\nWill set it "
+                "as 'np.nan' for all summary functions.".format(
+                    mtd_name, repr(type_e)), RuntimeWarning)
+
+        return np.nan, type_e
+
+
+def timeit_feat_value(
+        mtd_name: str,
+        mtd_args: t.Dict[str, t.Any],
+        mtd_callable: t.Callable,
+        suppress_warnings: bool = False,
+) -> t.Tuple[t.Any, float, float, t.Optional[Exception]]:
+    """Call ``get_feat_value`` measuring both its wall and CPU times.
+
+    Returns:
+        tuple(any, float, float, Exception): the return value of ``get_feat-
+            _value``, the wall time and the CPU time (of the current process)
+            elapsed, and the error handled by it, if any.
+    """
+    t_start, t_cpu_start = time.time(), time.process_time()
+
+    features, error = _get_feat_value_or_error(mtd_name, mtd_args,
+                                               mtd_callable, suppress_warnings)
+
+    return (features, time.time() - t_start,
+            time.process_time() - t_cpu_start, error)
+
+
 def get_feat_value(
         mtd_name: str,
         mtd_args: t.Dict[str, t.Any],
         mtd_callable: t.Callable,
-        suppress_warnings: bool = False) -> t.Union[TypeNumeric, np.ndarray]:
+        suppress_warnings: bool = False) -> t.Any:
     """Extract features from ``mtd_callable`` with ``mtd_args`` as args.
 
     Args:
@@ -449,18 +753,8 @@ def get_feat_value(
     Raises:
         AttributeError: if ``mtd_callable`` is not valid.
     """
-
-    try:
-        features = mtd_callable(**mtd_args)
-
-    except (TypeError, ValueError, ZeroDivisionError) as type_e:
-        if not suppress_warnings:
-            warnings.warn(
-                "Error extracting {0}: \n{1}.\nWill set it "
-                "as 'np.nan' for all summary functions.".format(
-                    mtd_name, repr(type_e)), RuntimeWarning)
-
-        features = np.nan
+    features, _ = _get_feat_value_or_error(mtd_name, mtd_args, mtd_callable,
+                                           suppress_warnings)
 
     return features
 
@@ -469,7 +763,7 @@ def build_mtd_kwargs(mtd_name: str,
                      mtd_args: t.Iterable[str],
                      inner_custom_args: t.Optional[t.Dict[str, t.Any]] = None,
                      user_custom_args: t.Optional[t.Dict[str, t.Any]] = None,
-                     precomp_args: t.Optional[t.Dict[str, t.Any]] = None,
+                     precomp_args: t.Optional[t.Mapping[str, t.Any]] = None,
                      suppress_warnings: bool = False) -> t.Dict[str, t.Any]:
     """Build a ``kwargs`` (:obj:`dict`) for a feature-extraction :obj:`callable`.
 
@@ -491,9 +785,11 @@ def build_mtd_kwargs(mtd_name: str,
             ature. The name of the arguments must be verified in its correspon-
             dent method documentation.
 
-        precomp_args (:obj:`dict`, optional): precomputed cached arguments whi-
-            ch may be used for the feature-extraction method to speed up its
-            calculations.
+        precomp_args (:obj:`Mapping`, optional): precomputed cached argu-
+            ments which may be used for the feature-extraction method to speed
+            up its calculations. Only the values of arguments of the callable
+            are retrieved, so lazy mappings (e.g. :obj:`LazyPrecompArgs`) eva-
+            luate only what the callable needs.
 
         suppress_warnings(:obj:`bool`, optional): if True, do not show any war-
             nings about unknown callable parameters.
@@ -503,39 +799,145 @@ def build_mtd_kwargs(mtd_name: str,
             format is {``argument_name``: value}.
     """
 
-    if user_custom_args is None:
-        user_custom_args = {}
+    binding_plan = compile_mtd_kwargs(
+        mtd_args=mtd_args,
+        inner_custom_args=inner_custom_args,
+        precomp_args=precomp_args)
+
+    if not suppress_warnings:
+        check_unknown_args(mtd_name=mtd_name,
+                           mtd_args=mtd_args,
+                           user_custom_args=user_custom_args)
+
+    return dict(
+        bind_mtd_kwargs(binding_plan=binding_plan,
+                        user_custom_args=user_custom_args,
+                        inner_custom_args=inner_custom_args,
+                        precomp_args=precomp_args))
 
+
+def compile_mtd_kwargs(
+        mtd_args: t.Iterable[str],
+        inner_custom_args: t.Optional[t.Dict[str, t.Any]] = None,
+        precomp_args: t.Optional[t.Mapping[str, t.Any]] = None,
+        ) -> TypeBindingPlan:
+    """Compile the argument-binding plan of a :obj:`callable`.
+
+    The plan resolves, only once, which source gives each argument of the
+    callable, with the same precedence of ``build_mtd_kwargs`` (precomputed
+    values, inner and, finally, user custom arguments). It is later turned
+    into a ready-to-use ``kwargs`` by ``bind_mtd_kwargs``.
+
+    Args:
+        mtd_args (:obj:`iterable` of :obj:`str`): name of all arguments of
+            the callable.
+
+        inner_custom_args (:obj:`dict`, optional): check ``build_mtd_kwargs``.
+
+        precomp_args (:obj:`Mapping`, optional): check ``build_mtd_kwargs``.
+            Values of a :obj:`LazyPrecompArgs` are not evaluated here.
+
+    Returns:
+        tuple(dict, tuple, tuple): the arguments already bound to its pre-
+            computed or inner custom values; the arguments which may be gi-
+            ven by a :obj:`LazyPrecompArgs`, evaluated only when bound; and
+            the arguments which may only be given by user custom arguments.
+    """
     if inner_custom_args is None:
         inner_custom_args = {}
 
     if precomp_args is None:
         precomp_args = {}
 
-    combined_args = {
-        **user_custom_args,
-        **inner_custom_args,
-        **precomp_args,
-    }
+    lazy_precomp = None  # type: t.Optional[LazyPrecompArgs]
 
-    callable_args = {
-        custom_arg: combined_args[custom_arg]
-        for custom_arg in combined_args if custom_arg in mtd_args
-    }
+    if isinstance(precomp_args, LazyPrecompArgs):
+        lazy_precomp = precomp_args
 
-    if not suppress_warnings:
-        unknown_arg_set = (unknown_arg
-                           for unknown_arg in user_custom_args.keys()
-                           if unknown_arg not in mtd_args
-                           )  # type: t.Generator[str, None, None]
+    bound_args = {}  # type: t.Dict[str, t.Any]
+    lazy_args = []  # type: t.List[str]
+    user_args = []  # type: t.List[str]
+
+    for custom_arg in mtd_args:
+        if lazy_precomp is not None and lazy_precomp.may_contain(custom_arg):
+            lazy_args.append(custom_arg)
+
+        elif lazy_precomp is None and custom_arg in precomp_args:
+            bound_args[custom_arg] = precomp_args[custom_arg]
 
-        for unknown_arg in unknown_arg_set:
+        elif custom_arg in inner_custom_args:
+            bound_args[custom_arg] = inner_custom_args[custom_arg]
+
+        else:
+            user_args.append(custom_arg)
+
+    return bound_args, tuple(lazy_args), tuple(user_args)
+
+
+def bind_mtd_kwargs(
+        binding_plan: TypeBindingPlan,
+        user_custom_args: t.Optional[t.Dict[str, t.Any]] = None,
+        inner_custom_args: t.Optional[t.Dict[str, t.Any]] = None,
+        precomp_args: t.Optional[t.Mapping[str, t.Any]] = None,
+        ) -> t.Dict[str, t.Any]:
+    """Build a ``kwargs`` (:obj:`dict`) from a compiled argument-binding plan.
+
+    Args:
+        binding_plan (:obj:`tuple`): plan given by ``compile_mtd_kwargs``.
+
+        user_custom_args (:obj:`dict`, optional): check ``build_mtd_kwargs``.
+
+        inner_custom_args (:obj:`dict`, optional): the same given to ``com-
+            pile_mtd_kwargs``. Used only if some lazy precomputed value is
+            not available.
+
+        precomp_args (:obj:`Mapping`, optional): the same given to ``compile-
+            _mtd_kwargs``.
+
+    Returns:
+        dict: a ready-to-use ``kwargs`` for the correspondent callable. If no
+            argument is left to bind, the bound arguments of ``binding_plan``
+            are returned with no copies, so it must not be modified.
+    """
+    bound_args, lazy_args, user_args = binding_plan
+
+    if not lazy_args and not (user_custom_args and user_args):
+        return bound_args
+
+    callable_args = dict(bound_args)
+
+    for custom_arg in lazy_args:
+        try:
+            callable_args[custom_arg] = precomp_args[custom_arg]  # type: ignore
+
+        except KeyError:
+            for arg_source in (inner_custom_args, user_custom_args):
+                if arg_source and custom_arg in arg_source:
+                    callable_args[custom_arg] = arg_source[custom_arg]
+                    break
+
+    if user_custom_args:
+        for custom_arg in user_args:
+            if custom_arg in user_custom_args:
+                callable_args[custom_arg] = user_custom_args[custom_arg]
+
+    return callable_args
+
+
+def check_unknown_args(mtd_name: str,
+                       mtd_args: t.Iterable[str],
+                       user_custom_args: t.Optional[t.Dict[str, t.Any]] = None
+                       ) -> None:
+    """Warn about every user custom argument which ``mtd_name`` does not have."""
+    if not user_custom_args:
+        return
+
+    for unknown_arg in user_custom_args.keys():
+        if unknown_arg not in mtd_args:
             warnings.warn(
                 'Unknown argument "{0}" for method "{1}".'.format(
                     unknown_arg, mtd_name), UserWarning)
 
-    return callable_args
-
 
 def check_summary_warnings(value: t.Union[TypeNumeric, t.Sequence, np.ndarray],
                            name_feature: str, name_summary: str) -> None:
@@ -759,7 +1161,8 @@ def process_summary(
     available_sum_methods = []  # type: t.List[str]
 
     for summary_func in in_group:
-        summary_mtd_callable = _summary.SUMMARY_METHODS.get(summary_func)
+        summary_mtd_callable = _lazy.resolve(
+            _summary.SUMMARY_METHODS.get(summary_func))
 
         if not summary_mtd_callable:
             warnings.warn("Missing summary function "
@@ -870,7 +1273,7 @@ def process_features(
             prefix=MTF_PREFIX)
 
         if mtd_name_without_prefix in processed_ft:
-            mtd_callable_args = _extract_mtd_args(ft_mtd_callable)
+            mtd_callable_args = get_mtd_args(ft_mtd_callable)
 
             extended_item = (*ft_mtd_tuple,
                              mtd_callable_args)  # type: TypeExtMtdTuple
@@ -907,19 +1310,346 @@ def _patch_precomp_groups(
     return precomp_groups
 
 
+def _get_precomp_mtd_produces(precomp_mtd_name: str,
+                              precomp_mtd_callable: t.Callable
+                              ) -> t.Tuple[str, ...]:
+    """Get the keys declared as produced by a precomputation method.
+
+    The keys are declared in the ``PRECOMPUTE_PRODUCES`` attribute of the
+    class in ``VALID_MFECLASSES`` which the method belongs to.
+    """
+    mfe_class = getattr(precomp_mtd_callable, "__self__", None)
+    produces = getattr(mfe_class, "PRECOMPUTE_PRODUCES", {})
+    return tuple(produces.get(precomp_mtd_name, tuple()))
+
+
+def _sort_precomp_mtds(
+        precomp_mtds: t.Sequence[TypeMtdTuple]
+        ) -> t.Tuple[t.Tuple[TypeMtdTuple, ...], t.Dict[str, t.Set[str]]]:
+    """Build the dependency graph between precomputation methods.
+
+    A precomputation method depends on another if it consumes (i.e., has as
+    a named argument) some key produced by the other one. Check ``_get_pre-
+    comp_mtd_produces`` function for more information.
+
+    Args:
+        precomp_mtds (:obj:`Sequence` of :obj:`tuple`): precomputation me-
+            thods in the form (``mtd_name``, ``mtd_callable``).
+
+    Returns:
+        tuple(tuple, dict): the first field is ``precomp_mtds`` sorted in a
+            topological order of the dependency graph, which keeps the ori-
+            ginal relative order of independent methods. The second field
+            maps each method name to the names of the methods it depends on.
+            If the graph has cycles, then the methods within them are sorted
+            by its original order and each of them depends on all methods
+            placed before it.
+    """
+    producers = collections.defaultdict(set)  # type: t.Dict[str, t.Set[str]]
+
+    for precomp_mtd_name, precomp_mtd_callable in precomp_mtds:
+        for key in _get_precomp_mtd_produces(precomp_mtd_name,
+                                             precomp_mtd_callable):
+            producers[key].add(precomp_mtd_name)
+
+    dependencies = {}  # type: t.Dict[str, t.Set[str]]
+
+    for precomp_mtd_name, precomp_mtd_callable in precomp_mtds:
+        dependencies[precomp_mtd_name] = {
+            producer
+            for key in get_mtd_args(precomp_mtd_callable)
+            for producer in producers.get(key, set())
+        }.difference({precomp_mtd_name})
+
+    sorted_mtds = []  # type: t.List[TypeMtdTuple]
+    sorted_names = set()  # type: t.Set[str]
+    remaining_mtds = list(precomp_mtds)
+
+    while remaining_mtds:
+        ready_mtd = next(
+            (mtd_tuple for mtd_tuple in remaining_mtds
+             if dependencies[mtd_tuple[0]].issubset(sorted_names)),
+            None)
+
+        if ready_mtd is None:
+            # Cyclic dependencies: just keep the original order
+            for mtd_tuple in remaining_mtds:
+                dependencies[mtd_tuple[0]] = set(sorted_names)
+                sorted_mtds.append(mtd_tuple)
+                sorted_names.add(mtd_tuple[0])
+
+            break
+
+        remaining_mtds.remove(ready_mtd)
+        sorted_mtds.append(ready_mtd)
+        sorted_names.add(ready_mtd[0])
+
+    return tuple(sorted_mtds), dependencies
+
+
+def _run_precomp_mtd(precomp_mtd_name: str,
+                     precomp_mtd_callable: t.Callable,
+                     suppress_warnings: bool = False,
+                     callbacks: t.Optional[t.Sequence[t.Any]] = None,
+                     **kwargs) -> t.Dict[str, t.Any]:
+    """Call a single precomputation method, ignoring it if it fails.
+
+    The ``precompute`` hooks of ``callbacks`` (check ``callbacks`` module)
+    are called right before and after the method.
+    """
+    error = None  # type: t.Optional[Exception]
+
+    if callbacks:
+        group = get_mtd_group(precomp_mtd_callable)
+        shape = _callbacks.get_input_shape(
+            kwargs, get_mtd_args(precomp_mtd_callable))
+
+        _callbacks.notify(callbacks, "on_precompute_start",
+                          _callbacks.CallbackEvent(
+                              stage="precompute", name=precomp_mtd_name,
+                              group=group, shape=shape))
+
+        t_start, t_cpu_start = time.time(), time.process_time()
+
+    try:
+        new_precomp_vals = precomp_mtd_callable(**kwargs)  # type: ignore
+
+    except (AttributeError, TypeError, ValueError) as type_err:
+        new_precomp_vals = {}
+        error = type_err
+
+        if not suppress_warnings:
+            warnings.warn("Something went wrong while "
+                          'precomputing "{0}". Will ignore '
+                          "this method. Error message:\n"
+                          "{1}.".format(precomp_mtd_name, repr(type_err)))
+
+    if callbacks:
+        _callbacks.notify(callbacks, "on_precompute_end",
+                          _callbacks.CallbackEvent(
+                              stage="precompute", name=precomp_mtd_name,
+                              group=group, shape=shape,
+                              wall_time=time.time() - t_start,
+                              cpu_time=time.process_time() - t_cpu_start,
+                              outcome=_callbacks.get_outcome(
+                                  new_precomp_vals, error),
+                              value=new_precomp_vals, error=error))
+
+    return new_precomp_vals
+
+
+def _run_precomp_mtds_parallel(
+        precomp_mtds: t.Sequence[TypeMtdTuple],
+        dependencies: t.Dict[str, t.Set[str]],
+        n_jobs: t.Optional[int] = None,
+        suppress_warnings: bool = False,
+        callbacks: t.Optional[t.Sequence[t.Any]] = None,
+        **kwargs) -> t.Dict[str, t.Dict[str, t.Any]]:
+    """Run precomputation methods in a thread pool following its dependencies.
+
+    Every method is submitted as soon as all methods it depends on are done,
+    receiving every value precomputed so far alongside ``kwargs``. The hooks
+    of ``callbacks`` are called from the worker threads.
+
+    Returns:
+        dict: the precomputed values of each method, keyed by method name.
+    """
+    results = {}  # type: t.Dict[str, t.Dict[str, t.Any]]
+    pending_mtds = list(precomp_mtds)
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=n_jobs or os.cpu_count()) as executor:
+        running = {}  # type: t.Dict[concurrent.futures.Future, str]
+
+        while pending_mtds or running:
+            for mtd_tuple in tuple(pending_mtds):
+                precomp_mtd_name, precomp_mtd_callable = mtd_tuple
+
+                if dependencies[precomp_mtd_name].issubset(results):
+                    precomp_kwargs = dict(kwargs)
+
+                    for finished_vals in results.values():
+                        precomp_kwargs.update(finished_vals)
+
+                    future = executor.submit(
+                        _run_precomp_mtd, precomp_mtd_name,
+                        precomp_mtd_callable, suppress_warnings, callbacks,
+                        **precomp_kwargs)
+
+                    running[future] = precomp_mtd_name
+                    pending_mtds.remove(mtd_tuple)
+
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    return results
+
+
+class LazyPrecompArgs(collections.abc.Mapping):
+    """Mapping of precomputed values evaluated only on demand.
+
+    Each precomputation method is called only the first time some key it
+    produces (check the ``PRECOMPUTE_PRODUCES`` attribute of the classes in
+    ``VALID_MFECLASSES``) is requested, after every method it depends on.
+    Its values are memoized afterwards. Keys not produced by any method are
+    never evaluated.
+
+    Note that iterating over this mapping (or getting its length) forces the
+    evaluation of every precomputation method.
+    """
+
+    def __init__(self,
+                 precomp_mtds: t.Sequence[TypeMtdTuple],
+                 dependencies: t.Dict[str, t.Set[str]],
+                 suppress_warnings: bool = False,
+                 precomp_vals: t.Optional[t.Mapping[str, t.Any]] = None,
+                 callbacks: t.Optional[t.Sequence[t.Any]] = None,
+                 **kwargs) -> None:
+        """Keep the precomputation methods to be evaluated later.
+
+        Args:
+            precomp_mtds (:obj:`Sequence` of :obj:`tuple`): precomputation
+                methods in the form (``mtd_name``, ``mtd_callable``), sorted
+                as given by ``_sort_precomp_mtds`` function.
+
+            dependencies (:obj:`dict`): names of the methods each precomputa-
+                tion method depends on, also given by ``_sort_precomp_mtds``.
+
+            suppress_warnings (:obj:`bool`, optional): if True, suppress war-
+                nings invoked while evaluating the precomputation methods.
+
+            precomp_vals (:obj:`dict`, optional): values already precomputed,
+                which are never evaluated again.
+
+            callbacks (:obj:`Sequence`, optional): instrumentation callbacks
+                (check ``callbacks`` module) notified while evaluating the
+                precomputation methods.
+
+            **kwargs: custom arguments to precomputation methods.
+        """
+        self._precomp_mtds = collections.OrderedDict(precomp_mtds)
+        self._dependencies = dependencies
+        self._suppress_warnings = suppress_warnings
+        self._callbacks = callbacks
+        self._kwargs = kwargs
+
+        self._producers = collections.defaultdict(
+            list)  # type: t.Dict[str, t.List[str]]
+
+        for precomp_mtd_name, precomp_mtd_callable in precomp_mtds:
+            for key in _get_precomp_mtd_produces(precomp_mtd_name,
+                                                 precomp_mtd_callable):
+                self._producers[key].append(precomp_mtd_name)
+
+        self._values = dict(
+            precomp_vals or {})  # type: t.Dict[str, t.Any]
+        self._evaluated = set()  # type: t.Set[str]
+
+        # Feature methods may ask for values from several threads
+        self._lock = threading.RLock()
+
+    def _evaluate(self, precomp_mtd_name: str) -> None:
+        """Evaluate a precomputation method and all its dependencies."""
+        if precomp_mtd_name in self._evaluated:
+            return
+
+        for dep_name in self._dependencies.get(precomp_mtd_name, set()):
+            self._evaluate(dep_name)
+
+        new_precomp_vals = _run_precomp_mtd(
+            precomp_mtd_name, self._precomp_mtds[precomp_mtd_name],
+            self._suppress_warnings, self._callbacks,
+            **{**self._kwargs, **self._values})
+
+        self._evaluated.add(precomp_mtd_name)
+
+        for key, value in new_precomp_vals.items():
+            self._values.setdefault(key, value)
+
+    def __getitem__(self, key: str) -> t.Any:
+        with self._lock:
+            for precomp_mtd_name in self._producers.get(key, tuple()):
+                if key in self._values:
+                    break
+
+                self._evaluate(precomp_mtd_name)
+
+            return self._values[key]
+
+    def may_contain(self, key: t.Any) -> bool:
+        """Check if ``key`` is known or produced, evaluating no method."""
+        return key in self._values or key in self._producers
+
+    def __contains__(self, key: t.Any) -> bool:
+        try:
+            self[key]
+
+        except KeyError:
+            return False
+
+        return True
+
+    def evaluate_all(self) -> t.Dict[str, t.Any]:
+        """Evaluate every precomputation method not evaluated yet."""
+        with self._lock:
+            for precomp_mtd_name in self._precomp_mtds:
+                self._evaluate(precomp_mtd_name)
+
+            return self._values
+
+    @property
+    def evaluated(self) -> t.FrozenSet[str]:
+        """Names of the precomputation methods already evaluated."""
+        return frozenset(self._evaluated)
+
+    @property
+    def known_values(self) -> t.Dict[str, t.Any]:
+        """Values already precomputed, without evaluating any other method."""
+        with self._lock:
+            return dict(self._values)
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # Locks can't be pickled (e.g., to start processes with ``spawn``)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(dict(self.evaluate_all()))
+
+    def __len__(self) -> int:
+        return len(self.evaluate_all())
+
+
 def process_precomp_groups(
         precomp_groups: t.Union[str, t.Iterable[str]],
         groups: t.Optional[t.Tuple[str, ...]] = None,
         wildcard: str = "all",
         suppress_warnings: bool = False,
+        enable_parallel: bool = False,
+        n_jobs: t.Optional[int] = None,
+        lazy: bool = False,
+        precomp_vals: t.Optional[t.Mapping[str, t.Any]] = None,
+        callbacks: t.Optional[t.Sequence[t.Any]] = None,
         **kwargs
-        ) -> t.Dict[str, t.Any]:
+        ) -> t.Mapping[str, t.Any]:
     """Process ``precomp_groups`` argument while fitting into a MFE model.
 
     This function is expected to be used after ``process_groups`` function,
     as ``groups`` parameter is expected to be in a canonical form (lower-cased
     values inside a tuple).
 
+    The precomputation methods are run following the dependencies between
+    them (check ``_sort_precomp_mtds`` function), so a method always runs
+    after every method which produces some value it consumes.
+
     Args:
         precomp_groups (:obj:`iterable` of `str` or `str`): a single or a se-
             quence of metafeature group names whose precomputation methods
@@ -936,20 +1666,45 @@ def process_precomp_groups(
         suppress_warnings (:obj:`bool`, optional): if True, suppress warnings
             invoked while processing precomputation option.
 
+        enable_parallel (:obj:`bool`, optional): if True, independent preco-
+            mputation methods run simultaneously in a pool of threads.
+
+        n_jobs (:obj:`int`, optional): maximum number of threads used if
+            ``enable_parallel`` is True. If :obj:`NoneType`, then the number
+            of processors of the machine is used.
+
+        lazy (:obj:`bool`, optional): if True, no precomputation method is
+            called here. Instead, a :obj:`LazyPrecompArgs` is returned, which
+            calls each method only when some value it produces is requested
+            for the first time. ``enable_parallel`` is ignored in this case.
+
+        precomp_vals (:obj:`dict`, optional): values already precomputed
+            (e.g., updated by ``update_precomp_args`` function). They are gi-
+            ven to every precomputation method, so they are not computed
+            again, and are also part of the returned values.
+
+        callbacks (:obj:`Sequence`, optional): instrumentation callbacks whose
+            ``precompute`` hooks are called around every precomputation me-
+            thod (check ``callbacks`` module).
+
         **kwargs: used to pass extra custom arguments to precomputation metho-
             ds.
 
     Returns:
         dict: precomputed values given by ``kwargs`` using convenient methods
-            based in valid selected metafeature groups.
+            based in valid selected metafeature groups. If ``lazy`` is True,
+            a :obj:`LazyPrecompArgs` mapping is returned instead.
     """
     if groups is None:
         groups = tuple()
 
     precomp_groups = _patch_precomp_groups(precomp_groups, groups)
 
+    if precomp_vals is None:
+        precomp_vals = {}
+
     if not precomp_groups:
-        return {}
+        return dict(precomp_vals)
 
     processed_precomp_groups = _preprocess_iterable_arg(
         precomp_groups)  # type: t.Sequence[str]
@@ -979,22 +1734,39 @@ def process_precomp_groups(
 
     del mtds_metadata
 
-    precomp_items = {}  # type: t.Dict[str, t.Any]
+    precomp_mtds_filtered, dependencies = _sort_precomp_mtds(
+        precomp_mtds_filtered)
 
-    for precomp_mtd_tuple in precomp_mtds_filtered:
-        precomp_mtd_name, precomp_mtd_callable = precomp_mtd_tuple
+    if lazy:
+        return LazyPrecompArgs(
+            precomp_mtds=precomp_mtds_filtered,
+            dependencies=dependencies,
+            suppress_warnings=suppress_warnings,
+            precomp_vals=precomp_vals,
+            callbacks=callbacks,
+            **kwargs)
 
-        try:
-            new_precomp_vals = precomp_mtd_callable(**kwargs)  # type: ignore
+    precomp_items = dict(precomp_vals)  # type: t.Dict[str, t.Any]
+    kwargs = {**kwargs, **precomp_vals}
+
+    if enable_parallel:
+        results = _run_precomp_mtds_parallel(
+            precomp_mtds=precomp_mtds_filtered,
+            dependencies=dependencies,
+            n_jobs=n_jobs,
+            suppress_warnings=suppress_warnings,
+            callbacks=callbacks,
+            **kwargs)
 
-        except (AttributeError, TypeError, ValueError) as type_err:
-            new_precomp_vals = {}
+        for precomp_mtd_name, _ in precomp_mtds_filtered:
+            precomp_items.update(results[precomp_mtd_name])
 
-            if not suppress_warnings:
-                warnings.warn("Something went wrong while "
-                              'precomputing "{0}". Will ignore '
-                              "this method. Error message:\n"
-                              "{1}.".format(precomp_mtd_name, repr(type_err)))
+        return precomp_items
+
+    for precomp_mtd_name, precomp_mtd_callable in precomp_mtds_filtered:
+        new_precomp_vals = _run_precomp_mtd(
+            precomp_mtd_name, precomp_mtd_callable, suppress_warnings,
+            callbacks, **kwargs)
 
         if new_precomp_vals:
             precomp_items = {
@@ -1011,17 +1783,156 @@ def process_precomp_groups(
     return precomp_items
 
 
+def _merge_class_freqs(
+        classes: np.ndarray,
+        class_freqs: np.ndarray,
+        y_new: np.ndarray) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Add the absolute class frequencies of ``y_new`` to ``class_freqs``."""
+    new_classes, new_class_freqs = np.unique(y_new, return_counts=True)
+
+    merged_classes = np.unique(np.concatenate((classes, new_classes)))
+    merged_freqs = np.zeros(merged_classes.size, dtype=class_freqs.dtype)
+
+    merged_freqs[np.searchsorted(merged_classes, classes)] += class_freqs
+    merged_freqs[np.searchsorted(merged_classes, new_classes)] += (
+        new_class_freqs)
+
+    return merged_classes, merged_freqs
+
+
+def update_precomp_args(
+        precomp_args: t.Mapping[str, t.Any],
+        N: np.ndarray,
+        C: np.ndarray,
+        y: np.ndarray,
+        num_inst_prev: int,
+        cat_cardinalities: t.Optional[np.ndarray] = None,
+        update_num: bool = True,
+        update_cat: bool = True,
+        partial_fit_stats: t.Optional[t.Mapping[str, t.Any]] = None,
+        ) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, t.Any]]:
+    """Update precomputed values after appending instances to the fitted data.
+
+    Only the values behind ``general``, ``statistical`` and ``info-theory``
+    groups are updated, merging the sufficient statistics of the previous
+    instances with the ones of the new instances:
+
+        1. ``classes`` and ``class_freqs``: class counts.
+        2. ``cov_mat`` and ``abs_corr_mat``: attribute means and co-moment
+            matrix. Check ``MFEStatistical.update_cor_cov`` method.
+        3. ``cont_tables``, ``class_ent``, ``attr_ent``, ``joint_ent`` and
+            ``mut_inf``: contingency tables. Check ``MFEInfoTheory.update_-
+            entropy`` method.
+
+    Args:
+        precomp_args (:obj:`dict`): values precomputed for the previous in-
+            stances. Only these values are updated.
+
+        N (:obj:`np.ndarray`): numerical attributes of all instances, with
+            the previous instances first.
+
+        C (:obj:`np.ndarray`): categorical attributes of all instances, with
+            the previous instances first.
+
+        y (:obj:`np.ndarray`): target attribute of all instances.
+
+        num_inst_prev (:obj:`int`): number of previous instances.
+
+        cat_cardinalities (:obj:`np.ndarray`, optional): number of distinct
+            codes of each attribute in ``C``, if ``C`` holds the integer codes
+            of the fitted data.
+
+        update_num (:obj:`bool`, optional): if False, the previous instances
+            of ``N`` are not the same used to precompute ``precomp_args``
+            (e.g., ``N`` was rescaled with the new instances), so the values
+            related to ``N`` are not updated.
+
+        update_cat (:obj:`bool`, optional): the same of ``update_num``, but
+            for ``C``.
+
+        partial_fit_stats (:obj:`dict`, optional): sufficient statistics re-
+            turned by the last call of this function, if any.
+
+    Returns:
+        tuple(dict, dict): the first field has the updated precomputed values.
+            Any value of ``precomp_args`` not in it must be recomputed. The
+            second field has the sufficient statistics of all instances, to be
+            given as ``partial_fit_stats`` in the next call.
+    """
+    if partial_fit_stats is None:
+        partial_fit_stats = {}
+
+    updated_vals = {}  # type: t.Dict[str, t.Any]
+    new_stats = {}  # type: t.Dict[str, t.Any]
+
+    if {"classes", "class_freqs"}.issubset(precomp_args):
+        updated_vals["classes"], updated_vals["class_freqs"] = (
+            _merge_class_freqs(
+                classes=precomp_args["classes"],
+                class_freqs=precomp_args["class_freqs"],
+                y_new=y[num_inst_prev:]))
+
+    if update_num and N.size and "cov_mat" in precomp_args:
+        cov_mat, abs_corr_mat, num_mean = (
+            get_mfe_class("statistical").update_cor_cov(
+                N=N,
+                num_inst_prev=num_inst_prev,
+                cov_mat=precomp_args["cov_mat"],
+                num_mean=partial_fit_stats.get("num_mean")))
+
+        updated_vals["cov_mat"] = cov_mat
+        new_stats["num_mean"] = num_mean
+
+        if "abs_corr_mat" in precomp_args:
+            updated_vals["abs_corr_mat"] = abs_corr_mat
+
+    if (update_cat and C.size and not {
+            "cont_tables", "attr_ent", "joint_ent", "mut_inf"
+    }.isdisjoint(precomp_args)):
+        mfe_info_theory = get_mfe_class("info-theory")
+
+        entropy_vals, cont_tables = mfe_info_theory.update_entropy(
+            C=C,
+            y=y,
+            num_inst_prev=num_inst_prev,
+            cat_cardinalities=cat_cardinalities,
+            class_freqs=updated_vals.get("class_freqs"),
+            cont_tables=partial_fit_stats.get("cont_tables"))
+
+        for key, value in entropy_vals.items():
+            if key in precomp_args and key not in updated_vals:
+                updated_vals[key] = value
+
+        new_stats["cont_tables"] = cont_tables
+
+    return updated_vals, new_stats
+
+
 def check_data(X: t.Union[np.ndarray, list],
-               y: t.Union[np.ndarray, list]
+               y: t.Union[np.ndarray, list],
+               copy: bool = True,
+               suppress_warnings: bool = False,
                ) -> t.Tuple[np.ndarray, np.ndarray]:
     """Checks ``X`` and ``y`` data type and shape and transform it if necessary.
 
+    A :obj:`pd.DataFrame` ``X`` and a :obj:`pd.Series` (or :obj:`pd.Data-
+    Frame`) ``y`` are converted with its ``to_numpy`` method.
+
     Args:
+        copy (:obj:`bool`, optional): if True, return copies of ``X`` and
+            ``y``. Otherwise, return read-only views of them whenever possi-
+            ble, warning about every copy made (check ``warn_copy``). Memory-
+            mapped arrays (:obj:`np.memmap`) are never copied, so they are
+            kept mapped independently of this argument.
+
+        suppress_warnings (:obj:`bool`, optional): if True, do not warn about
+            the copies made if ``copy`` is False.
+
         Check ``mfe.fit`` method for more information.
 
     Raises:
-        TypeError: if ``X`` or ``y`` is neither a np.ndarray nor a list-
-            type object.
+        TypeError: if ``X`` or ``y`` is neither a np.ndarray, a list-type nor
+            a pandas object.
 
         ValueError: if ``X`` is empty or number of rows between X and Y
             mismatch.
@@ -1030,19 +1941,41 @@ def check_data(X: t.Union[np.ndarray, list],
         tuple(np.ndarray, np.ndarray): ``X`` and ``y`` possibly reshaped and
             casted to :obj:`np.ndarray` type.
     """
+    warn_copies = not copy and not suppress_warnings
+    X_is_copy, y_is_copy = False, False
+
+    if is_dataframe(X):
+        X, X_is_copy = _pandas_to_numpy(X, "X", copy, warn_copies)
+
+    if is_dataframe(y) or is_series(y):
+        y, y_is_copy = _pandas_to_numpy(y, "y", copy, warn_copies)
+
     if not isinstance(X, (np.ndarray, list)):
-        raise TypeError('"X" is neither "list" nor "np.array".')
+        raise TypeError('"X" is neither "list", "np.array" nor '
+                        '"pd.DataFrame".')
 
     if not isinstance(y, (np.ndarray, list)):
-        raise TypeError('"y" is neither "list" nor "np.array".')
+        raise TypeError('"y" is neither "list", "np.array" nor '
+                        '"pd.Series".')
 
     if not isinstance(X, np.ndarray):
         X = np.array(X)
 
+        if warn_copies:
+            warn_copy("X", "it is not a np.ndarray")
+
     if not isinstance(y, np.ndarray):
         y = np.array(y)
 
-    y = y.flatten()
+        if warn_copies:
+            warn_copy("y", "it is not a np.ndarray")
+
+    y_flat = np.ravel(y)
+
+    if warn_copies and y.size and not np.may_share_memory(y_flat, y):
+        warn_copy("y", "it is not contiguous in memory")
+
+    y = y_flat
 
     if len(X.shape) == 1 and X.shape[0]:
         X = X.reshape(*X.shape, -1)
@@ -1054,7 +1987,181 @@ def check_data(X: t.Union[np.ndarray, list],
         raise ValueError('"X" number of rows and "y" '
                          "length shapes do not match.")
 
-    return np.copy(X), np.copy(y)
+    return (_protect_data(X, is_copy=X_is_copy, copy=copy),
+            _protect_data(y, is_copy=y_is_copy, copy=copy))
+
+
+def _pandas_to_numpy(data: t.Any,
+                     data_name: str,
+                     copy: bool,
+                     warn_copies: bool) -> t.Tuple[np.ndarray, bool]:
+    """Convert a :obj:`pd.DataFrame` or :obj:`pd.Series` ``data``.
+
+    Returns:
+        tuple(np.ndarray, bool): ``data`` converted with its ``to_numpy``
+            method, and True if it is a copy of ``data`` (i.e., if ``copy``
+            is True).
+    """
+    if (warn_copies and is_dataframe(data)
+            and len(set(data.dtypes)) > 1):
+        warn_copy(data_name, "its DataFrame columns have distinct types")
+
+    return data.to_numpy(copy=copy), copy
+
+
+def _protect_data(data: np.ndarray, is_copy: bool, copy: bool) -> np.ndarray:
+    """Keep the caller ``data`` buffer untouched by the fitted model.
+
+    Args:
+        data (:obj:`np.ndarray`): array given by the caller, or converted
+            from the caller data.
+
+        is_copy (:obj:`bool`): if True, ``data`` is already a copy, and it is
+            returned unchanged.
+
+        copy (:obj:`bool`): if True, return a copy of ``data``. Otherwise
+            (or if ``data`` is a :obj:`np.memmap`), return a read-only view
+            of it, so the caller buffer is kept writable.
+    """
+    if is_copy:
+        return data
+
+    if copy and not isinstance(data, np.memmap):
+        return np.copy(data)
+
+    data = data.view()
+    data.flags.writeable = False
+
+    return data
+
+
+def warn_copy(data_name: str, reason: str) -> None:
+    """Warn that ``data_name`` was copied while fitting with ``copy=False``."""
+    warnings.warn('"{0}" was copied in memory while fitting data, as {1}.'
+                  .format(data_name, reason), UserWarning)
+
+
+def select_columns(data: np.ndarray,
+                   indexes: t.Sequence[int]) -> np.ndarray:
+    """Select the columns of ``data`` given by ``indexes``.
+
+    If ``indexes`` is a sequence of consecutive increasing column indexes,
+    then a view of ``data`` is returned. Otherwise, a copy of the selected
+    columns is made.
+    """
+    if (len(indexes) > 1 and
+            all(ind_b - ind_a == 1
+                for ind_a, ind_b in zip(indexes[:-1], indexes[1:]))):
+        return data[:, indexes[0]:indexes[-1] + 1]
+
+    if len(indexes) == 1:
+        return data[:, indexes[0]:indexes[0] + 1]
+
+    return data[:, indexes]
+
+
+def _get_pandas_type(type_name: str) -> t.Optional[type]:
+    """Get the ``pandas`` type ``type_name``, if ``pandas`` is imported.
+
+    If ``pandas`` was never imported, then no object can be of its types,
+    so it is not imported here.
+    """
+    return getattr(sys.modules.get("pandas"), type_name, None)
+
+
+def is_dataframe(data: t.Any) -> bool:
+    """Checks if ``data`` is a :obj:`pd.DataFrame`."""
+    df_type = _get_pandas_type("DataFrame")
+    return df_type is not None and isinstance(data, df_type)
+
+
+def is_series(data: t.Any) -> bool:
+    """Checks if ``data`` is a :obj:`pd.Series`."""
+    series_type = _get_pandas_type("Series")
+    return series_type is not None and isinstance(data, series_type)
+
+
+def _is_categorical_dtype(dtype: t.Any) -> bool:
+    """Checks if ``dtype`` is a :obj:`pd.CategoricalDtype`."""
+    return getattr(dtype, "name", None) == "category"
+
+
+def infer_cat_cols_frame(
+        frame: t.Any,
+        check_bool: bool = False,
+        sample_size: int = 1024,
+        ) -> t.Tuple[np.ndarray, t.Optional[np.ndarray]]:
+    """Infer which columns of the :obj:`pd.DataFrame` ``frame`` are categorical.
+
+    Same as ``infer_cat_cols``, but deciding by the type of each column: co-
+    lumns with a numeric type (including the nullable integer types) are nu-
+    meric, and columns with :obj:`pd.CategoricalDtype` are categorical. Only
+    columns with :obj:`object` type are checked value by value. The distinct
+    values of categorical columns are counted from its codes.
+    """
+    num_cols = frame.shape[1]
+
+    categorical_cols = np.zeros(num_cols, dtype=bool)
+    num_distinct = None  # type: t.Optional[np.ndarray]
+
+    if check_bool:
+        num_distinct = np.zeros(num_cols, dtype=int)
+
+    for ind in range(num_cols):
+        col = frame.iloc[:, ind]
+
+        if _is_categorical_dtype(col.dtype):
+            col_values = col.cat.codes.to_numpy()
+            categorical_cols[ind] = True
+
+        else:
+            col_values = col.to_numpy()
+            categorical_cols[ind] = not (frame.shape[0] > 0 and (
+                col.dtype.kind in "iufc"
+                or is_numeric_col(col_values, sample_size=sample_size)))
+
+        if num_distinct is not None:
+            num_distinct[ind] = _codes.count_distinct(col_values)
+
+    if num_distinct is not None:
+        categorical_cols |= num_distinct == 2
+
+    return categorical_cols, num_distinct
+
+
+def select_frame_num_columns(frame: t.Any,
+                             indexes: t.Sequence[int]) -> np.ndarray:
+    """Select the numeric columns ``indexes`` of ``frame`` as a float array.
+
+    The values are read from the numeric blocks of the :obj:`pd.DataFrame`
+    directly, never through an :obj:`object` array. If the selected columns
+    are a single :obj:`np.float64` block, then no copy is made.
+    """
+    if len(indexes) != frame.shape[1]:
+        frame = frame.iloc[:, list(indexes)]
+
+    if all(isinstance(dtype, np.dtype) for dtype in frame.dtypes):
+        return frame.to_numpy(dtype=float)
+
+    # Nullable extension types may hold pd.NA
+    return frame.to_numpy(dtype=float, na_value=np.nan)
+
+
+def select_frame_cat_codes(frame: t.Any,
+                           indexes: t.Sequence[int]) -> t.Optional[np.ndarray]:
+    """Select the codes of the categorical columns ``indexes`` of ``frame``.
+
+    Returns:
+        np.ndarray: the integer codes of every selected column (missing
+            values have code -1), if all of them have :obj:`pd.Categorical-
+            Dtype`. :obj:`NoneType` otherwise.
+    """
+    cols = [frame.iloc[:, ind] for ind in indexes]
+
+    if not cols or not all(_is_categorical_dtype(col.dtype) for col in cols):
+        return None
+
+    return np.column_stack([col.cat.codes.to_numpy() for col in cols])
 
 
 def isnumeric(
@@ -1094,6 +2201,99 @@ def isnumeric(
     return isinstance(value, _TYPE_NUMERIC)
 
 
+def _has_numeric_types_only(values: np.ndarray) -> bool:
+    """Check if every element of ``values`` has a numeric type.
+
+    The types are gathered in a single pass, and only each distinct type
+    is checked afterwards.
+    """
+    return all(
+        issubclass(val_type, _TYPE_NUMERIC)
+        for val_type in set(map(type, values)))
+
+
+def is_numeric_col(col: np.ndarray, sample_size: int = 1024) -> bool:
+    """Checks if ``col`` is a non-empty column of numeric-only values.
+
+    Same as ``isnumeric(col)``, but checking whole columns: arrays of a nu-
+    meric type (or of a non-object type) are decided by its ``dtype`` only.
+    Columns with :obj:`object` type have a sample of at most ``sample_size``
+    evenly spaced rows checked first, so most categorical columns are found
+    without checking every row.
+
+    Args:
+        col (:obj:`np.ndarray`): one-dimensional array to check.
+
+        sample_size (:obj:`int`, optional): number of rows to check first.
+
+    Returns:
+        bool: True if every value of ``col`` has a numeric type.
+    """
+    if col.size == 0:
+        return False
+
+    if col.dtype.kind != "O":
+        return col.dtype.kind in "iufc"
+
+    if col.size > sample_size and not _has_numeric_types_only(
+            col[::col.size // sample_size]):
+        return False
+
+    return _has_numeric_types_only(col)
+
+
+def infer_cat_cols(
+        data: np.ndarray,
+        check_bool: bool = False,
+        sample_size: int = 1024,
+        ) -> t.Tuple[np.ndarray, t.Optional[np.ndarray]]:
+    """Infer which columns of ``data`` are categorical.
+
+    A column is categorical if not every value has a numeric type (check
+    ``is_numeric_col``) or, if ``check_bool`` is True, if it has exactly two
+    distinct values.
+
+    Args:
+        data (:obj:`np.ndarray`): two-dimensional array of attributes.
+
+        check_bool (:obj:`bool`, optional): if True, count the distinct va-
+            lues of every column (check ``_codes.count_distinct``) and also
+            consider categorical the columns with exactly two of them.
+
+        sample_size (:obj:`int`, optional): check ``is_numeric_col``.
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): boolean mask of the categorical co-
+            lumns and the number of distinct values of each column, or :obj:`-
+            NoneType` if ``check_bool`` is False.
+    """
+    num_cols = data.shape[1]
+
+    if data.dtype.kind != "O":
+        is_numeric = data.shape[0] > 0 and data.dtype.kind in "iufc"
+        categorical_cols = np.full(num_cols, fill_value=not is_numeric)
+
+    else:
+        categorical_cols = np.fromiter(
+            (not is_numeric_col(data[:, ind], sample_size=sample_size)
+             for ind in range(num_cols)),
+            dtype=bool,
+            count=num_cols)
+
+    num_distinct = None  # type: t.Optional[np.ndarray]
+
+    if check_bool:
+        num_distinct = np.fromiter(
+            (_codes.count_distinct(data[:, ind])
+             for ind in range(num_cols)),
+            dtype=int,
+            count=num_cols)
+
+        categorical_cols |= num_distinct == 2
+
+    return categorical_cols, num_distinct
+
+
 def remove_prefix(value: str, prefix: str) -> str:
     """Remove ``prefix`` from ``value``.
 
@@ -1136,17 +2336,30 @@ def timeit(func: t.Callable, *args) -> t.Tuple[t.Any, float]:
     return ret_val, time_total
 
 
-def transform_cat(data_categoric: np.ndarray) -> t.Optional[np.ndarray]:
+def transform_cat(
+        data_categoric: np.ndarray,
+        cat_codes: t.Optional[np.ndarray] = None,
+        cat_cardinalities: t.Optional[np.ndarray] = None,
+        ) -> t.Optional[np.ndarray]:
     """Transform categorical data using a model matrix.
 
     The formula used for this transformation is just the union (+) of all cat-
     egoric attributes using formula language from ``patsy`` package API, re-
     moving the intercept terms: ``~ 0 + A_1 + ... + A_n``, where ``n`` is the
     number of attributes and A_i is the ith categoric attribute, 1 <= i <= n.
+
+    If the sorted integer codes of ``data_categoric`` (``cat_codes``) and its
+    cardinalities are given, then the same model matrix is built from the
+    codes directly (check ``_codes.one_hot``), with no need of ``patsy``.
+    Numeric-typed data is always handed to ``patsy``, which keeps it as is.
     """
     if data_categoric.size == 0:
         return None
 
+    if (cat_codes is not None and cat_cardinalities is not None
+            and data_categoric.dtype.kind not in "iufc"):
+        return _codes.one_hot(cat_codes, cat_cardinalities)
+
     _, num_col = data_categoric.shape
 
     dummy_attr_names = [
@@ -1160,6 +2373,8 @@ def transform_cat(data_categoric: np.ndarray) -> t.Optional[np.ndarray]:
 
     formula = "~ 0 + {}".format(" + ".join(dummy_attr_names))
 
+    patsy = _lazy.import_object("patsy")
+
     return np.asarray(patsy.dmatrix(formula, named_data))
 
 
@@ -1261,11 +2476,48 @@ def rescale_data(data: np.ndarray,
     if not args:
         args = {}
 
-    scaler_model = _RESCALE_SCALERS.get(option, "min-max")(**args)
+    scaler_model = _lazy.import_object(_RESCALE_SCALERS[option])(**args)
 
     return scaler_model.fit_transform(data.astype(float))
 
 
+def check_int_arg(value: t.Any,
+                  arg_name: str,
+                  allow_none: bool = True,
+                  positive: bool = False) -> t.Optional[int]:
+    """Checks if ``value`` is a valid integer argument.
+
+    Args:
+        value (any): value of the argument.
+
+        arg_name (:obj:`str`): name of the argument, used in error messages.
+
+        allow_none (:obj:`bool`, optional): if True, ``value`` may also be
+            :obj:`NoneType`.
+
+        positive (:obj:`bool`, optional): if True, ``value`` must be greater
+            than zero.
+
+    Returns:
+        int: ``value`` itself, if valid.
+
+    Raises:
+        ValueError: if ``value`` is neither an integer (positive, if ``posi-
+            tive`` is True) nor :obj:`NoneType` (if ``allow_none`` is True).
+    """
+    if value is None and allow_none:
+        return value
+
+    if not isinstance(value, int) or (positive and value <= 0):
+        raise ValueError('Invalid "{0}" argument ({1}). Expecting {2}{3} '
+                         "integer.".format(
+                             arg_name, value,
+                             "None or " if allow_none else "",
+                             "a positive" if positive else "an"))
+
+    return value
+
+
 def check_score(score: str, groups: t.Tuple[str, ...]):
     """Checks if a given score is valid.
 
@@ -1282,13 +2534,7 @@ def check_score(score: str, groups: t.Tuple[str, ...]):
         ValueError: if ``score`` is not valid.
 
     """
-    valid_scoring = {
-        "accuracy": scoring.accuracy,
-        "balanced-accuracy": scoring.balanced_accuracy,
-        "f1": scoring.f1,
-        "kappa": scoring.kappa,
-        "auc": scoring.auc,
-    }  # type: t.Dict[str, t.Callable[[np.ndarray, np.ndarray], float]]
+    valid_scoring = _VALID_SCORING
 
     if score is not None and not isinstance(score, str):
         raise ValueError('"score" is not None or str but "{0}" was passed.'
@@ -1305,6 +2551,6 @@ def check_score(score: str, groups: t.Tuple[str, ...]):
             raise ValueError(
                 'One of the following "score" values is required:'
                 '{0}'.format(list(valid_scoring.keys())))
-        return valid_scoring[score]
+        return _lazy.import_object(valid_scoring[score])
 
     return None
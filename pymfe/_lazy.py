@@ -0,0 +1,44 @@
+"""A module dedicated to the lazy import of heavy modules.
+
+Metafeature groups, scalers, scoring and summary functions which depend on
+heavy third-party packages (e.g., ``sklearn``, ``scipy``, ``pandas`` and
+``patsy``) are referenced by its import path, in the form ``module:attri-
+bute``, and only imported the first time they are actually used. Hence,
+``import pymfe.mfe`` loads none of these packages, and extracting only
+``general`` metafeatures from numeric data loads only ``numpy``.
+"""
+import typing as t
+import importlib
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def import_object(path: str) -> t.Any:
+    """Import the object referenced by ``path``.
+
+    Args:
+        path (:obj:`str`): import path in the form ``module:attribute``, or
+            just ``module`` to import the module itself.
+
+    Returns:
+        any: the imported object.
+
+    Raises:
+        ImportError: if the module can not be imported.
+        AttributeError: if the module has no such attribute.
+    """
+    module_name, _, attr_name = path.partition(":")
+    module = importlib.import_module(module_name)
+
+    if not attr_name:
+        return module
+
+    return getattr(module, attr_name)
+
+
+def resolve(value: t.Any) -> t.Any:
+    """Import ``value`` if it is an import path, or return it unchanged."""
+    if isinstance(value, str):
+        return import_object(value)
+
+    return value
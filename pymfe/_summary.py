@@ -3,13 +3,27 @@
 Attributes:
     SUMMARY_METHODS (:obj:`Dict`): dictionary that links summary function
         names as keys with methods callables which implements then as values.
+        Callables from heavy third-party packages are given by its import
+        path instead (check ``_lazy.resolve`` function), so they are only
+        imported if selected.
+
+    FAST_SUMMARY_METHODS (:obj:`Dict`): dictionary that links summary func-
+        tion names to implementations which compute its values from inter-
+        mediate values shared by every summary function (check ``Summary-
+        Stats`` class), such as the sorted values and the central moments.
+        Every implementation receives the :obj:`SummaryStats` and the user
+        arguments of the summary function, and returns :obj:`NotImplemented`
+        if it does not support these arguments (or the values), so the ori-
+        ginal function of ``SUMMARY_METHODS`` is called instead (check ``ca-
+        ll_summary``).
 """
 import typing as t
 import collections
 
-import scipy.stats
 import numpy as np
 
+import pymfe._lazy as _lazy
+
 TypeNumeric = t.TypeVar("TypeNumeric", int, float, np.number)
 """Type annotation for a numeric type (int, float, np.number)."""
 
@@ -95,14 +109,16 @@ def sum_quantiles(values: TypeValList,
         return np.percentile(
             values, (0, 25, 50, 75, 100), interpolation=numpy_interpolation)
 
-    return scipy.stats.mstats.mquantiles(
+    scipy_stats = _lazy.import_object("scipy.stats")
+
+    return scipy_stats.mstats.mquantiles(
         values, (0.00, 0.25, 0.50, 0.75, 1.00),
         alphap=scipy_alphap,
         betap=scipy_betap)
 
 
 def sum_skewness(values: TypeValList, method: int = 3,
-                 bias: bool = True) -> float:
+                 bias: bool = True) -> t.Union[float, np.ndarray]:
     """Calculate the skewness from ``values`` using ``method`` strategy.
 
     Args:
@@ -151,8 +167,18 @@ def sum_skewness(values: TypeValList, method: int = 3,
     if num_vals == 0:
         return np.nan
 
-    skew_val = scipy.stats.skew(values, bias=bias)
+    skew_val = _lazy.import_object("scipy.stats").skew(values, bias=bias)
+
+    return adjust_skewness(skew_val, num_vals=num_vals, method=method)
 
+
+def adjust_skewness(skew_val: t.Union[float, np.ndarray],
+                    num_vals: int,
+                    method: int = 3) -> t.Union[float, np.ndarray]:
+    """Turn the skewness given by ``scipy.stats.skew`` into ``method`` skewness.
+
+    Check ``sum_skewness`` for more information.
+    """
     if method == 2 and num_vals != 2:
         skew_val *= (num_vals * (num_vals - 1.0))**0.5 / (num_vals - 2.0)
 
@@ -163,7 +189,7 @@ def sum_skewness(values: TypeValList, method: int = 3,
 
 
 def sum_kurtosis(values: TypeValList, method: int = 3,
-                 bias: bool = True) -> TypeValList:
+                 bias: bool = True) -> t.Union[float, np.ndarray]:
     """Calculate the kurtosis of ``values`` using ``method`` strategy.
 
     Args:
@@ -212,8 +238,19 @@ def sum_kurtosis(values: TypeValList, method: int = 3,
     if num_vals == 0:
         return np.nan
 
-    kurt_val = scipy.stats.kurtosis(values, bias=bias)
+    kurt_val = _lazy.import_object("scipy.stats").kurtosis(values,
+                                                           bias=bias)
 
+    return adjust_kurtosis(kurt_val, num_vals=num_vals, method=method)
+
+
+def adjust_kurtosis(kurt_val: t.Union[float, np.ndarray],
+                    num_vals: int,
+                    method: int = 3) -> t.Union[float, np.ndarray]:
+    """Turn the kurtosis given by ``scipy.stats.kurtosis`` into ``method`` one.
+
+    Check ``sum_kurtosis`` for more information.
+    """
     if method == 2 and num_vals > 3:
         kurt_val = (num_vals + 1.0) * kurt_val + 6
         kurt_val *= (num_vals - 1.0) / ((num_vals - 2.0) * (num_vals - 3.0))
@@ -230,7 +267,7 @@ SUMMARY_METHODS = collections.OrderedDict((
     ("var", np.var),
     ("count", len),
     ("histogram", sum_histogram),
-    ("iq_range", scipy.stats.iqr),
+    ("iq_range", "scipy.stats:iqr"),
     ("kurtosis", sum_kurtosis),
     ("max", max),
     ("median", np.median),
@@ -239,3 +276,275 @@ SUMMARY_METHODS = collections.OrderedDict((
     ("range", np.ptp),
     ("skewness", sum_skewness),
 ))
+
+
+class SummaryStats:
+    """Intermediate values shared by the summary functions of some values.
+
+    Every intermediate value is computed only once, the first time a sum-
+    mary function needs it: the sorted values serve the order statistics
+    (e.g., ``median``, ``quantiles``, ``min`` and ``max``), and the central
+    moments serve ``mean``, ``sd``, ``var``, ``skewness`` and ``kurtosis``.
+
+    Attributes:
+        values (:obj:`np.ndarray`): values to summarize.
+    """
+
+    __slots__ = ("values", "_is_regular", "_sorted", "_mean", "_dev_pows")
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        self._is_regular = None  # type: t.Optional[bool]
+        self._sorted = None  # type: t.Optional[np.ndarray]
+        self._mean = None  # type: t.Optional[np.number]
+        self._dev_pows = None  # type: t.Optional[t.Tuple[np.ndarray, ...]]
+
+    @property
+    def is_regular(self) -> bool:
+        """Check if ``values`` is a non-empty 1-D array of finite floats.
+
+        The values of summary functions are only computed from the shared
+        intermediate values in this case.
+        """
+        if self._is_regular is None:
+            self._is_regular = bool(
+                isinstance(self.values, np.ndarray)
+                and self.values.ndim == 1 and self.values.size
+                and self.values.dtype.kind == "f"
+                and np.isfinite(self.values).all())
+
+        return self._is_regular
+
+    @property
+    def sorted_values(self) -> np.ndarray:
+        """Get the sorted ``values``."""
+        if self._sorted is None:
+            self._sorted = np.sort(self.values)
+
+        return self._sorted
+
+    @property
+    def mean(self) -> np.number:
+        """Get the mean of ``values``."""
+        if self._mean is None:
+            self._mean = np.mean(self.values)
+
+        return self._mean
+
+    def sum_dev_pow(self, order: int) -> np.number:
+        """Get the sum of the deviations from the mean to the power ``order``.
+
+        Args:
+            order (:obj:`int`): value between 2 and 4.
+        """
+        if self._dev_pows is None:
+            dev = self.values - self.mean
+            dev_2 = dev * dev
+            self._dev_pows = (np.sum(dev_2), np.sum(dev_2 * dev),
+                              np.sum(dev_2 * dev_2))
+
+        return self._dev_pows[order - 2]
+
+    def central_moment(self, order: int) -> np.number:
+        """Get the central moment of ``values`` of ``order`` (from 2 to 4)."""
+        return self.sum_dev_pow(order) / self.values.size
+
+    def percentiles(self, q: t.Sequence[float]) -> np.ndarray:
+        """Get the percentiles ``q`` with linear interpolation.
+
+        Same as ``np.percentile`` with ``interpolation="linear"``.
+        """
+        sorted_vals = self.sorted_values
+
+        virtual_inds = np.asarray(q, dtype=float) * (
+            (sorted_vals.size - 1) / 100.0)
+        ind_below = np.floor(virtual_inds).astype(int)
+        ind_above = np.minimum(ind_below + 1, sorted_vals.size - 1)
+        gamma = virtual_inds - ind_below
+
+        val_below = sorted_vals[ind_below]
+        diff = sorted_vals[ind_above] - val_below
+
+        return np.where(gamma >= 0.5,
+                        sorted_vals[ind_above] - diff * (1.0 - gamma),
+                        val_below + diff * gamma).astype(sorted_vals.dtype)
+
+    def moments_are_degenerate(self) -> bool:
+        """Check if the variance is too small to compute standardized moments.
+
+        Same criterion of ``scipy.stats.skew`` and ``scipy.stats.kurtosis``.
+        """
+        resolution = np.finfo(self.values.dtype).resolution
+        return bool(self.central_moment(2) <= (resolution * self.mean)**2)
+
+
+def _fast_mean(stats: SummaryStats, **kwargs) -> t.Any:
+    """Mean of the values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    return stats.mean
+
+
+def _fast_var(stats: SummaryStats, ddof: int = 0, **kwargs) -> t.Any:
+    """Variance of the values of ``stats`` with ``ddof`` degrees of freedom."""
+    dof = stats.values.size - ddof
+
+    if kwargs or dof <= 0:
+        return NotImplemented
+
+    return stats.sum_dev_pow(2) / dof
+
+
+def _fast_sd(stats: SummaryStats, ddof: int = 0, **kwargs) -> t.Any:
+    """Standard deviation of the values of ``stats`` (check ``_fast_var``)."""
+    var = _fast_var(stats, ddof=ddof, **kwargs)
+
+    if var is NotImplemented:
+        return var
+
+    return np.sqrt(var)
+
+
+def _fast_count(stats: SummaryStats, **kwargs) -> t.Any:
+    """Number of values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    return stats.values.size
+
+
+def _fast_iq_range(stats: SummaryStats, **kwargs) -> t.Any:
+    """Interquartile range of the values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    quartile_1, quartile_3 = stats.percentiles((25, 75))
+
+    return quartile_3 - quartile_1
+
+
+def _fast_kurtosis(stats: SummaryStats,
+                   method: int = 3,
+                   bias: bool = True,
+                   **kwargs) -> t.Any:
+    """Kurtosis of the values of ``stats``, as ``sum_kurtosis``."""
+    if (kwargs or not bias or method not in (1, 2, 3)
+            or stats.moments_are_degenerate()):
+        return NotImplemented
+
+    kurt_val = stats.central_moment(4) / stats.central_moment(2)**2 - 3.0
+
+    return adjust_kurtosis(kurt_val, num_vals=stats.values.size,
+                           method=method)
+
+
+def _fast_max(stats: SummaryStats, **kwargs) -> t.Any:
+    """Maximum of the values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    return stats.sorted_values[-1]
+
+
+def _fast_median(stats: SummaryStats, **kwargs) -> t.Any:
+    """Median of the values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    sorted_vals = stats.sorted_values
+    half_size = sorted_vals.size // 2
+
+    if sorted_vals.size % 2:
+        return sorted_vals[half_size]
+
+    return np.mean(sorted_vals[half_size - 1:half_size + 1])
+
+
+def _fast_min(stats: SummaryStats, **kwargs) -> t.Any:
+    """Minimum of the values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    return stats.sorted_values[0]
+
+
+def _fast_quantiles(stats: SummaryStats,
+                    package: str = "numpy",
+                    numpy_interpolation: str = "linear",
+                    **kwargs) -> t.Any:
+    """Minimum, quartiles and maximum of the values of ``stats``."""
+    kwargs.pop("scipy_alphap", None)
+    kwargs.pop("scipy_betap", None)
+
+    if kwargs or package != "numpy" or numpy_interpolation != "linear":
+        return NotImplemented
+
+    return stats.percentiles((0, 25, 50, 75, 100))
+
+
+def _fast_range(stats: SummaryStats, **kwargs) -> t.Any:
+    """Range (maximum minus minimum) of the values of ``stats``."""
+    if kwargs:
+        return NotImplemented
+
+    return stats.sorted_values[-1] - stats.sorted_values[0]
+
+
+def _fast_skewness(stats: SummaryStats,
+                   method: int = 3,
+                   bias: bool = True,
+                   **kwargs) -> t.Any:
+    """Skewness of the values of ``stats``, as ``sum_skewness``."""
+    if (kwargs or not bias or method not in (1, 2, 3)
+            or stats.moments_are_degenerate()):
+        return NotImplemented
+
+    skew_val = stats.central_moment(3) / stats.central_moment(2)**1.5
+
+    return adjust_skewness(skew_val, num_vals=stats.values.size,
+                           method=method)
+
+
+FAST_SUMMARY_METHODS = {
+    "mean": _fast_mean,
+    "sd": _fast_sd,
+    "var": _fast_var,
+    "count": _fast_count,
+    "iq_range": _fast_iq_range,
+    "kurtosis": _fast_kurtosis,
+    "max": _fast_max,
+    "median": _fast_median,
+    "min": _fast_min,
+    "quantiles": _fast_quantiles,
+    "range": _fast_range,
+    "skewness": _fast_skewness,
+}  # type: t.Dict[str, t.Callable[..., t.Any]]
+
+
+def call_summary(stats: SummaryStats,
+                 summary_name: str,
+                 summary_callable: t.Callable,
+                 summary_args: t.Optional[t.Dict[str, t.Any]] = None
+                 ) -> t.Any:
+    """Summarize the values of ``stats`` with the ``summary_name`` function.
+
+    The value is computed from the intermediate values of ``stats`` if the
+    summary function has an implementation in ``FAST_SUMMARY_METHODS`` and
+    it supports ``summary_args``. Otherwise, ``summary_callable`` is called.
+
+    Raises:
+        Any exception raised by ``summary_callable``.
+    """
+    if summary_args is None:
+        summary_args = {}
+
+    fast_callable = FAST_SUMMARY_METHODS.get(summary_name)
+
+    if fast_callable is not None and stats.is_regular:
+        metafeature = fast_callable(stats, **summary_args)
+
+        if metafeature is not NotImplemented:
+            return metafeature
+
+    return summary_callable(stats.values, **summary_args)
@@ -0,0 +1,185 @@
+"""A module dedicated to the instrumentation callbacks of MFE models.
+
+Callbacks are registered with the ``callbacks`` argument of ``MFE`` instan-
+tiation. Each callback may implement any of the hooks listed in ``HOOKS``,
+which receive a single :obj:`CallbackEvent` argument. Missing hooks are just
+skipped, so there is no need to inherit from :obj:`MFECallback`, which only
+provides no-op implementations of all hooks.
+
+The hooks are called for the following stages:
+
+    1. ``precompute``: every precomputation method, while fitting the data
+        (or while extracting the metafeatures, if ``lazy_precomp`` argument
+        of ``fit`` method is True).
+    2. ``feature``: every feature-extraction method. Methods whose results
+        are loaded from the cache (check ``cache_dir`` argument of ``MFE``)
+        do not trigger hooks.
+    3. ``summary``: every summary function applied to the values of a fea-
+        ture-extraction method.
+
+Hooks are called in the process of the model, also when the feature-ex-
+traction methods run in a pool of workers (in this case, the ``start`` hook
+is called when the method is submitted to the pool). The only exception is
+the parallel precomputation (check ``enable_parallel`` argument of ``fit``
+method), whose hooks are called from its worker threads.
+
+Attributes:
+    HOOKS (:obj:`tuple` of :obj:`str`): names of every available hook.
+
+    OUTCOMES (:obj:`tuple` of :obj:`str`): every possible ``outcome`` of the
+        events given to the ``end`` hooks.
+"""
+import typing as t
+
+import numpy as np
+
+HOOKS = (
+    "on_precompute_start",
+    "on_precompute_end",
+    "on_feature_start",
+    "on_feature_end",
+    "on_summary_start",
+    "on_summary_end",
+)
+
+OUTCOMES = (
+    "value",
+    "nan",
+    "error",
+    "timeout",
+)
+
+
+class CallbackEvent:  # pylint: disable=R0903
+    """Event given to the hooks of the instrumentation callbacks.
+
+    Attributes:
+        stage (:obj:`str`): one of ``precompute``, ``feature`` or ``summary``.
+
+        name (:obj:`str`): name of the method called. For summary functions,
+            it is in the form ``feature_name.summary_mtd_name``.
+
+        group (:obj:`str`, optional): metafeature group of the method (e.g.,
+            ``statistical``), or ``summary`` for summary functions.
+
+        shape (:obj:`tuple`, optional): shape of the main input of the me-
+            thod, which is the first one of ``N``, ``C`` or ``X`` used by
+            precomputation and feature-extraction methods, and the feature
+            values for summary functions.
+
+        wall_time (:obj:`float`, optional): wall time elapsed, in seconds.
+            :obj:`NoneType` for ``start`` events.
+
+        cpu_time (:obj:`float`, optional): CPU time elapsed by the process
+            which called the method, in seconds. :obj:`NoneType` for ``start``
+            events and methods timed out. Note that it also accounts any other
+            thread of the same process running at the same time.
+
+        outcome (:obj:`str`, optional): one of ``OUTCOMES``. :obj:`NoneType`
+            for ``start`` events.
+
+        value (:obj:`Any`, optional): return value of the method, if any.
+
+        error (:obj:`Exception`, optional): exception raised by the method
+            (and handled by the model), if any.
+    """
+
+    __slots__ = ("stage", "name", "group", "shape", "wall_time", "cpu_time",
+                 "outcome", "value", "error")
+
+    def __init__(self,
+                 stage: str,
+                 name: str,
+                 group: t.Optional[str] = None,
+                 shape: t.Optional[t.Tuple[int, ...]] = None,
+                 wall_time: t.Optional[float] = None,
+                 cpu_time: t.Optional[float] = None,
+                 outcome: t.Optional[str] = None,
+                 value: t.Any = None,
+                 error: t.Optional[BaseException] = None) -> None:
+        self.stage = stage
+        self.name = name
+        self.group = group
+        self.shape = shape
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.outcome = outcome
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        return "CallbackEvent({0})".format(", ".join(
+            "{0}={1!r}".format(attr, getattr(self, attr))
+            for attr in self.__slots__ if attr != "value"))
+
+
+class MFECallback:
+    """Base class of instrumentation callbacks with no-op hooks."""
+
+    def on_precompute_start(self, event: CallbackEvent) -> None:
+        """Called right before a precomputation method."""
+
+    def on_precompute_end(self, event: CallbackEvent) -> None:
+        """Called right after a precomputation method."""
+
+    def on_feature_start(self, event: CallbackEvent) -> None:
+        """Called right before a feature-extraction method."""
+
+    def on_feature_end(self, event: CallbackEvent) -> None:
+        """Called right after a feature-extraction method."""
+
+    def on_summary_start(self, event: CallbackEvent) -> None:
+        """Called right before a summary function."""
+
+    def on_summary_end(self, event: CallbackEvent) -> None:
+        """Called right after a summary function."""
+
+
+def notify(callbacks: t.Sequence[t.Any], hook_name: str,
+           event: CallbackEvent) -> None:
+    """Call the hook ``hook_name`` of every callback which implements it."""
+    for callback in callbacks:
+        hook = getattr(callback, hook_name, None)
+
+        if hook is not None:
+            hook(event)
+
+
+def get_outcome(value: t.Any,
+                error: t.Optional[BaseException] = None) -> str:
+    """Get the ``outcome`` of an event from the method return value."""
+    if error is not None:
+        return "error"
+
+    if np.isscalar(value) and isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return "nan"
+
+    return "value"
+
+
+def get_input_shape(
+        mtd_args: t.Mapping[str, t.Any],
+        arg_names: t.Optional[t.Iterable[str]] = None,
+) -> t.Optional[t.Tuple[int, ...]]:
+    """Get the shape of the first of ``N``, ``C`` or ``X`` in ``mtd_args``.
+
+    Args:
+        mtd_args (:obj:`Mapping`): arguments of the method.
+
+        arg_names (:obj:`Iterable` of :obj:`str`, optional): if given, only
+            consider these arguments of ``mtd_args``.
+    """
+    if arg_names is not None:
+        arg_names = frozenset(arg_names)
+
+    for key in ("N", "C", "X"):
+        if arg_names is not None and key not in arg_names:
+            continue
+
+        data = mtd_args.get(key)
+
+        if data is not None:
+            return np.shape(data)
+
+    return None
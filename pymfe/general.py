@@ -12,6 +12,8 @@ References:
 import typing as t
 import numpy as np
 
+import pymfe._codes as _codes
+
 
 class MFEGeneral:
     """Keep methods for metafeatures of ``General``/``Simple`` group.
@@ -57,6 +59,30 @@ class MFEGeneral:
     method of module ``landmarking``).
     """
 
+    # All general metafeatures are cheap to compute, so there is no reason
+    # to copy the fitted data to another process to extract them. Check the
+    # ``parallel_backend`` argument of MFE ``extract`` method.
+    THREAD_FRIENDLY_MTDS = frozenset((
+        "ft_attr_to_inst",
+        "ft_cat_to_num",
+        "ft_freq_class",
+        "ft_inst_to_attr",
+        "ft_nr_attr",
+        "ft_nr_bin",
+        "ft_nr_cat",
+        "ft_nr_class",
+        "ft_nr_inst",
+        "ft_nr_num",
+        "ft_num_to_cat",
+    ))  # type: t.FrozenSet[str]
+
+    # Precomputed keys produced by each precomputation method. The consumed
+    # keys are the named arguments of the method itself.
+    PRECOMPUTE_PRODUCES = {
+        "precompute_general_class": ("classes", "class_freqs"),
+        "precompute_general_attr": ("attr_num_distinct", ),
+    }  # type: t.Dict[str, t.Tuple[str, ...]]
+
     @classmethod
     def precompute_general_class(cls,
                                  y: t.Optional[np.ndarray] = None,
@@ -87,6 +113,79 @@ class MFEGeneral:
 
         return precomp_vals
 
+    @classmethod
+    def precompute_general_attr(
+            cls,
+            X: t.Optional[np.ndarray] = None,
+            cat_cols: t.Optional[t.Sequence[int]] = None,
+            cat_cardinalities: t.Optional[np.ndarray] = None,
+            attr_num_distinct: t.Optional[np.ndarray] = None,
+            **kwargs) -> t.Dict[str, t.Any]:
+        """Precompute the number of distinct values of each attribute.
+
+        Args:
+            X (:obj:`np.ndarray`, optional): attributes from fitted data.
+
+            cat_cols (:obj:`Sequence` of :obj:`int`, optional): indexes of the
+                categorical attributes of ``X``.
+
+            cat_cardinalities (:obj:`np.ndarray`, optional): number of dis-
+                tinct values of each categorical attribute, in the same order
+                of ``cat_cols``, counted while fitting the data.
+
+            attr_num_distinct (:obj:`np.ndarray`, optional): number of dis-
+                tinct values of each attribute in ``X``, if already counted
+                while inferring the categorical attributes (check ``fit``
+                method, ``check_bool`` argument). If given, the attributes
+                are not counted again.
+
+            **kwargs: additional arguments. May have previously precomputed be-
+                fore this method from other precomputed methods, so they can
+                help speed up this precomputation.
+
+        Return:
+            dict: with following precomputed items:
+                - ``attr_num_distinct`` (:obj:`np.ndarray`): number of distinct
+                    values of each attribute in ``X``, if ``X`` is not :obj:`-
+                    NoneType`.
+        """
+        precomp_vals = {}
+
+        if X is not None:
+            if attr_num_distinct is None:
+                attr_num_distinct = MFEGeneral._count_distinct(
+                    X, cat_cols=cat_cols, cat_cardinalities=cat_cardinalities)
+
+            precomp_vals["attr_num_distinct"] = attr_num_distinct
+
+        return precomp_vals
+
+    @classmethod
+    def _count_distinct(
+            cls,
+            X: np.ndarray,
+            cat_cols: t.Optional[t.Sequence[int]] = None,
+            cat_cardinalities: t.Optional[np.ndarray] = None) -> np.ndarray:
+        """Count the distinct values of each attribute in ``X``.
+
+        The categorical attributes are not counted again if its cardinali-
+        ties are given (check ``precompute_general_attr``).
+        """
+        _, num_col = X.shape
+
+        attr_num_distinct = np.zeros(num_col, dtype=int)
+        known_cols = np.zeros(num_col, dtype=bool)
+
+        if cat_cols is not None and cat_cardinalities is not None:
+            cat_cols = list(cat_cols)
+            attr_num_distinct[cat_cols] = cat_cardinalities[:len(cat_cols)]
+            known_cols[cat_cols] = True
+
+        for ind in np.flatnonzero(~known_cols):
+            attr_num_distinct[ind] = _codes.count_distinct(X[:, ind])
+
+        return attr_num_distinct
+
     @classmethod
     def ft_attr_to_inst(cls, X: np.ndarray) -> int:
         """Returns ration between the number of attributes and instances.
@@ -145,12 +244,20 @@ class MFEGeneral:
         return X.shape[1]
 
     @classmethod
-    def ft_nr_bin(cls, X: np.ndarray) -> int:
-        """Returns the number of binary attributes."""
-        bin_cols = np.apply_along_axis(
-            func1d=lambda col: np.unique(col).size == 2, axis=0, arr=X)
+    def ft_nr_bin(cls,
+                  X: np.ndarray,
+                  attr_num_distinct: t.Optional[np.ndarray] = None) -> int:
+        """Returns the number of binary attributes.
+
+        Args:
+            attr_num_distinct (:obj:`np.ndarray`, optional): number of dis-
+                tinct values of each attribute in ``X``. This argument purpose
+                is mainly for benefit from precomputations.
+        """
+        if attr_num_distinct is None:
+            attr_num_distinct = MFEGeneral._count_distinct(X)
 
-        return sum(bin_cols)
+        return int(np.sum(attr_num_distinct == 2))
 
     @classmethod
     def ft_nr_cat(cls, cat_cols: t.Sequence[int]) -> int:
@@ -12,9 +12,10 @@ References:
 import typing as t
 import itertools
 
-import pandas as pd
 import numpy as np
-import scipy
+import scipy.stats
+
+import pymfe._codes as _codes
 
 
 class MFEInfoTheory:
@@ -61,6 +62,31 @@ class MFEInfoTheory:
     method of module ``landmarking``).
     """
 
+    # Entropy-based methods and the class concentration coefficients usually
+    # just read precomputed values, so they are run in threads by the
+    # ``auto`` parallel backend. The attribute concentration coefficients
+    # build one contingency table per column pair in a Python loop, so they
+    # are left to worker processes.
+    THREAD_FRIENDLY_MTDS = frozenset((
+        "ft_attr_ent",
+        "ft_class_conc",
+        "ft_class_ent",
+        "ft_eq_num_attr",
+        "ft_joint_ent",
+        "ft_mut_inf",
+        "ft_ns_ratio",
+    ))  # type: t.FrozenSet[str]
+
+    # ``precompute_entropy`` consumes ``class_freqs`` and ``cont_tables`` (its
+    # arguments), so it is always scheduled after ``precompute_class_freq``
+    # and ``precompute_cont_tables``.
+    PRECOMPUTE_PRODUCES = {
+        "precompute_class_freq": ("class_freqs", ),
+        "precompute_cont_tables": ("cont_tables", ),
+        "precompute_entropy": ("class_ent", "attr_ent", "joint_ent",
+                               "mut_inf"),
+    }  # type: t.Dict[str, t.Tuple[str, ...]]
+
     @classmethod
     def precompute_class_freq(cls, y: t.Optional[np.ndarray] = None,
                               **kwargs) -> t.Dict[str, t.Any]:
@@ -89,11 +115,53 @@ class MFEInfoTheory:
 
         return precomp_vals
 
+    @classmethod
+    def precompute_cont_tables(
+            cls,
+            y: t.Optional[np.ndarray] = None,
+            C: t.Optional[np.ndarray] = None,
+            cat_cardinalities: t.Optional[np.ndarray] = None,
+            **kwargs) -> t.Dict[str, t.Any]:
+        """Precompute the contingency table between each attribute and class.
+
+        Args:
+            y (:obj:`np.ndarray`, optional): the target attribute vector.
+
+            C (:obj:`np.ndarray`, optional): categorical attributes from fitted
+                data.
+
+            cat_cardinalities (:obj:`np.ndarray`, optional): number of distinct
+                codes of each attribute in ``C``, if ``C`` holds the integer
+                codes of the fitted data.
+
+            **kwargs: additional arguments. May have previously precomputed be-
+                fore this method from other precomputed methods, so they can
+                help speed up this precomputation.
+
+        Return:
+            dict: with following precomputed items:
+
+                - ``cont_tables`` (:obj:`list` of :obj:`np.ndarray`): absolute
+                    frequency of each pair of distinct values of an attribute
+                    in ``C`` (rows) and of ``y`` (columns), if both are not
+                    :obj:`NoneType`. Check ``_class_cont_tables`` method.
+        """
+        precomp_vals = {}
+
+        if (y is not None and C is not None and C.size
+                and "cont_tables" not in kwargs):
+            precomp_vals["cont_tables"] = MFEInfoTheory._class_cont_tables(
+                C, y, cat_cardinalities=cat_cardinalities)
+
+        return precomp_vals
+
     @classmethod
     def precompute_entropy(cls,
                            y: t.Optional[np.ndarray] = None,
                            C: t.Optional[np.ndarray] = None,
                            class_freqs: t.Optional[np.ndarray] = None,
+                           cont_tables: t.Optional[
+                               t.List[np.ndarray]] = None,
                            **kwargs) -> t.Dict[str, t.Any]:
         """Precompute various values related to Shannon's Entropy.
 
@@ -106,6 +174,9 @@ class MFEInfoTheory:
             class_freqs (:obj:`np.ndarray`, optional): absolute frequency of
                 each distinct class in ``y``.
 
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and ``y``.
+
             **kwargs: additional arguments. May have previously precomputed be-
                 fore this method from other precomputed methods, so they can
                 help speed up this precomputation.
@@ -134,12 +205,13 @@ class MFEInfoTheory:
                 y, class_freqs=class_freqs)
 
         if C is not None and C.size and "attr_ent" not in kwargs:
-            precomp_vals["attr_ent"] = MFEInfoTheory.ft_attr_ent(C)
+            precomp_vals["attr_ent"] = MFEInfoTheory.ft_attr_ent(
+                C, cont_tables=cont_tables)
 
         if y is not None and C is not None and C.size:
             if "joint_ent" not in kwargs:
-                precomp_vals["joint_ent"] = np.apply_along_axis(
-                    func1d=MFEInfoTheory._joint_ent, axis=0, arr=C, vec_y=y)
+                precomp_vals["joint_ent"] = MFEInfoTheory.ft_joint_ent(
+                    C, y, cont_tables=cont_tables)
 
             if "mut_inf" not in kwargs:
                 precomp_vals["mut_inf"] = MFEInfoTheory.ft_mut_inf(
@@ -151,6 +223,133 @@ class MFEInfoTheory:
 
         return precomp_vals
 
+    @classmethod
+    def update_entropy(
+            cls,
+            C: np.ndarray,
+            y: np.ndarray,
+            num_inst_prev: int,
+            cat_cardinalities: t.Optional[np.ndarray] = None,
+            class_freqs: t.Optional[np.ndarray] = None,
+            cont_tables: t.Optional[t.Tuple[np.ndarray,
+                                            t.List[np.ndarray]]] = None,
+            epsilon: float = 1.0e-10,
+    ) -> t.Tuple[t.Dict[str, t.Any], t.Tuple[np.ndarray, t.List[np.ndarray]]]:
+        """Update the entropy-related values of appended rows.
+
+        The contingency table between each attribute in ``C`` and ``y`` is
+        kept, so only the new instances are counted and merged into it. Only
+        the classes of the new instances are factorized, and its codes are
+        mapped to the distinct classes of the previous instances. All
+        entropies are then calculated from these tables, with the same values
+        of ``precompute_entropy`` method.
+
+        Args:
+            C (:obj:`np.ndarray`): categorical attributes of all instances,
+                with the previous instances first. The codes of the previous
+                instances must be the same used to build ``cont_tables``.
+
+            y (:obj:`np.ndarray`): target attribute of all instances.
+
+            num_inst_prev (:obj:`int`): number of previous instances.
+
+            cat_cardinalities (:obj:`np.ndarray`, optional): number of dis-
+                tinct codes of each attribute in ``C``, if ``C`` holds the in-
+                teger codes of the fitted data. Otherwise, ``C`` is factorized
+                first.
+
+            class_freqs (:obj:`np.ndarray`, optional): absolute frequency of
+                each distinct class in ``y`` (all instances). If :obj:`None-
+                Type`, it is taken from the contingency tables.
+
+            cont_tables (:obj:`tuple`, optional): distinct classes and contin-
+                gency tables of the previous instances, as returned by the
+                last call of this method. If :obj:`NoneType`, the tables are
+                built from all instances.
+
+            epsilon (:obj:`float`, optional): tiny numeric value added to the
+                joint probabilities, as in ``_joint_ent`` method.
+
+        Returns:
+            tuple(dict, tuple): the first field has the ``class_freqs``, ``cl-
+                ass_ent``, ``attr_ent``, ``joint_ent``, ``mut_inf`` and ``co-
+                nt_tables`` values of all instances (check ``precompute_ent-
+                ropy`` and ``precompute_cont_tables`` documentation). The se-
+                cond field has the distinct classes and contingency tables of
+                all instances, to be given as ``cont_tables`` in the next up-
+                date.
+        """
+        codes, cat_cardinalities = _codes.as_codes(C, cat_cardinalities)
+
+        if cont_tables is None:
+            classes, class_codes = np.unique(y, return_inverse=True)
+
+            new_tables = _codes.contingency_tables(
+                codes, cat_cardinalities, class_codes.ravel(), classes.size)
+
+        else:
+            classes_prev, tables_prev = cont_tables
+
+            classes_new, class_codes = np.unique(y[num_inst_prev:],
+                                                 return_inverse=True)
+
+            # New classes may be sorted between the previous ones
+            classes = np.union1d(classes_prev, classes_new)
+            class_codes = np.searchsorted(classes,
+                                          classes_new)[class_codes.ravel()]
+
+            new_tables = _codes.contingency_tables(
+                codes[num_inst_prev:], cat_cardinalities, class_codes,
+                classes.size)
+
+            class_inds = np.searchsorted(classes, classes_prev)
+
+            for table, table_prev in zip(new_tables, tables_prev):
+                table[:table_prev.shape[0], class_inds] += table_prev
+
+        if class_freqs is None:
+            class_freqs = new_tables[0].sum(axis=0)
+
+        class_ent = MFEInfoTheory._entropy(y, value_freqs=class_freqs)
+        attr_ent = MFEInfoTheory.ft_attr_ent(codes, cont_tables=new_tables)
+
+        joint_ent = np.array([
+            MFEInfoTheory._joint_ent(table, epsilon=epsilon)
+            for table in new_tables
+        ])
+
+        entropy_vals = {
+            "class_freqs": class_freqs,
+            "class_ent": class_ent,
+            "attr_ent": attr_ent,
+            "joint_ent": joint_ent,
+            "mut_inf": attr_ent + class_ent - joint_ent,
+            "cont_tables": new_tables,
+        }
+
+        return entropy_vals, (classes, new_tables)
+
+    @classmethod
+    def _class_cont_tables(
+            cls,
+            C: np.ndarray,
+            y: np.ndarray,
+            cat_cardinalities: t.Optional[np.ndarray] = None,
+    ) -> t.List[np.ndarray]:
+        """Build the contingency table between each attribute and class.
+
+        Every table is counted from the integer codes of ``C`` and ``y``
+        with a single ``np.bincount`` (check ``_codes.contingency_tables``),
+        so ``C`` is factorized first only if it is not made of codes yet.
+        The rows of each table are the distinct values of the attribute, and
+        its columns are the distinct classes.
+        """
+        codes, cat_cardinalities = _codes.as_codes(C, cat_cardinalities)
+        class_codes, num_classes = _codes.factorize_col(np.asarray(y))
+
+        return _codes.contingency_tables(codes, cat_cardinalities,
+                                         class_codes, num_classes)
+
     @classmethod
     def _entropy(cls,
                  values: t.Union[np.ndarray, t.List],
@@ -160,72 +359,91 @@ class MFEInfoTheory:
         Check ``ft_attr_ent`` and ``ft_class_ent`` methods for more informa-
         tion.
 
+        If ``values`` are integer codes (e.g., the fitted categorical data
+        ``C``), its frequencies are counted with ``np.bincount``.
+
         Args:
             value_freqs (:obj:`np.ndarray`, optional): absolute frequency of
                 each distinct value in ``values``. This argument is meant to
                 exploit precomputations.
         """
         if value_freqs is None:
-            _, value_freqs = np.unique(values, return_counts=True)
+            value_freqs = _codes.value_counts(np.asarray(values))
 
         return scipy.stats.entropy(value_freqs, base=2)
 
     @classmethod
     def _joint_ent(cls,
-                   vec_x: np.ndarray,
-                   vec_y: np.ndarray,
+                   cont_table: np.ndarray,
                    epsilon: float = 1.0e-10) -> float:
-        """Compute joint entropy between vectorx ``x`` and ``y``."""
-        joint_prob_mat = pd.crosstab(
-            vec_y, vec_x, normalize=True).values + epsilon
+        """Compute joint entropy from the contingency table of two vectors."""
+        joint_prob_mat = cont_table / cont_table.sum() + epsilon
 
-        joint_ent = np.multiply(joint_prob_mat,
-                                np.log2(joint_prob_mat)).sum().sum()
+        joint_ent = np.multiply(joint_prob_mat, np.log2(joint_prob_mat)).sum()
 
         return -1.0 * joint_ent
 
     @classmethod
     def _conc(cls,
-              vec_x: np.ndarray,
-              vec_y: np.ndarray,
+              cont_table: np.ndarray,
               epsilon: float = 1.0e-10) -> float:
-        """Concentration coefficient between two arrays ``vec_x`` and ``vec_y``.
+        """Concentration coefficient from the contingency table of two arrays.
 
-        Used for methods ``ft_class_conc`` and ``ft_attr_conc``.
+        The rows of ``cont_table`` are the distinct values of the first ar-
+        ray, and its columns are the distinct values of the second one. Used
+        for methods ``ft_class_conc`` and ``ft_attr_conc``.
 
         Args:
             epsilon (:obj:`float`, optional): tiny numeric value to avoid divi-
                 sion by zero.
         """
-        pij = pd.crosstab(vec_x, vec_y, normalize=True).values + epsilon
+        pij = cont_table / cont_table.sum() + epsilon
 
         isum = pij.sum(axis=0)
-        jsum2 = sum(pij.sum(axis=1)**2.0)
+        jsum2 = np.sum(pij.sum(axis=1)**2.0)
 
-        conc = ((
-            (pij**2.0 / isum).sum().sum() - jsum2) / (1.0 - jsum2 + epsilon))
+        conc = (((pij**2.0 / isum).sum() - jsum2) / (1.0 - jsum2 + epsilon))
 
         return conc
 
     @classmethod
-    def ft_attr_conc(cls, C: np.ndarray) -> np.ndarray:
-        """Compute concentration coef. of each pair of distinct attributes."""
+    def ft_attr_conc(
+            cls,
+            C: np.ndarray,
+            cat_cardinalities: t.Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute concentration coef. of each pair of distinct attributes.
 
-        _, num_col = C.shape
+        Each contingency table is counted once for both orders of the pair.
+
+        Args:
+            cat_cardinalities (:obj:`np.ndarray`, optional): number of dis-
+                tinct codes of each attribute in ``C``, if ``C`` holds the in-
+                teger codes of the fitted data. Otherwise, ``C`` is factorized
+                first.
+        """
+        codes, cat_cardinalities = _codes.as_codes(C, cat_cardinalities)
 
-        col_permutations = itertools.permutations(range(num_col), 2)
+        _, num_col = codes.shape
 
-        attr_conc = np.array([
-            MFEInfoTheory._conc(C[:, col_a], C[:, col_b])
-            for col_a, col_b in col_permutations
-        ])
+        attr_conc = np.zeros((num_col, num_col), dtype=float)
+
+        for col_a, col_b in itertools.combinations(range(num_col), 2):
+            cont_table = _codes.contingency_table(
+                codes[:, col_a], codes[:, col_b], cat_cardinalities[col_a],
+                cat_cardinalities[col_b])
 
-        return attr_conc
+            attr_conc[col_a, col_b] = MFEInfoTheory._conc(cont_table)
+            attr_conc[col_b, col_a] = MFEInfoTheory._conc(cont_table.T)
+
+        # Same order of 'itertools.permutations(range(num_col), 2)'
+        return attr_conc[~np.eye(num_col, dtype=bool)]
 
     @classmethod
-    def ft_attr_ent(cls,
-                    C: np.ndarray,
-                    attr_ent: t.Optional[np.ndarray] = None) -> np.ndarray:
+    def ft_attr_ent(
+            cls,
+            C: np.ndarray,
+            attr_ent: t.Optional[np.ndarray] = None,
+            cont_tables: t.Optional[t.List[np.ndarray]] = None) -> np.ndarray:
         """Calculates Shannon's entropy for each predictive attribute.
 
         The Shannon's Entropy H of a vector x is defined as:
@@ -240,10 +458,21 @@ class MFEInfoTheory:
             attr_ent (:obj:`np.ndarray`, optional): this argument is this me-
                 thod own return value, meant to exploit possible attribute en-
                 tropy precomputations.
+
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and the target
+                attribute. If given, the frequencies of each attribute are
+                taken from it.
         """
         if attr_ent is not None:
             return attr_ent
 
+        if cont_tables:
+            return np.array([
+                scipy.stats.entropy(table.sum(axis=1), base=2)
+                for table in cont_tables
+            ])
+
         try:
             return np.apply_along_axis(
                 func1d=MFEInfoTheory._entropy, axis=0, arr=C)
@@ -252,15 +481,27 @@ class MFEInfoTheory:
             return np.array([np.nan])
 
     @classmethod
-    def ft_class_conc(cls, C: np.ndarray, y: np.ndarray) -> np.ndarray:
-        """Compute concentration coefficient between each attr. and class."""
-        return np.apply_along_axis(
-            func1d=MFEInfoTheory._conc, axis=0, arr=C, vec_y=y)
+    def ft_class_conc(
+            cls,
+            C: np.ndarray,
+            y: np.ndarray,
+            cont_tables: t.Optional[t.List[np.ndarray]] = None) -> np.ndarray:
+        """Compute concentration coefficient between each attr. and class.
+
+        Args:
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and ``y``. This
+                argument purpose is mainly for benefit from precomputations.
+        """
+        if cont_tables is None:
+            cont_tables = MFEInfoTheory._class_cont_tables(C, y)
+
+        return np.array([MFEInfoTheory._conc(table) for table in cont_tables])
 
     @classmethod
     def ft_class_ent(cls,
                      y: np.ndarray,
-                     class_ent: t.Optional[np.ndarray] = None,
+                     class_ent: t.Optional[float] = None,
                      class_freqs: t.Optional[np.ndarray] = None) -> float:
         """Calculates target attribute Shannon's entropy.
 
@@ -291,9 +532,11 @@ class MFEInfoTheory:
                        C: np.ndarray,
                        y: np.ndarray,
                        epsilon: float = 1.0e-10,
-                       class_ent: t.Optional[np.ndarray] = None,
+                       class_ent: t.Optional[float] = None,
                        class_freqs: t.Optional[np.ndarray] = None,
-                       mut_inf: t.Optional[np.ndarray] = None) -> float:
+                       mut_inf: t.Optional[np.ndarray] = None,
+                       cont_tables: t.Optional[t.List[np.ndarray]] = None
+                       ) -> float:
         """Number of attributes equivalent for a predictive task.
 
         The attribute equivalence E is defined as:
@@ -322,12 +565,17 @@ class MFEInfoTheory:
                 ploit the precomputations of mutual information. If this argu-
                 ment value is :obj:`NoneType`, then it is calculated using the
                 method ``ft_mut_int``.
+
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and ``y``, used
+                if ``mut_inf`` is :obj:`NoneType`.
         """
         if class_ent is None:
             class_ent = MFEInfoTheory.ft_class_ent(y, class_freqs=class_freqs)
 
         if mut_inf is None:
-            mut_inf = MFEInfoTheory.ft_mut_inf(C, y)
+            mut_inf = MFEInfoTheory.ft_mut_inf(
+                C, y, class_ent=class_ent, cont_tables=cont_tables)
 
         _, num_col = C.shape
 
@@ -337,7 +585,9 @@ class MFEInfoTheory:
     def ft_joint_ent(cls,
                      C: np.ndarray,
                      y: np.ndarray,
-                     joint_ent: t.Optional[np.ndarray] = None) -> np.ndarray:
+                     joint_ent: t.Optional[np.ndarray] = None,
+                     cont_tables: t.Optional[t.List[np.ndarray]] = None
+                     ) -> np.ndarray:
         """Calculate the joint entropy between each attribute and class.
 
         The Joint Entropy H between a predictive attribute x and target attri-
@@ -358,12 +608,20 @@ class MFEInfoTheory:
             joint_ent (:obj:`np.ndarray`, optional): this argument is this me-
                 thod own return value, meant to exploit possible joint entropy
                 precomputations.
+
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and ``y``, whose
+                cells are the absolute frequencies of each ``p_i_j``. If :obj:`-
+                NoneType`, the tables are counted from ``C`` and ``y``.
         """
-        if joint_ent is None:
-            joint_ent = np.apply_along_axis(
-                func1d=MFEInfoTheory._joint_ent, axis=0, arr=C, vec_y=y)
+        if joint_ent is not None:
+            return joint_ent
+
+        if cont_tables is None:
+            cont_tables = MFEInfoTheory._class_cont_tables(C, y)
 
-        return joint_ent
+        return np.array(
+            [MFEInfoTheory._joint_ent(table) for table in cont_tables])
 
     @classmethod
     def ft_mut_inf(cls,
@@ -373,7 +631,9 @@ class MFEInfoTheory:
                    attr_ent: t.Optional[np.ndarray] = None,
                    class_ent: t.Optional[float] = None,
                    joint_ent: t.Optional[np.ndarray] = None,
-                   class_freqs: t.Optional[np.ndarray] = None) -> np.ndarray:
+                   class_freqs: t.Optional[np.ndarray] = None,
+                   cont_tables: t.Optional[t.List[np.ndarray]] = None
+                   ) -> np.ndarray:
         """Mutual information between each attribute in ``C`` and target ``y``.
 
         The mutual Information MI between an independent attribute ``x`` and
@@ -404,6 +664,12 @@ class MFEInfoTheory:
                 independent attribute in ``N`` and target attribute ``y``. If
                 :obj:`NoneType`, this argument is calculated using the method
                 ``ft_joint_ent``.
+
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and ``y``. Both
+                ``attr_ent`` and ``joint_ent`` are calculated from it, if they
+                are :obj:`NoneType`. If this argument is also :obj:`NoneType`,
+                the tables are counted only once from ``C`` and ``y``.
         """
         if mut_inf is not None:
             return mut_inf
@@ -411,11 +677,15 @@ class MFEInfoTheory:
         if class_ent is None:
             class_ent = MFEInfoTheory.ft_class_ent(y, class_freqs=class_freqs)
 
+        if joint_ent is None and cont_tables is None:
+            cont_tables = MFEInfoTheory._class_cont_tables(C, y)
+
         if attr_ent is None:
-            attr_ent = MFEInfoTheory.ft_attr_ent(C)
+            attr_ent = MFEInfoTheory.ft_attr_ent(C, cont_tables=cont_tables)
 
         if joint_ent is None:
-            joint_ent = MFEInfoTheory.ft_joint_ent(C, y)
+            joint_ent = MFEInfoTheory.ft_joint_ent(
+                C, y, cont_tables=cont_tables)
 
         return attr_ent + class_ent - joint_ent
 
@@ -425,7 +695,9 @@ class MFEInfoTheory:
                     y: np.ndarray,
                     epsilon: float = 1.0e-10,
                     attr_ent: t.Optional[np.ndarray] = None,
-                    mut_inf: t.Optional[np.ndarray] = None) -> float:
+                    mut_inf: t.Optional[np.ndarray] = None,
+                    cont_tables: t.Optional[t.List[np.ndarray]] = None
+                    ) -> float:
         """Compute the noisiness of attributes.
 
         Let ``y`` be a target attribute and ``x`` one predictive attribute in
@@ -452,12 +724,20 @@ class MFEInfoTheory:
                 ploit the precomputations of mutual information. If this argu-
                 ment value is :obj:`NoneType`, then it is calculated using the
                 method ``ft_mut_int``.
+
+            cont_tables (:obj:`list` of :obj:`np.ndarray`, optional): contin-
+                gency table between each attribute in ``C`` and ``y``, used
+                if ``attr_ent`` or ``mut_inf`` are :obj:`NoneType`.
         """
+        if mut_inf is None and cont_tables is None:
+            cont_tables = MFEInfoTheory._class_cont_tables(C, y)
+
         if attr_ent is None:
-            attr_ent = MFEInfoTheory.ft_attr_ent(C)
+            attr_ent = MFEInfoTheory.ft_attr_ent(C, cont_tables=cont_tables)
 
         if mut_inf is None:
-            mut_inf = MFEInfoTheory.ft_mut_inf(C, y)
+            mut_inf = MFEInfoTheory.ft_mut_inf(
+                C, y, attr_ent=attr_ent, cont_tables=cont_tables)
 
         ent_attr = sum(attr_ent)
         mut_inf = sum(mut_inf)
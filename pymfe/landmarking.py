@@ -63,6 +63,14 @@ class MFELandmarking:
     method of module ``landmarking``).
     """
 
+    # Landmarking methods are dominated by Python-level cross-validation loops
+    # and estimator fits, so none of them is hinted to run within threads.
+    THREAD_FRIENDLY_MTDS = frozenset()  # type: t.FrozenSet[str]
+
+    PRECOMPUTE_PRODUCES = {
+        "precompute_landmarking_class": ("skf", ),
+    }  # type: t.Dict[str, t.Tuple[str, ...]]
+
     @classmethod
     def precompute_landmarking_class(cls, N: np.ndarray, y: np.ndarray,
                                      folds: int, random_state: t.Optional[int],
@@ -1,20 +1,70 @@
 """Main module for extracting metafeatures from datasets.
 
 Todo:
-    * Implement parallel computing.
     * By-class feature extraction.
     * Support for multiclass, regression and unsupervised tasks.
 """
 import typing as t
+import os
+import time
+import warnings
+import multiprocessing
+import multiprocessing.connection
 import collections
+import contextlib
+import concurrent.futures
+import copy as _copy
+import itertools
 
 import numpy as np
 
 import pymfe._internal as _internal
+import pymfe._summary as _summary
+import pymfe._codes as _codes
+import pymfe._cache as _cache
+import pymfe.callbacks as _callbacks
+from pymfe.result import MFEResult
 
 _TypeSeqExt = t.Sequence[t.Tuple[str, t.Callable, t.Sequence]]
 """Type annotation for a sequence of TypeExtMtdTuple objects."""
 
+_TypeRunningProc = t.Tuple[str, multiprocessing.Process, float, t.Callable,
+                           t.Dict[str, t.Any]]
+"""Type annotation for a feature method running in its own process."""
+
+_TypeFeatResults = t.Tuple[t.List[str], np.ndarray, np.ndarray]
+"""Type annotation for the names, values and times of extracted values."""
+
+_TypeFeatResultsStatus = t.Tuple[t.List[str], np.ndarray, np.ndarray, bool]
+"""Type annotation for extracted values, and whether they timed out."""
+
+_TypeGatheredResults = t.Tuple[t.List[str], np.ndarray, np.ndarray,
+                               np.ndarray]
+"""Type annotation for extracted values, and which of them timed out."""
+
+_TIMED_OUT = object()
+"""Placeholder for the value of feature-extraction methods timed out."""
+
+
+def _run_feature_method_in_process(
+        conn: multiprocessing.connection.Connection,
+        mtd_name: str,
+        mtd_binding: t.Dict[str, t.Any],
+        mtd_callable: t.Callable,
+        suppress_warnings: bool = False) -> None:
+    """Send the value and times elapsed by a feature method through ``conn``.
+
+    The method arguments are bound by the process itself from ``mtd_bind-
+    ing`` (check ``_internal.bind_mtd_kwargs``), so lazily precomputed va-
+    lues are evaluated within the deadline of the method. Check ``_inter-
+    nal.timeit_feat_value`` for the values sent.
+    """
+    mtd_args = _internal.bind_mtd_kwargs(**mtd_binding)
+
+    conn.send(_internal.timeit_feat_value(mtd_name, mtd_args, mtd_callable,
+                                          suppress_warnings))
+    conn.close()
+
 
 class MFE:
     """Core class for metafeature extraction.
@@ -24,6 +74,16 @@ class MFE:
 
         y (:obj:`Sequence`): target attributes of the dataset.
 
+        precomp_updated (:obj:`tuple` of :obj:`str`): names of the precom-
+            puted values incrementally updated by the last ``partial_fit``
+            call. Every other precomputed value was recomputed from all the
+            fitted data. Empty after ``fit``.
+
+        fingerprint (:obj:`str`): deterministic content hash of the fitted
+            dataset, computed by the ``fit`` method. Datasets with the same
+            values and the same numeric/categorical columns have the same
+            fingerprint, so it may be used to identify datasets across runs.
+
         groups (:obj:`tuple` of :obj:`str`): tuple object containing fitted
             metafeature groups loaded in the model at instantiation.
 
@@ -35,6 +95,10 @@ class MFE:
             mary functions names for features summarization.
     """
 
+    # Set only within the worker processes of ``extract_many``, by the pool
+    # initializer, so the template model is not pickled for every dataset
+    _worker_model = None  # type: t.Optional[MFE]
+
     def __init__(self,
                  groups: t.Union[str, t.Iterable[str]] = "all",
                  features: t.Union[str, t.Iterable[str]] = "all",
@@ -44,7 +108,11 @@ class MFE:
                  score="accuracy",
                  folds=10,
                  suppress_warnings: bool = False,
-                 random_state: t.Optional[int] = None) -> None:
+                 random_state: t.Optional[int] = None,
+                 n_jobs: t.Optional[int] = None,
+                 cache_dir: t.Optional[str] = None,
+                 cache_max_size: t.Optional[int] = None,
+                 callbacks: t.Optional[t.Iterable[t.Any]] = None) -> None:
         """This class provides easy access for metafeature extraction from datasets.
 
         It expected that user first calls `fit` method after instantiation and
@@ -152,6 +220,41 @@ class MFE:
             suppress_warnings (:obj:`bool`, optional): if True, then ignore all
                 warnings invoked at the instantiation time.
 
+            random_state (:obj:`int`, optional): seed of the random number ge-
+                nerator used by random-dependent metafeatures.
+
+            n_jobs (:obj:`int`, optional): maximum number of workers used when
+                the parallel metafeature extraction is enabled (see ``enable_-
+                parallel`` argument of ``extract`` method). If :obj:`NoneType`,
+                then the number of processors of the machine is used.
+
+            cache_dir (:obj:`str`, optional): path of a directory used as a
+                persistent cache of the extracted metafeatures. If :obj:`None-
+                Type`, no cache is used. The results of every feature-extrac-
+                tion method (already summarized) are cached separately, keyed
+                by a content hash of the fitted data, the ``fit`` method op-
+                tions, the selected summary functions, the user custom argu-
+                ments and the ``folds``, ``score``, ``random_state`` and
+                ``measure_time`` options. Hence, a later extraction with the
+                same setup only computes the metafeatures not cached yet. Note
+                that the times of cached metafeatures are the ones measured
+                when they were first extracted.
+
+            cache_max_size (:obj:`int`, optional): maximum size, in bytes, of
+                the cache directory. The least recently used entries are re-
+                moved when this size is exceeded. If :obj:`NoneType`, the ca-
+                che size is unlimited.
+
+            callbacks (:obj:`Iterable`, optional): instrumentation callbacks
+                notified around every precomputation method, feature-extrac-
+                tion method and summary function call, with the method name,
+                group, input shape, wall and CPU times and outcome (check
+                ``pymfe.callbacks`` module for the hooks and events). Each
+                callback only needs the hooks it uses (e.g., ``on_feature_-
+                end``). If :obj:`NoneType` or empty, no event is built at all.
+                Note that ``extract_many`` with ``enable_parallel`` copies the
+                callbacks to its worker processes.
+
         References:
             .. _Rivolli et al.:
                 "Towards Reproducible Empirical Research in Meta-Learning,"
@@ -192,26 +295,52 @@ class MFE:
         self._attr_indexes_cat = None  # type: t.Optional[t.Tuple[int, ...]]
         """Categoric column indexes from ``X`` (independent attributes)."""
 
-        self._precomp_args_ft = None  # type: t.Optional[t.Dict[str, t.Any]]
+        self._attr_num_distinct = None  # type: t.Optional[np.ndarray]
+        """Number of distinct values of each ``X`` column, if counted."""
+
+        self._cat_from_codes = False
+        """If True, ``C`` was factorized from categorical DataFrame codes."""
+
+        self._cat_cardinalities = None  # type: t.Optional[np.ndarray]
+        """Number of distinct codes of each ``C`` column."""
+
+        self._precomp_args_ft = None  # type: t.Optional[t.Mapping]
         """Precomputed common feature-extraction method arguments."""
 
-        if random_state is None or isinstance(random_state, int):
-            self.random_state = random_state
-            np.random.seed(random_state)
+        self._binding_plans = {}  # type: t.Dict[str, t.Any]
+        """Argument-binding plans of feature and summary methods."""
 
-        else:
-            raise ValueError(
-                'Invalid "random_state" argument ({0}). '
-                'Expecting None or an integer.'.format(random_state))
+        self._fit_config = None  # type: t.Optional[t.Tuple]
+        """Options of the last ``fit`` call, used to build cache keys."""
 
-        if isinstance(folds, int):
-            self.folds = folds
-        else:
-            raise ValueError('Invalid "folds" argument ({0}). '
-                             'Expecting an integer.'.format(random_state))
+        self._precomp_config = None  # type: t.Optional[t.Dict[str, t.Any]]
+        """Precomputation options of the last ``fit`` call."""
+
+        self._partial_fit_stats = None  # type: t.Optional[t.Dict[str, t.Any]]
+        """Sufficient statistics kept between ``partial_fit`` calls."""
+
+        self.precomp_updated = None  # type: t.Optional[t.Tuple[str, ...]]
+
+        self.fingerprint = None  # type: t.Optional[str]
+
+        self.random_state = _internal.check_int_arg(random_state,
+                                                    "random_state")
+        np.random.seed(random_state)
+
+        self.folds = _internal.check_int_arg(folds, "folds",
+                                             allow_none=False)
+
+        self.n_jobs = _internal.check_int_arg(n_jobs, "n_jobs", positive=True)
 
         self.score = _internal.check_score(score, self.groups)
 
+        self.cache_dir = cache_dir
+
+        self.cache_max_size = _internal.check_int_arg(
+            cache_max_size, "cache_max_size", positive=True)
+
+        self.callbacks = tuple(callbacks or tuple())  # type: t.Tuple
+
     def _call_summary_methods(
             self,
             feature_values: t.Sequence[_internal.TypeNumeric],
@@ -219,9 +348,7 @@ class MFE:
             remove_nan: bool = True,
             verbose: bool = False,
             suppress_warnings: bool = False,
-            **kwargs
-    ) -> t.Tuple[t.List[str], t.List[t.Union[float, t.Sequence]], t.
-                 List[float]]:
+            **kwargs) -> _TypeFeatResults:
         """Invoke summary functions loaded in the model on given feature values.
 
         Args:
@@ -252,7 +379,8 @@ class MFE:
             **kwargs: user-defined arguments for the summary callables.
 
             Returns:
-                tuple(list, list, list): a tuple containing three lists.
+                tuple(list, np.ndarray, np.ndarray): a tuple containing a list
+                and two one-dimensional arrays.
 
                 The first field is the identifiers of each summarized value in
                 the form ``feature_name.summary_mtd_name`` (i.e., the feature-
@@ -262,17 +390,17 @@ class MFE:
                 an extra concatenated id starting from 0 to differ between va-
                 lues (i.e. ``feature_name.summary_mtd_name.id``).
 
-                The second field is the summarized values. Both lists have a
-                1-1 correspondence by the index of each element (i.e., the va-
-                lue at index ``i`` in the second list has its identifier at
-                the same index in the first list and vice-versa).
+                The second field is the summarized values (check ``_inter-
+                nal.as_value_array``). Both fields have a 1-1 correspondence
+                by the index of each element (i.e., the value at index ``i``
+                in the second field has its identifier at the same index in
+                the first field and vice-versa).
 
-                The third field is a list with measured time wasted by each
-                summary function. If the cardinality of the summary function is
-                greater than 1, then the correspondent measured time is kept
-                only in the first correspondent field, and the extra fields are
-                filled with 0 to keep the consistency of the size between all
-                lists.
+                The third field is the measured time wasted by each summary
+                function. If the cardinality of the summary function is great-
+                er than 1, then the correspondent measured time is kept only in
+                the first correspondent field, and the extra fields are filled
+                with 0 to keep the consistency of the size between all fields.
 
                 Example:
                     ([``attr_ent.mean``, ``attr_ent.sd``], [0.98346, 0.34436])
@@ -280,11 +408,17 @@ class MFE:
                     by both ``mean`` and ``sd`` (standard deviation), giving
                     the values ``0.98347`` and ``0.34436``, respectively.
         """
-        metafeat_vals = []  # type: t.List[t.Union[int, float, t.Sequence]]
+        metafeat_vals = []  # type: t.List[np.ndarray]
         metafeat_names = []  # type: t.List[str]
-        metafeat_times = []  # type: t.List[float]
+        metafeat_times = []  # type: t.List[np.ndarray]
 
-        for sm_mtd_name, sm_mtd_callable, sm_mtd_args in self._metadata_mtd_sm:
+        # Values cleaned once, and intermediate values (e.g., the sorted
+        # values and central moments) shared by every summary function
+        sum_stats = _summary.SummaryStats(
+            _internal.clean_feature_values(feature_values,
+                                           remove_nan=remove_nan))
+
+        for sm_mtd_name, sm_mtd_callable, _ in self._metadata_mtd_sm:
 
             if verbose:
                 print(
@@ -292,16 +426,23 @@ class MFE:
                     " function...".format(feature_name, sm_mtd_name),
                     end=" ")
 
-            sm_mtd_args_pack = _internal.build_mtd_kwargs(
-                mtd_name=sm_mtd_name,
-                mtd_args=sm_mtd_args,
-                user_custom_args=kwargs.get(sm_mtd_name),
-                inner_custom_args=self._custom_args_sum,
-                suppress_warnings=suppress_warnings)
+            sm_mtd_args_pack = _internal.bind_mtd_kwargs(
+                binding_plan=self._binding_plans[sm_mtd_name],
+                user_custom_args=kwargs.get(sm_mtd_name))
+
+            if self.callbacks:
+                summarized_val, time_sm = self._timeit_summary(
+                    feature_values=feature_values,
+                    feature_name=feature_name,
+                    sum_stats=sum_stats,
+                    sm_mtd_name=sm_mtd_name,
+                    sm_mtd_callable=sm_mtd_callable,
+                    sm_mtd_args_pack=sm_mtd_args_pack)
 
-            summarized_val, time_sm = _internal.timeit(
-                _internal.summarize, feature_values, sm_mtd_callable,
-                sm_mtd_args_pack, remove_nan)
+            else:
+                summarized_val, time_sm = _internal.timeit(
+                    _internal.summarize_stats, sum_stats, sm_mtd_name,
+                    sm_mtd_callable, sm_mtd_args_pack)
 
             if not suppress_warnings:
                 _internal.check_summary_warnings(
@@ -309,107 +450,823 @@ class MFE:
                     name_feature=feature_name,
                     name_summary=sm_mtd_name)
 
-            if isinstance(summarized_val, np.ndarray):
-                summarized_val = summarized_val.flatten().tolist()
-
-            if (isinstance(summarized_val, collections.Sequence)
+            if (isinstance(summarized_val, (np.ndarray, collections.Sequence))
                     and not isinstance(summarized_val, str)):
-                metafeat_vals += summarized_val
+                summarized_val = _internal.as_value_array(summarized_val)
                 metafeat_names += [
                     ".".join((feature_name, sm_mtd_name, str(i)))
-                    for i in range(len(summarized_val))
+                    for i in range(summarized_val.size)
                 ]
-                metafeat_times += ([time_sm] + (
-                    (len(summarized_val) - 1) * [0.0]))
+                times_sm = np.zeros(summarized_val.size, dtype=np.float64)
+                times_sm[:1] = time_sm
 
             else:
-                metafeat_vals.append(summarized_val)
+                summarized_val = _internal.as_value_array([summarized_val])
                 metafeat_names.append(".".join((feature_name, sm_mtd_name)))
-                metafeat_times.append(time_sm)
+                times_sm = np.array([time_sm], dtype=np.float64)
+
+            metafeat_vals.append(summarized_val)
+            metafeat_times.append(times_sm)
 
             if verbose:
                 print("Done.")
 
-        return metafeat_names, metafeat_vals, metafeat_times
+        return (metafeat_names, np.concatenate(metafeat_vals),
+                np.concatenate(metafeat_times))
 
-    def _call_feature_methods(
+    def _timeit_summary(
             self,
-            remove_nan: bool = True,
-            verbose: bool = False,
-            # enable_parallel: bool = False,
-            suppress_warnings: bool = False,
-            **kwargs) -> t.Tuple[t.List, ...]:
-        """Invoke feature methods/functions loaded in the model and gather results.
+            feature_values: t.Sequence[_internal.TypeNumeric],
+            feature_name: str,
+            sum_stats: _summary.SummaryStats,
+            sm_mtd_name: str,
+            sm_mtd_callable: t.Callable,
+            sm_mtd_args_pack: t.Dict[str, t.Any]) -> t.Tuple[t.Any, float]:
+        """Call a summary function, notifying the callbacks of the model."""
+        event_args = {
+            "stage": "summary",
+            "name": ".".join((feature_name, sm_mtd_name)),
+            "group": "summary",
+            "shape": np.shape(feature_values),
+        }  # type: t.Dict[str, t.Any]
+
+        _callbacks.notify(self.callbacks, "on_summary_start",
+                          _callbacks.CallbackEvent(**event_args))
+
+        t_cpu_start = time.process_time()
+
+        summarized_val, time_sm = _internal.timeit(
+            _internal.summarize_stats, sum_stats, sm_mtd_name,
+            sm_mtd_callable, sm_mtd_args_pack)
+
+        _callbacks.notify(self.callbacks, "on_summary_end",
+                          _callbacks.CallbackEvent(
+                              wall_time=time_sm,
+                              cpu_time=time.process_time() - t_cpu_start,
+                              outcome=_callbacks.get_outcome(summarized_val),
+                              value=summarized_val,
+                              **event_args))
+
+        return summarized_val, time_sm
+
+    def _notify_feature(self,
+                        hook_name: str,
+                        ft_mtd_name: str,
+                        ft_mtd_callable: t.Callable,
+                        ft_mtd_args_pack: t.Dict[str, t.Any],
+                        **kwargs) -> None:
+        """Notify the callbacks of the model about a feature method.
 
-        The returned values are already summarized if needed.
+        Args:
+            hook_name (:obj:`str`): either ``on_feature_start`` or ``on_fea-
+                ture_end``.
 
-        For more information, check ``extract`` method documentation for in-
-        depth information about arguments and return value.
+            **kwargs: extra attributes of the event (check ``callbacks.Call-
+                backEvent``).
         """
-        metafeat_vals = []  # type: t.List[t.Union[int, float, t.Sequence]]
-        metafeat_names = []  # type: t.List[str]
-        metafeat_times = []  # type: t.List[float]
+        _callbacks.notify(
+            self.callbacks, hook_name,
+            _callbacks.CallbackEvent(
+                stage="feature",
+                name=_internal.remove_prefix(value=ft_mtd_name,
+                                             prefix=_internal.MTF_PREFIX),
+                group=_internal.get_mtd_group(ft_mtd_callable),
+                shape=_callbacks.get_input_shape(ft_mtd_args_pack),
+                **kwargs))
+
+    def _notify_feature_end(self,
+                            ft_mtd_name: str,
+                            ft_mtd_callable: t.Callable,
+                            ft_mtd_args_pack: t.Dict[str, t.Any],
+                            features: t.Any,
+                            time_ft: float,
+                            cpu_ft: t.Optional[float] = None,
+                            error: t.Optional[Exception] = None) -> None:
+        """Notify the end of a feature method (check ``_notify_feature``)."""
+        if features is _TIMED_OUT:
+            outcome, features = "timeout", None
 
-        for ft_mtd_name, ft_mtd_callable, ft_mtd_args in self._metadata_mtd_ft:
+        else:
+            outcome = _callbacks.get_outcome(features, error)
 
-            if verbose:
-                print("Extracting {} feature...".format(ft_mtd_name))
+        self._notify_feature(
+            "on_feature_end", ft_mtd_name, ft_mtd_callable, ft_mtd_args_pack,
+            wall_time=time_ft, cpu_time=cpu_ft, outcome=outcome,
+            value=features, error=error)
+
+    def _build_ft_mtd_args(self, ft_mtd_name: str,
+                           **kwargs) -> t.Dict[str, t.Any]:
+        """Build the arguments of a single feature-extraction method call.
+
+        The arguments are bound from the plan compiled by ``fit`` (check
+        ``_compile_binding_plans`` method), so only lazily precomputed
+        values and user custom arguments are looked up here.
+        """
+        return _internal.bind_mtd_kwargs(
+            **self._get_ft_mtd_binding(ft_mtd_name, **kwargs))
+
+    def _get_ft_mtd_binding(self, ft_mtd_name: str,
+                            **kwargs) -> t.Dict[str, t.Any]:
+        """Get the ``_internal.bind_mtd_kwargs`` arguments of a method call.
+
+        Check ``_build_ft_mtd_args`` method.
+        """
+        ft_name_without_prefix = _internal.remove_prefix(
+            value=ft_mtd_name, prefix=_internal.MTF_PREFIX)
+
+        return {
+            "binding_plan": self._binding_plans[ft_mtd_name],
+            "user_custom_args": kwargs.get(ft_name_without_prefix),
+            "inner_custom_args": self._custom_args_ft,
+            "precomp_args": self._precomp_args_ft,
+        }
+
+    def _compile_binding_plans(self) -> None:
+        """Compile the argument-binding plan of every selected method.
+
+        Each plan keeps the arguments of a feature-extraction or summary
+        method already bound to the fitted data and precomputed values
+        (check ``_internal.compile_mtd_kwargs``), so ``extract`` does not
+        merge and filter these arguments again on every call.
+        """
+        self._binding_plans = {}
+
+        for ft_mtd_name, _, ft_mtd_args in self._metadata_mtd_ft:
+            self._binding_plans[ft_mtd_name] = _internal.compile_mtd_kwargs(
+                mtd_args=ft_mtd_args,
+                inner_custom_args=self._custom_args_ft,
+                precomp_args=self._precomp_args_ft)
 
+        self._compile_summary_plans()
+
+    def _compile_summary_plans(self) -> None:
+        """Compile the argument-binding plan of every summary function.
+
+        Summary functions need no fitted data, so these plans are also used
+        by ``extract_chunked`` method with no ``fit`` call.
+        """
+        # Custom arguments for summarization methods
+        self._custom_args_sum = {
+            "ddof": 1,
+        }
+
+        for sm_mtd_name, _, sm_mtd_args in self._metadata_mtd_sm:
+            self._binding_plans[sm_mtd_name] = _internal.compile_mtd_kwargs(
+                mtd_args=sm_mtd_args,
+                inner_custom_args=self._custom_args_sum)
+
+    def _check_user_args(self, **kwargs) -> None:
+        """Warn about unknown user custom arguments of the selected methods."""
+        for ft_mtd_name, _, ft_mtd_args in self._metadata_mtd_ft:
             ft_name_without_prefix = _internal.remove_prefix(
                 value=ft_mtd_name, prefix=_internal.MTF_PREFIX)
 
-            ft_mtd_args_pack = _internal.build_mtd_kwargs(
+            _internal.check_unknown_args(
                 mtd_name=ft_name_without_prefix,
                 mtd_args=ft_mtd_args,
-                user_custom_args=kwargs.get(ft_name_without_prefix),
-                inner_custom_args=self._custom_args_ft,
-                precomp_args=self._precomp_args_ft,
-                suppress_warnings=suppress_warnings)
+                user_custom_args=kwargs.get(ft_name_without_prefix))
+
+        for sm_mtd_name, _, sm_mtd_args in self._metadata_mtd_sm:
+            _internal.check_unknown_args(
+                mtd_name=sm_mtd_name,
+                mtd_args=sm_mtd_args,
+                user_custom_args=kwargs.get(sm_mtd_name))
+
+    def _run_feature_methods_serial(
+            self,
+            ft_mtds: _TypeSeqExt,
+            verbose: bool = False,
+            suppress_warnings: bool = False,
+            **kwargs) -> t.Iterator[t.Tuple[str, t.Any, float]]:
+        """Run the given feature methods, one after another.
+
+        Args:
+            ft_mtds (:obj:`Sequence` of :obj:`tuple`): metadata of the fea-
+                ture methods to run, in the same format of the ``_metadata_-
+                mtd_ft`` attribute.
+
+        Yields:
+            tuple(str, any, float): the feature-extraction method name, its
+                return value and the time elapsed by its invocation.
+        """
+        for ft_mtd_name, ft_mtd_callable, _ in ft_mtds:
+
+            if verbose:
+                print("Extracting {} feature...".format(ft_mtd_name))
+
+            ft_mtd_args_pack = self._build_ft_mtd_args(ft_mtd_name, **kwargs)
+
+            if self.callbacks:
+                self._notify_feature("on_feature_start", ft_mtd_name,
+                                     ft_mtd_callable, ft_mtd_args_pack)
+
+            features, time_ft, cpu_ft, error = _internal.timeit_feat_value(
+                ft_mtd_name, ft_mtd_args_pack, ft_mtd_callable,
+                suppress_warnings)
+
+            if self.callbacks:
+                self._notify_feature_end(ft_mtd_name, ft_mtd_callable,
+                                         ft_mtd_args_pack, features, time_ft,
+                                         cpu_ft, error)
+
+            yield ft_mtd_name, features, time_ft
+
+    def _run_feature_methods_parallel(
+            self,
+            ft_mtds: _TypeSeqExt,
+            backend: str = "auto",
+            verbose: bool = False,
+            suppress_warnings: bool = False,
+            **kwargs) -> t.Iterator[t.Tuple[str, t.Any, float]]:
+        """Run the given feature methods in a pool of workers.
+
+        The maximum number of workers of each pool is given by the ``n_jobs``
+        instance attribute. The time elapsed by each method is measured in-
+        side the worker, so it does not include the time necessary to send
+        the method arguments to it.
+
+        Args:
+            ft_mtds (:obj:`Sequence` of :obj:`tuple`): metadata of the fea-
+                ture methods to run. Check ``_run_feature_methods_serial``.
+
+            backend (:obj:`str`, optional): which pool runs each method. Check
+                ``parallel_backend`` argument of ``extract`` method.
+
+        Yields:
+            tuple(str, any, float): the feature-extraction method name, its
+                return value and the time elapsed by its invocation, in the
+                completion order of the methods.
+        """
+        with contextlib.ExitStack() as stack:
+            executors = {}  # type: t.Dict[str, concurrent.futures.Executor]
+            futures = {}  # type: t.Dict[concurrent.futures.Future, t.Tuple]
+
+            for ft_mtd_name, ft_mtd_callable, _ in ft_mtds:
+
+                if verbose:
+                    print("Extracting {} feature...".format(ft_mtd_name))
+
+                ft_mtd_args_pack = self._build_ft_mtd_args(
+                    ft_mtd_name, **kwargs)
+
+                pool_type = backend
+
+                if backend == "auto":
+                    pool_type = "process"
+
+                    if _internal.is_thread_friendly(ft_mtd_name,
+                                                    ft_mtd_callable):
+                        pool_type = "thread"
+
+                if pool_type not in executors:
+                    if pool_type == "thread":
+                        executors[pool_type] = stack.enter_context(
+                            concurrent.futures.ThreadPoolExecutor(
+                                max_workers=self.n_jobs or os.cpu_count()))
+
+                    else:
+                        executors[pool_type] = stack.enter_context(
+                            concurrent.futures.ProcessPoolExecutor(
+                                max_workers=self.n_jobs))
+
+                if self.callbacks:
+                    self._notify_feature("on_feature_start", ft_mtd_name,
+                                         ft_mtd_callable, ft_mtd_args_pack)
+
+                future = executors[pool_type].submit(
+                    _internal.timeit_feat_value, ft_mtd_name,
+                    ft_mtd_args_pack, ft_mtd_callable, suppress_warnings)
+
+                futures[future] = (ft_mtd_name, ft_mtd_callable,
+                                   ft_mtd_args_pack)
+
+            for future in concurrent.futures.as_completed(futures):
+                features, time_ft, cpu_ft, error = future.result()
+                ft_mtd_name, ft_mtd_callable, ft_mtd_args_pack = (
+                    futures[future])
+
+                if self.callbacks:
+                    self._notify_feature_end(ft_mtd_name, ft_mtd_callable,
+                                             ft_mtd_args_pack, features,
+                                             time_ft, cpu_ft, error)
+
+                yield ft_mtd_name, features, time_ft
+
+    def _run_feature_methods_timeout(
+            self,
+            ft_mtds: _TypeSeqExt,
+            timeout_per_feature: t.Optional[float] = None,
+            total_timeout: t.Optional[float] = None,
+            enable_parallel: bool = False,
+            verbose: bool = False,
+            suppress_warnings: bool = False,
+            **kwargs) -> t.Iterator[t.Tuple[str, t.Any, float]]:
+        """Run the given feature methods within a deadline.
+
+        Each method runs in its own process, which is terminated if the
+        method runs past ``timeout_per_feature`` seconds or if the whole
+        extraction runs past ``total_timeout`` seconds. In the latter case,
+        the methods not started yet are not run at all. The lazily precom-
+        puted values needed by each method are evaluated within its process
+        (check ``_run_feature_method_in_process``), so they are subject to
+        the same deadlines.
+
+        Args:
+            ft_mtds (:obj:`Sequence` of :obj:`tuple`): metadata of the fea-
+                ture methods to run. Check ``_run_feature_methods_serial``.
+
+            enable_parallel (:obj:`bool`, optional): if True, at most ``n_-
+                jobs`` (check ``MFE`` instantiation arguments) methods run
+                simultaneously. Otherwise, one method runs at a time.
+
+        Yields:
+            tuple(str, any, float): the feature-extraction method name, its
+                return value (or ``_TIMED_OUT`` if the method did not finish
+                in time) and the time elapsed by its invocation, in the com-
+                pletion order of the methods.
+        """
+        max_running = 1
+
+        if enable_parallel:
+            max_running = self.n_jobs or os.cpu_count() or 1
+
+        pending = collections.deque(ft_mtds)
+        running = {}  # type: t.Dict[t.Any, _TypeRunningProc]
+
+        time_start = time.time()
+        total_deadline = None  # type: t.Optional[float]
+
+        if total_timeout is not None:
+            total_deadline = time_start + total_timeout
+
+        try:
+            while pending or running:
+                while (pending and len(running) < max_running
+                       and (total_deadline is None
+                            or time.time() < total_deadline)):
+                    ft_mtd_name, ft_mtd_callable, _ = pending.popleft()
+
+                    conn_recv, running_proc = self._start_feature_process(
+                        ft_mtd_name=ft_mtd_name,
+                        ft_mtd_callable=ft_mtd_callable,
+                        verbose=verbose,
+                        suppress_warnings=suppress_warnings,
+                        **kwargs)
+
+                    running[conn_recv] = running_proc
+
+                wait_time = self._get_wait_time(
+                    running=running.values(),
+                    timeout_per_feature=timeout_per_feature,
+                    total_deadline=total_deadline)
+
+                ready = multiprocessing.connection.wait(list(running),
+                                                        timeout=wait_time)
+
+                for conn in [conn for conn in running if conn in ready]:
+                    yield self._finish_feature_process(
+                        conn, running.pop(conn), suppress_warnings)
+
+                time_now = time.time()
+                total_expired = (total_deadline is not None
+                                 and time_now >= total_deadline)
+
+                for conn, (_, _, proc_start, _, _) in tuple(running.items()):
+                    if total_expired or (
+                            timeout_per_feature is not None and
+                            time_now - proc_start >= timeout_per_feature):
+                        yield self._stop_feature_process(
+                            conn, running.pop(conn), time_now)
+
+                if total_expired:
+                    while pending:
+                        yield pending.popleft()[0], _TIMED_OUT, 0.0
+
+        finally:
+            # Do not leave any process behind if the caller stops iterating
+            for conn, (_, proc, _, _, _) in running.items():
+                proc.terminate()
+                proc.join()
+                conn.close()
+
+    def _start_feature_process(
+            self,
+            ft_mtd_name: str,
+            ft_mtd_callable: t.Callable,
+            verbose: bool = False,
+            suppress_warnings: bool = False,
+            **kwargs
+    ) -> t.Tuple[multiprocessing.connection.Connection, _TypeRunningProc]:
+        """Start a process running a single feature method.
+
+        Returns:
+            tuple: the connection which receives the method results (check
+                ``_run_feature_method_in_process``), and the method name,
+                process, start time, callable and arguments already bound.
+        """
+        if verbose:
+            print("Extracting {} feature...".format(ft_mtd_name))
+
+        ft_mtd_binding = self._get_ft_mtd_binding(ft_mtd_name, **kwargs)
+
+        # Only the arguments bound by ``fit`` are known before the process
+        # starts, which is enough for the callbacks (e.g., the input shape)
+        ft_mtd_args_pack = ft_mtd_binding["binding_plan"][0]
+
+        if self.callbacks:
+            self._notify_feature("on_feature_start", ft_mtd_name,
+                                 ft_mtd_callable, ft_mtd_args_pack)
+
+        conn_recv, conn_send = multiprocessing.Pipe(duplex=False)
+
+        proc = multiprocessing.Process(
+            target=_run_feature_method_in_process,
+            args=(conn_send, ft_mtd_name, ft_mtd_binding, ft_mtd_callable,
+                  suppress_warnings),
+            daemon=True)
+
+        proc.start()
+        conn_send.close()
+
+        return conn_recv, (ft_mtd_name, proc, time.time(), ft_mtd_callable,
+                           ft_mtd_args_pack)
+
+    def _finish_feature_process(
+            self,
+            conn: multiprocessing.connection.Connection,
+            running_proc: _TypeRunningProc,
+            suppress_warnings: bool = False) -> t.Tuple[str, t.Any, float]:
+        """Receive the results of a finished feature method process.
+
+        Returns:
+            tuple(str, any, float): the feature-extraction method name, its
+                return value and the time elapsed by its invocation. If the
+                process died without sending them, the value is :obj:`np.nan`.
+        """
+        (ft_mtd_name, proc, proc_start, ft_mtd_callable,
+         ft_mtd_args_pack) = running_proc
+
+        try:
+            features, time_ft, cpu_ft, error = conn.recv()
+
+        except EOFError:
+            # The process died without sending anything back
+            features, time_ft = np.nan, time.time() - proc_start
+            cpu_ft, error = None, None
+
+            if not suppress_warnings:
+                warnings.warn(
+                    "Process extracting {0} died unexpectedly. Will set it "
+                    "as 'np.nan' for all summary functions.".format(
+                        ft_mtd_name), RuntimeWarning)
+
+        conn.close()
+        proc.join()
+
+        if self.callbacks:
+            self._notify_feature_end(ft_mtd_name, ft_mtd_callable,
+                                     ft_mtd_args_pack, features, time_ft,
+                                     cpu_ft, error)
+
+        return ft_mtd_name, features, time_ft
+
+    def _stop_feature_process(
+            self,
+            conn: multiprocessing.connection.Connection,
+            running_proc: _TypeRunningProc,
+            time_now: float) -> t.Tuple[str, t.Any, float]:
+        """Terminate a feature method process which timed out.
+
+        Returns:
+            tuple(str, any, float): the feature-extraction method name,
+                ``_TIMED_OUT`` and the time elapsed until ``time_now``.
+        """
+        (ft_mtd_name, proc, proc_start, ft_mtd_callable,
+         ft_mtd_args_pack) = running_proc
+
+        proc.terminate()
+        proc.join()
+        conn.close()
 
-            features, time_ft = _internal.timeit(
-                _internal.get_feat_value, ft_mtd_name, ft_mtd_args_pack,
-                ft_mtd_callable, suppress_warnings)
+        if self.callbacks:
+            self._notify_feature_end(ft_mtd_name, ft_mtd_callable,
+                                     ft_mtd_args_pack, _TIMED_OUT,
+                                     time_now - proc_start)
 
-            ft_has_length = isinstance(features,
-                                       (np.ndarray, collections.Sequence))
+        return ft_mtd_name, _TIMED_OUT, time_now - proc_start
 
-            if ft_has_length and self._timeopt_type_is_avg():
-                time_ft /= len(features)
+    @staticmethod
+    def _get_wait_time(running: t.Iterable[_TypeRunningProc],
+                       timeout_per_feature: t.Optional[float] = None,
+                       total_deadline: t.Optional[float] = None
+                       ) -> t.Optional[float]:
+        """Time to wait for the first of the ``running`` processes deadlines.
 
-            if self._metadata_mtd_sm and ft_has_length:
-                sm_ret = self._call_summary_methods(
+        Returns:
+            float: seconds until the earliest deadline of the ``running``
+                processes (or ``total_deadline``), or :obj:`NoneType` if no
+                deadline is set.
+        """
+        deadlines = [
+            proc_start + timeout_per_feature
+            for _, _, proc_start, _, _ in running
+            if timeout_per_feature is not None
+        ]
+
+        if total_deadline is not None:
+            deadlines.append(total_deadline)
+
+        if not deadlines:
+            return None
+
+        return max(0.0, min(deadlines) - time.time())
+
+    def _iter_feature_methods(
+            self,
+            remove_nan: bool = True,
+            verbose: bool = False,
+            enable_parallel: bool = False,
+            parallel_backend: str = "auto",
+            timeout_per_feature: t.Optional[float] = None,
+            total_timeout: t.Optional[float] = None,
+            suppress_warnings: bool = False,
+            **kwargs) -> t.Iterator[_TypeFeatResultsStatus]:
+        """Invoke feature methods/functions loaded in the model one at a time.
+
+        The values are already summarized if needed. The values of methods
+        timed out are all :obj:`np.nan`.
+
+        Yields:
+            tuple(list, np.ndarray, np.ndarray, bool): the names, values and
+                times elapsed of every value originated from a single feature-
+                extraction method, as soon as the method and its summarization
+                finish, and whether the method timed out.
+                Check ``extract`` method documentation for in-depth informa-
+                tion about arguments and these values.
+        """
+        if not suppress_warnings:
+            self._check_user_args(**kwargs)
+
+        ft_mtds = self._metadata_mtd_ft
+        cache_keys = {}  # type: t.Dict[str, str]
+
+        if self.cache_dir is not None:
+            cache_keys = self._get_cache_keys(remove_nan=remove_nan, **kwargs)
+            ft_mtds = []
+
+            for ft_mtd_tuple in self._metadata_mtd_ft:
+                metafeat_ret = _cache.load(self.cache_dir,
+                                           cache_keys[ft_mtd_tuple[0]])
+
+                if metafeat_ret is None:
+                    ft_mtds.append(ft_mtd_tuple)
+                    continue
+
+                if verbose:
+                    print("Loaded {} feature from cache.".format(
+                        ft_mtd_tuple[0]))
+
+                yield metafeat_ret + (False, )
+
+        if timeout_per_feature is not None or total_timeout is not None:
+            ft_results = self._run_feature_methods_timeout(
+                ft_mtds=ft_mtds,
+                timeout_per_feature=timeout_per_feature,
+                total_timeout=total_timeout,
+                enable_parallel=enable_parallel,
+                verbose=verbose,
+                suppress_warnings=suppress_warnings,
+                **kwargs)
+
+        elif enable_parallel:
+            ft_results = self._run_feature_methods_parallel(
+                ft_mtds=ft_mtds,
+                backend=parallel_backend,
+                verbose=verbose,
+                suppress_warnings=suppress_warnings,
+                **kwargs)
+
+        else:
+            ft_results = self._run_feature_methods_serial(
+                ft_mtds=ft_mtds,
+                verbose=verbose,
+                suppress_warnings=suppress_warnings,
+                **kwargs)
+
+        for ft_mtd_name, features, time_ft in ft_results:
+            if features is _TIMED_OUT:
+                yield self._get_timed_out_results(
+                    ft_mtd_name=ft_mtd_name,
+                    time_ft=time_ft,
+                    suppress_warnings=suppress_warnings) + (True, )
+                continue
+
+            metafeat_ret = self._summarize_feature(
+                ft_mtd_name=ft_mtd_name,
+                features=features,
+                time_ft=time_ft,
+                remove_nan=remove_nan,
+                verbose=verbose,
+                suppress_warnings=suppress_warnings,
+                **kwargs)
+
+            if cache_keys and self.cache_dir is not None:
+                _cache.store(
+                    cache_dir=self.cache_dir,
+                    key=cache_keys[ft_mtd_name],
+                    value=metafeat_ret,
+                    max_size=self.cache_max_size)
+
+            if verbose:
+                print("Done with {} feature.".format(ft_mtd_name))
+
+            yield metafeat_ret + (False, )
+
+    def _summarize_feature(self,
+                           ft_mtd_name: str,
+                           features: t.Any,
+                           time_ft: float,
+                           remove_nan: bool = True,
+                           verbose: bool = False,
+                           suppress_warnings: bool = False,
+                           **kwargs) -> _TypeFeatResults:
+        """Summarize the values returned by a feature-extraction method.
+
+        Values with no length (i.e., a single value) are not summarized.
+
+        Returns:
+            tuple(list, np.ndarray, np.ndarray): the names, values and times
+                elapsed of every value originated from the feature-extraction
+                method (check ``_call_summary_methods``).
+        """
+        ft_name_without_prefix = _internal.remove_prefix(
+            value=ft_mtd_name, prefix=_internal.MTF_PREFIX)
+
+        ft_has_length = isinstance(features,
+                                   (np.ndarray, collections.Sequence))
+
+        if ft_has_length and self._timeopt_type_is_avg():
+            time_ft /= len(features)
+
+        if self._metadata_mtd_sm and ft_has_length:
+            summarized_names, summarized_vals, times_sm = (
+                self._call_summary_methods(
                     feature_values=features,
                     feature_name=ft_name_without_prefix,
                     remove_nan=remove_nan,
                     verbose=verbose,
                     suppress_warnings=suppress_warnings,
-                    **kwargs)
+                    **kwargs))
 
-                summarized_names, summarized_vals, times_sm = sm_ret
+            return (summarized_names, summarized_vals,
+                    self._combine_time(time_ft, times_sm))
 
-                metafeat_vals += summarized_vals
-                metafeat_names += summarized_names
-                metafeat_times += self._combine_time(time_ft, times_sm)
+        return ([ft_name_without_prefix], _internal.as_value_array([features]),
+                np.array([time_ft], dtype=np.float64))
 
-            else:
-                metafeat_vals.append(features)
-                metafeat_names.append(ft_name_without_prefix)
-                metafeat_times.append(time_ft)
+    def _get_cache_keys(self,
+                        remove_nan: bool = True,
+                        **kwargs) -> t.Dict[str, str]:
+        """Get the cache key of every feature method loaded in the model.
 
-            if verbose:
-                print("Done with {} feature.".format(ft_mtd_name))
+        The key combines the content hash of the fitted data, the ``fit``
+        method options, the instantiation options which may change the me-
+        tafeature values, the summary functions and the user custom argu-
+        ments of both the feature method and the summary functions.
+        """
+        sm_args = {
+            sm_mtd_name: kwargs.get(sm_mtd_name)
+            for sm_mtd_name in self.summary
+        }
+
+        config_key = _cache.get_key(
+            self.fingerprint, self._fit_config, self.summary, sm_args,
+            self.timeopt, remove_nan, self.folds,
+            getattr(self.score, "__name__", self.score), self.random_state)
 
-        return metafeat_names, metafeat_vals, metafeat_times
+        cache_keys = {}  # type: t.Dict[str, str]
+
+        for ft_mtd_name, _, _ in self._metadata_mtd_ft:
+            ft_name_without_prefix = _internal.remove_prefix(
+                value=ft_mtd_name, prefix=_internal.MTF_PREFIX)
+
+            cache_keys[ft_mtd_name] = _cache.get_key(
+                config_key, ft_mtd_name,
+                kwargs.get(ft_name_without_prefix, {}))
+
+        return cache_keys
+
+    def _get_timed_out_results(
+            self,
+            ft_mtd_name: str,
+            time_ft: float,
+            suppress_warnings: bool = False) -> _TypeFeatResults:
+        """Get the results of a feature-extraction method timed out.
+
+        The values are all :obj:`np.nan`. If the method is annotated to re-
+        turn an array, a value is given for each summary function (a single
+        one even for summary functions with cardinality higher than one).
+        """
+        ft_name_without_prefix = _internal.remove_prefix(
+            value=ft_mtd_name, prefix=_internal.MTF_PREFIX)
+
+        if not suppress_warnings:
+            warnings.warn(
+                "Extraction of {0} timed out after {1:.2f} seconds. Will "
+                "set it as 'np.nan' for all summary functions.".format(
+                    ft_mtd_name, time_ft), RuntimeWarning)
+
+        ft_mtd_callable = dict(
+            (mtd_name, mtd_callable)
+            for mtd_name, mtd_callable, _ in self._metadata_mtd_ft
+        )[ft_mtd_name]
+
+        if self._metadata_mtd_sm and _internal.returns_array(ft_mtd_callable):
+            names = [
+                ".".join((ft_name_without_prefix, sm_mtd_name))
+                for sm_mtd_name, _, _ in self._metadata_mtd_sm
+            ]
+
+        else:
+            names = [ft_name_without_prefix]
+
+        return (names, np.full(len(names), fill_value=np.nan),
+                np.full(len(names), fill_value=time_ft))
+
+    def _call_feature_methods(
+            self,
+            remove_nan: bool = True,
+            verbose: bool = False,
+            enable_parallel: bool = False,
+            parallel_backend: str = "auto",
+            timeout_per_feature: t.Optional[float] = None,
+            total_timeout: t.Optional[float] = None,
+            suppress_warnings: bool = False,
+            **kwargs) -> _TypeGatheredResults:
+        """Invoke feature methods/functions loaded in the model and gather results.
+
+        The returned values are already summarized if needed.
+
+        For more information, check ``extract`` method documentation for in-
+        depth information about arguments and ``_gather_results`` method for
+        the return value.
+        """
+        return self._gather_results(
+            self._iter_feature_methods(
+                remove_nan=remove_nan,
+                verbose=verbose,
+                enable_parallel=enable_parallel,
+                parallel_backend=parallel_backend,
+                timeout_per_feature=timeout_per_feature,
+                total_timeout=total_timeout,
+                suppress_warnings=suppress_warnings,
+                **kwargs))
+
+    @staticmethod
+    def _gather_results(
+            ft_results: t.Iterable[_TypeFeatResultsStatus]
+    ) -> _TypeGatheredResults:
+        """Concatenate the results of many feature-extraction methods.
+
+        Args:
+            ft_results (:obj:`Iterable` of :obj:`tuple`): results of each
+                method, as yielded by ``_iter_feature_methods``.
+
+        Returns:
+            tuple(list, np.ndarray, np.ndarray, np.ndarray): the names, va-
+                lues and times elapsed of every value, and a :obj:`bool` array
+                which is True for the values of every method timed out.
+        """
+        metafeat_vals = []  # type: t.List[np.ndarray]
+        metafeat_names = []  # type: t.List[str]
+        metafeat_times = []  # type: t.List[np.ndarray]
+        metafeat_timed_out = []  # type: t.List[np.ndarray]
+
+        for names, vals, times, timed_out in ft_results:
+            metafeat_names += names
+            metafeat_vals.append(vals)
+            metafeat_times.append(times)
+            metafeat_timed_out.append(np.full(len(names), timed_out))
+
+        if not metafeat_names:
+            return [], np.empty(0), np.empty(0), np.empty(0, dtype=bool)
+
+        return (metafeat_names, np.concatenate(metafeat_vals),
+                np.concatenate(metafeat_times),
+                np.concatenate(metafeat_timed_out))
 
     def _fill_col_ind_by_type(
             self,
             cat_cols: t.Optional[t.Union[str, t.Iterable[int]]] = "auto",
-            check_bool: bool = True) -> None:
+            check_bool: bool = True,
+            frame: t.Optional[t.Any] = None) -> None:
         """Select ``X`` column indexes based in its data type.
 
         The indexes for numerical and categorical attributes are kept,
         respectively, at ``_attr_indexes_num`` and ``_attr_indexes_cat``
-        instance attributes.
+        instance attributes. If ``cat_cols`` is ``auto`` and ``check_bool``
+        is True, the number of distinct values of each column is also kept
+        at ``_attr_num_distinct`` (check ``_internal.infer_cat_cols``).
 
         Args:
             cat_cols (:obj:`str` or :obj:`iterable` of :obj:`int`, optional):
@@ -420,6 +1277,11 @@ class MFE:
             check_bool (:obj:`bool`, optional): check ``fit`` method corres-
                 ponding argument for more information.
 
+            frame (:obj:`pd.DataFrame`, optional): the DataFrame ``X`` was
+                fitted from, if any. If ``cat_cols`` is ``auto``, then the
+                column types of the DataFrame are used instead of the values
+                of ``X`` (check ``_internal.infer_cat_cols_frame``).
+
         Raises:
             TypeError: if ``X`` attribute is :obj:`NoneType`.
             ValueError: if ``cat_cols`` is neither ``auto`` or a valid
@@ -429,26 +1291,21 @@ class MFE:
         if self.X is None:
             raise TypeError("X can't be 'None'.")
 
+        self._attr_num_distinct = None
+
         categorical_cols = None  # type: np.ndarray[bool]
 
         if not cat_cols:
             categorical_cols = np.array([False] * self.X.shape[1])
 
+        elif (isinstance(cat_cols, str) and cat_cols.lower() == "auto"
+              and frame is not None):
+            categorical_cols, self._attr_num_distinct = (
+                _internal.infer_cat_cols_frame(frame, check_bool=check_bool))
+
         elif isinstance(cat_cols, str) and cat_cols.lower() == "auto":
-            categorical_cols = np.logical_not(
-                np.apply_along_axis(
-                    _internal.isnumeric,
-                    axis=0,
-                    arr=self.X,
-                    check_subtype=True,
-                ))
-
-            if check_bool:
-                categorical_cols |= np.apply_along_axis(
-                    func1d=lambda col: len(np.unique(col)) == 2,
-                    axis=0,
-                    arr=self.X,
-                )
+            categorical_cols, self._attr_num_distinct = (
+                _internal.infer_cat_cols(self.X, check_bool=check_bool))
 
         elif (isinstance(cat_cols, (np.ndarray, collections.Iterable))
               and not isinstance(cat_cols, str)
@@ -477,39 +1334,42 @@ class MFE:
                 and self.timeopt.endswith(_internal.TIMEOPT_SUMMARY_SUFFIX))
 
     def _combine_time(self, time_ft: float,
-                      times_sm: t.List[float]) -> t.List[float]:
+                      times_sm: np.ndarray) -> np.ndarray:
         """Treat time from feature extraction and summarization based in ``timeopt``.
 
         Args:
             time_ft (:obj:`float`): time necessary to extract some feature.
 
-            times_sm (:obj:`list` of :obj:`float`): list of values to summa-
-                rize the metafeature value with each summary function.
+            times_sm (:obj:`np.ndarray` of :obj:`float`): time elapsed to
+                summarize the metafeature value with each summary function.
 
         Returns:
-            list: if ``timeopt`` attribute considers ``summary`` time (i.e.,
-                selected option ends with ``summ``), then these returned list
+            np.ndarray: if ``timeopt`` attribute considers ``summary`` time
+                (i.e., selected option ends with ``summ``), then these returned
                 values are the combination of times gathered in feature extra-
-                ction and summarization methods. Otherwise, the list values are
-                the value of ``time_ft`` copied ``len(times_sm)`` times, to
-                keep consistency with the correspondence between the values of
-                all lists returned by ``extract`` method.
+                ction and summarization methods. Otherwise, the values are the
+                value of ``time_ft`` copied ``len(times_sm)`` times, to keep
+                consistency with the correspondence between the values of all
+                fields returned by ``extract`` method.
         """
-        total_time = np.array([time_ft] * len(times_sm))
+        total_time = np.full(times_sm.size, fill_value=time_ft,
+                             dtype=np.float64)
 
         if self._timeopt_include_summary():
             total_time += times_sm
 
         # As seen in ``_call_summary_methods`` method documentation, zero-
-        # valued elements are created to fill the time list to keep its size
-        # consistent with another feature extraction related lists. In this
+        # valued elements are created to fill the time array to keep its size
+        # consistent with another feature extraction related fields. In this
         # case, here they're kept zero-valued.
-        total_time[np.array(times_sm) == 0.0] = 0.0
+        total_time[times_sm == 0.0] = 0.0
 
-        return total_time.tolist()
+        return total_time
 
     def _set_data_categoric(self, transform_num: bool,
-                            num_bins: bool = None) -> np.ndarray:
+                            num_bins: bool = None,
+                            warn_copies: bool = False,
+                            frame: t.Optional[t.Any] = None) -> np.ndarray:
         """Returns categorical data from the fitted dataset.
 
         Args:
@@ -523,16 +1383,24 @@ class MFE:
                 set to min(2, c), where ``c`` is the cubic root of the number
                 of instances of the fitted dataset.
 
+            warn_copies (:obj:`bool`, optional): if True, warn about every
+                copy of the fitted data made by this method.
+
+            frame (:obj:`pd.DataFrame`, optional): the DataFrame ``X`` was
+                fitted from, if any. If every categorical column of it has
+                :obj:`pd.CategoricalDtype`, then the categorical data is fac-
+                torized from its integer codes.
+
         Returns:
-            np.ndarray: processed categorical data. If no need for changes
-                from the original dataset, then this method does not create
-                a copy of it to prevent unnecessary memory usage. Otherwise,
-                this method returns a modified version of the original cate-
-                gorical data, thus consuming more memory.
+            np.ndarray: integer codes of the processed categorical data (check
+                ``_codes.factorize``), with the smallest integer type able to
+                hold them. The cardinality of each column is kept in the
+                ``_cat_cardinalities`` instance attribute.
 
         Raises:
             TypeError: if either ``X`` or ``_attr_indexes_cat`` instance
-                attributes are :obj:`NoneType`. This can be avoided passing
+                attributes are :obj:`NoneType` (also ``_attr_indexes_num``
+                if ``transform_num`` is True). This can be avoided passing
                 valid data to fit and first calling ``_fill_col_ind_by_type``
                 instance method before this method.
         """
@@ -546,15 +1414,36 @@ class MFE:
                             "attributes. Please be sure to call method "
                             '"_fill_col_ind_by_type" before this method.')
 
-        data_cat = self.X[:, self._attr_indexes_cat]
+        data_cat = None  # type: t.Optional[np.ndarray]
+
+        if frame is not None:
+            data_cat = _internal.select_frame_cat_codes(
+                frame, self._attr_indexes_cat)
+
+        self._cat_from_codes = data_cat is not None
+
+        if not self._cat_from_codes:
+            data_cat = _internal.select_columns(self.X,
+                                                self._attr_indexes_cat)
+
+        data_num_discretized = None  # type: t.Optional[np.ndarray]
 
         if transform_num:
+            if self._attr_indexes_num is None:
+                raise TypeError("No information about indexes of numeric "
+                                "attributes. Please be sure to call method "
+                                '"_fill_col_ind_by_type" before this method.')
+
             data_num_discretized = _internal.transform_num(
-                self.X[:, self._attr_indexes_num], num_bins=num_bins)
+                _internal.select_columns(self.X, self._attr_indexes_num),
+                num_bins=num_bins)
+
+        data_cat, self._cat_cardinalities = _codes.factorize(
+            data_cat, data_num_discretized)
 
-            if data_num_discretized is not None:
-                data_cat = np.concatenate((data_cat, data_num_discretized),
-                                          axis=1)
+        if warn_copies and data_cat.size:
+            _internal.warn_copy(
+                "C", "it is stored as integer codes of each distinct value")
 
         return data_cat
 
@@ -562,7 +1451,11 @@ class MFE:
             self,
             transform_cat: bool,
             rescale: t.Optional[str] = None,
-            rescale_args: t.Optional[t.Dict[str, t.Any]] = None) -> np.ndarray:
+            rescale_args: t.Optional[t.Dict[str, t.Any]] = None,
+            dtype: t.Optional[str] = None,
+            warn_copies: bool = False,
+            frame: t.Optional[t.Any] = None,
+            data_cat: t.Optional[np.ndarray] = None) -> np.ndarray:
         """Returns numeric data from the fitted dataset.
 
         Args:
@@ -575,6 +1468,22 @@ class MFE:
             rescale_args (:obj:`dict`, optional): check ``fit`` documentation
                 for more information about this parameter.
 
+            dtype (:obj:`str`, optional): check ``fit`` documentation for
+                more information about this parameter.
+
+            warn_copies (:obj:`bool`, optional): if True, warn about every
+                copy of the fitted data made by this method.
+
+            frame (:obj:`pd.DataFrame`, optional): the DataFrame ``X`` was
+                fitted from, if any. If ``X`` has :obj:`object` type (i.e.,
+                the DataFrame columns have distinct types), then the numeric
+                columns are read from the DataFrame as a float array instead.
+
+            data_cat (:obj:`np.ndarray`, optional): categorical data codes,
+                as returned by ``_set_data_categoric``. If given, and the co-
+                des were not read from a DataFrame, the categorical attribu-
+                tes are binarized from them (check ``transform_cat``).
+
         Returns:
             np.ndarray: processed numerical data. If no need for changes from
                 the original dataset, then this method does not create a copy
@@ -584,10 +1493,52 @@ class MFE:
 
         Raises:
             TypeError: if ``X`` or ``_attr_indexes_num`` instance attributes
-                are :obj:`NoneType`. This can be avoided passing valid data
+                are :obj:`NoneType` (also ``_attr_indexes_cat`` if ``trans-
+                form_cat`` is True). This can be avoided passing valid data
                 to fit and first calling ``_fill_col_ind_by_type`` instance
                 method before this method.
         """
+        data_num = self._select_data_numeric(warn_copies=warn_copies,
+                                             frame=frame)
+
+        if transform_cat:
+            categorical_dummies = self._get_categorical_dummies(data_cat)
+
+            if categorical_dummies is not None:
+                data_num = np.concatenate((data_num, categorical_dummies),
+                                          axis=1).astype(float)
+
+                if warn_copies:
+                    _internal.warn_copy(
+                        "N", "categorical attributes are binarized "
+                        '(check "transform_cat" argument)')
+
+        if rescale:
+            data_num = _internal.rescale_data(
+                data=data_num, option=rescale, args=rescale_args)
+
+            if warn_copies:
+                _internal.warn_copy(
+                    "N", 'it is rescaled (check "rescale" argument)')
+
+        if dtype is not None and data_num.dtype != dtype:
+            data_num = data_num.astype(dtype)
+
+            if warn_copies:
+                _internal.warn_copy(
+                    "N", 'it is cast to "{0}" (check "dtype" argument)'.format(
+                        dtype))
+
+        return data_num
+
+    def _select_data_numeric(self,
+                             warn_copies: bool = False,
+                             frame: t.Optional[t.Any] = None) -> np.ndarray:
+        """Select the numeric columns of the fitted data.
+
+        Check ``_set_data_numeric`` for more information about the arguments
+        and the exceptions raised.
+        """
         if self.X is None:
             raise TypeError("It is necessary to fit valid data into the "
                             'model before setting up numeric data. ("X" '
@@ -598,22 +1549,89 @@ class MFE:
                             "attributes. Please be sure to call method "
                             '"_fill_col_ind_by_type" before this method.')
 
-        data_num = self.X[:, self._attr_indexes_num]
+        if frame is not None and self.X.dtype.kind == "O":
+            data_num = _internal.select_frame_num_columns(
+                frame, self._attr_indexes_num)
 
-        if transform_cat:
-            categorical_dummies = _internal.transform_cat(
-                self.X[:, self._attr_indexes_cat])
+            if warn_copies and data_num.size:
+                _internal.warn_copy(
+                    "N", "it is read from the DataFrame numeric columns")
 
-            if categorical_dummies is not None:
-                data_num = np.concatenate((data_num, categorical_dummies),
-                                          axis=1).astype(float)
+            return data_num
 
-        if rescale:
-            data_num = _internal.rescale_data(
-                data=data_num, option=rescale, args=rescale_args)
+        data_num = _internal.select_columns(self.X, self._attr_indexes_num)
+
+        if (warn_copies and data_num.size
+                and not np.may_share_memory(data_num, self.X)):
+            _internal.warn_copy("N", "its columns are not consecutive in X")
 
         return data_num
 
+    def _get_categorical_dummies(
+            self,
+            data_cat: t.Optional[np.ndarray] = None) -> t.Optional[np.ndarray]:
+        """Binarize the categorical attributes of the fitted data.
+
+        Args:
+            data_cat (:obj:`np.ndarray`, optional): categorical data codes,
+                as returned by ``_set_data_categoric``. If given, and the co-
+                des were not read from a DataFrame, the categorical attribu-
+                tes are binarized from them (check ``_internal.transform_-
+                cat``).
+
+        Returns:
+            np.ndarray: the binarized categorical attributes, or :obj:`None-
+                Type` if there is no categorical attribute.
+
+        Raises:
+            TypeError: if ``X`` or ``_attr_indexes_cat`` instance attributes
+                are :obj:`NoneType`.
+        """
+        if self.X is None or self._attr_indexes_cat is None:
+            raise TypeError("No information about indexes of categoric "
+                            "attributes. Please be sure to call method "
+                            '"_fill_col_ind_by_type" before this method.')
+
+        cat_codes = None  # type: t.Optional[np.ndarray]
+
+        if data_cat is not None and not self._cat_from_codes:
+            num_cat = len(self._attr_indexes_cat)
+            cat_codes = data_cat[:, :num_cat]
+
+        return _internal.transform_cat(
+            _internal.select_columns(self.X, self._attr_indexes_cat),
+            cat_codes=cat_codes,
+            cat_cardinalities=self._cat_cardinalities)
+
+    def _fingerprint_fitted_data(
+            self, data_cat: t.Optional[np.ndarray] = None) -> str:
+        """Compute the content fingerprint of the fitted data.
+
+        Check ``_cache.fingerprint_data`` for more information.
+
+        Args:
+            data_cat (:obj:`np.ndarray`, optional): integer codes of the pro-
+                cessed categorical data (check ``_set_data_categoric``). If
+                given, the categorical attributes are hashed by its codes,
+                instead of factorizing them again.
+
+        Raises:
+            TypeError: if ``X``, ``y`` or the attribute indexes of each type
+                are :obj:`NoneType`.
+        """
+        if (self.X is None or self.y is None
+                or self._attr_indexes_num is None
+                or self._attr_indexes_cat is None):
+            raise TypeError("It is necessary to fit valid data into the "
+                            "model before computing its fingerprint.")
+
+        return _cache.fingerprint_data(
+            X=self.X,
+            y=self.y,
+            attr_indexes_num=self._attr_indexes_num,
+            attr_indexes_cat=self._attr_indexes_cat,
+            cat_codes=data_cat)
+
     def fit(
             self,
             X: t.Sequence,
@@ -627,15 +1645,36 @@ class MFE:
             # missing_data: str = "ignore",
             precomp_groups: str = "all",
             wildcard: str = "all",
+            enable_parallel: bool = False,
+            lazy_precomp: bool = False,
+            copy: bool = True,
+            dtype: t.Optional[t.Union[str, np.dtype]] = None,
             suppress_warnings: bool = False,
     ) -> "MFE":
         """Fits dataset into an MFE model.
 
         Args:
-            X (:obj:`Sequence`): predictive attributes of the dataset.
+            X (:obj:`Sequence`): predictive attributes of the dataset. It may
+                be a memory-mapped array (e.g., ``np.load(path, mmap_mode="r")``
+                or a :obj:`np.memmap`), which is never copied into memory (check
+                the ``copy`` argument). For datasets bigger than the memory,
+                avoid the arguments which build new versions of the data
+                (``transform_num``, ``transform_cat`` with categorical attri-
+                butes and ``rescale``) and the groups whose methods need all
+                data in memory (e.g., ``landmarking`` and ``model-based``).
+
+                It may also be a :obj:`pd.DataFrame`. In this case, if ``cat-
+                _cols`` is ``auto``, then the column types decide which attri-
+                butes are categorical (columns with :obj:`pd.Categorical-
+                Dtype` or non-numeric values). The numeric attributes are
+                read from the DataFrame as a float array, with no conversion
+                from :obj:`object` type, and the integer codes of categorical
+                columns are used as the categorical data (if every categori-
+                cal attribute has :obj:`pd.CategoricalDtype`).
 
             y (:obj:`Sequence`): target attributes of the dataset, assuming
-                that it is a supervised task.
+                that it is a supervised task. It may also be memory-mapped,
+                or a :obj:`pd.Series`.
 
             transform_num (:obj:`bool`, optional): if True, numeric attributes
                 are discretized using equal-frequency histogram technique to
@@ -709,31 +1748,105 @@ class MFE:
             wildcard (:obj:`str`, optional): value used as ``select all`` for
                 ``precomp_groups``.
 
+            enable_parallel (:obj:`bool`, optional): if True, precomputation
+                methods with no dependencies between them run simultaneously
+                in a pool of at most ``n_jobs`` (check ``MFE`` instantiation
+                arguments) threads. A precomputation method always runs after
+                every method producing some value it needs (check the ``PRE-
+                COMPUTE_PRODUCES`` attribute of the metafeature group clas-
+                ses). The precomputed values are the same as in the sequen-
+                tial fit.
+
+            lazy_precomp (:obj:`bool`, optional): if True, no precomputation
+                method is called while fitting. Instead, each one is called
+                only the first time some selected metafeature-extraction me-
+                thod needs a value produced by it (e.g., ``cov_mat``, ``mo-
+                del`` or ``skf``), and its values are cached afterwards. This
+                makes fitting nearly free when only a few metafeatures are
+                selected. Note that the time elapsed in a precomputation me-
+                thod is then measured as part of the first metafeature which
+                needs its values. If True, ``enable_parallel`` is ignored.
+
+            copy (:obj:`bool`, optional): if True, the model keeps copies of
+                ``X`` and ``y``. Otherwise, the model keeps read-only views of
+                them (and of its numeric and categorical columns) whenever
+                possible, so the memory used by the fitted data stays close to
+                the size of ``X``. In this case, a warning is invoked for
+                every copy of the data the model is still forced to make (e.g.,
+                if ``X`` is not a :obj:`np.ndarray`, or due to ``transform_-
+                num``, ``transform_cat`` or ``rescale`` arguments). Note that
+                changing ``X`` or ``y`` after fitting them with ``copy=False``
+                also changes the fitted data.
+
+            dtype (:obj:`str` or :obj:`np.dtype`, optional): floating point
+                type of the numeric data (``N``). Must be either ``float32``
+                or ``float64``. If :obj:`NoneType`, numeric data keeps its
+                original type (float64 for non-floating data). With ``float32``
+                the numeric data takes half the memory, and so do the statis-
+                tical precomputed matrices (e.g., ``cov_mat`` and ``abs_corr_-
+                mat``), which are computed in single precision. Means are
+                still accumulated in float64, so the metafeature values devi-
+                ate from the float64 ones only by a relative error close to
+                the float32 resolution (about 1e-6 for well-conditioned data).
+
             suppress_warnings (:obj:`bool`, optional): if True, ignore all war-
                 nings invoked while fitting dataset.
 
         Raises:
-            ValueError: if the number of rows of X and y length does not match.
-            TypeError: if X or y (or both) is neither a :obj:`list` or a
-                :obj:`np.ndarray` object.
+            ValueError: if the number of rows of X and y length does not match,
+                or if ``dtype`` is not a valid option.
+            TypeError: if X or y (or both) is neither a :obj:`list`, a
+                :obj:`np.ndarray` nor a pandas object.
 
         Returns:
             MFE: the instance itself, to allow inline instantiation-and-fit co-
             de such as ``model = MFE(...).fit(...)`` or inline fit-and-extrac-
             tion ``result = MFE(...).fit(...).extract(...)``.
         """
-        self.X, self.y = _internal.check_data(X, y)
+        frame = X if _internal.is_dataframe(X) else None
+
+        self.X, self.y = _internal.check_data(
+            X, y, copy=copy, suppress_warnings=suppress_warnings)
 
         rescale = _internal.process_generic_option(
             value=rescale, group_name="rescale", allow_none=True)
 
-        self._fill_col_ind_by_type(cat_cols=cat_cols, check_bool=check_bool)
+        if dtype is not None and not isinstance(dtype, str):
+            dtype = np.dtype(dtype).name
 
-        data_cat = self._set_data_categoric(transform_num=transform_num)
+        dtype = _internal.process_generic_option(
+            value=dtype, group_name="dtype", allow_none=True)
+
+        self._fill_col_ind_by_type(cat_cols=cat_cols, check_bool=check_bool,
+                                   frame=frame)
+
+        warn_copies = not copy and not suppress_warnings
+
+        data_cat = self._set_data_categoric(
+            transform_num=transform_num, warn_copies=warn_copies, frame=frame)
         data_num = self._set_data_numeric(
             transform_cat=transform_cat,
             rescale=rescale,
-            rescale_args=rescale_args)
+            rescale_args=rescale_args,
+            dtype=dtype,
+            warn_copies=warn_copies,
+            frame=frame,
+            data_cat=data_cat)
+
+        self._fit_config = (transform_num, transform_cat, rescale,
+                            rescale_args, cat_cols, check_bool, dtype)
+
+        self._precomp_config = {
+            "precomp_groups": precomp_groups,
+            "wildcard": wildcard,
+            "enable_parallel": enable_parallel,
+            "lazy": lazy_precomp,
+        }
+
+        self._partial_fit_stats = {}
+        self.precomp_updated = tuple()
+
+        self.fingerprint = self._fingerprint_fitted_data(data_cat)
 
         # Custom arguments for metafeature extraction methods
         self._custom_args_ft = {
@@ -745,6 +1858,8 @@ class MFE:
             "score": self.score,
             "random_state": self.random_state,
             "cat_cols": self._attr_indexes_cat,
+            "cat_cardinalities": self._cat_cardinalities,
+            "attr_num_distinct": self._attr_num_distinct,
         }
 
         self._precomp_args_ft = _internal.process_precomp_groups(
@@ -752,23 +1867,243 @@ class MFE:
             groups=self.groups,
             wildcard=wildcard,
             suppress_warnings=suppress_warnings,
+            enable_parallel=enable_parallel,
+            n_jobs=self.n_jobs,
+            lazy=lazy_precomp,
+            callbacks=self.callbacks,
             **self._custom_args_ft)
 
-        # Custom arguments for summarization methods
-        self._custom_args_sum = {
-            "ddof": 1,
+        self._compile_binding_plans()
+
+        return self
+
+    def partial_fit(self,
+                    X: t.Sequence,
+                    y: t.Sequence,
+                    suppress_warnings: bool = False) -> "MFE":
+        """Append new instances to the fitted data.
+
+        The new instances are transformed with the same options of the last
+        ``fit`` call, keeping the numeric and categorical column types de-
+        tected there. The precomputed values behind ``general``, ``statis-
+        tical`` and ``info-theory`` groups (class frequencies, covariance and
+        correlation matrices and entropies) are updated incrementally, merg-
+        ing the sufficient statistics of the previous instances with the ones
+        of the new instances (check ``_internal.update_precomp_args``). Every
+        other precomputed value (e.g., the ``landmarking`` and ``model-ba-
+        sed`` ones) is recomputed from all instances. The names of the up-
+        dated values are kept in the ``precomp_updated`` attribute.
+
+        Note that rescaling the numeric data (``rescale`` argument of ``fit``)
+        or discretizing it (``transform_num``) depends on all instances, so
+        the values derived from the transformed data are recomputed in these
+        cases.
+
+        Args:
+            X (:obj:`Sequence`): new instances of the independent attributes,
+                with the same columns of the fitted ``X``.
+
+            y (:obj:`Sequence`): target attribute of the new instances.
+
+            suppress_warnings (:obj:`bool`, optional): if True, ignore all war-
+                nings invoked while updating the fitted data.
+
+        Raises:
+            TypeError: if the model was not fitted yet.
+            ValueError: if the number of columns of ``X`` does not match the
+                fitted data.
+
+        Returns:
+            MFE: the instance itself, to allow inline update-and-extraction
+            code such as ``result = model.partial_fit(...).extract(...)``.
+        """
+        if (self.X is None or self.y is None or self._fit_config is None
+                or self._custom_args_ft is None
+                or self._precomp_config is None):
+            raise TypeError('Fitted data not found. Call "fit" method before '
+                            '"partial_fit".')
+
+        # The new instances are copied by the concatenation below anyway
+        X_new, y_new = _internal.check_data(X, y, copy=False,
+                                            suppress_warnings=True)
+
+        if X_new.shape[1] != self.X.shape[1]:
+            raise ValueError('"X" number of columns ({0}) does not match the '
+                             "fitted data ({1}).".format(
+                                 X_new.shape[1], self.X.shape[1]))
+
+        transform_num, transform_cat, rescale, rescale_args, _, _, dtype = (
+            self._fit_config)
+
+        custom_args_prev = self._custom_args_ft
+        precomp_args_prev = self._get_known_precomp_args()
+
+        self.X = np.concatenate((self.X, X_new))
+        self.y = np.concatenate((self.y, y_new))
+
+        data_cat = self._set_data_categoric(transform_num=transform_num)
+        data_num = self._set_data_numeric(
+            transform_cat=transform_cat,
+            rescale=rescale,
+            rescale_args=rescale_args,
+            dtype=dtype,
+            data_cat=data_cat)
+
+        updated_vals = self._update_precomp_vals(
+            precomp_args_prev=precomp_args_prev,
+            data_num=data_num,
+            data_cat=data_cat,
+            y=self.y,
+            data_num_prev=custom_args_prev["N"],
+            data_cat_prev=custom_args_prev["C"],
+            update_num=rescale is None,
+            update_cat=not (transform_num and self._attr_indexes_num))
+
+        self.fingerprint = self._fingerprint_fitted_data(data_cat)
+
+        # The distinct values counted by 'fit' miss the new instances
+        self._attr_num_distinct = None
+
+        self._custom_args_ft = {
+            **self._custom_args_ft,
+            "X": self.X,
+            "N": data_num,
+            "C": data_cat,
+            "cat_cardinalities": self._cat_cardinalities,
+            "attr_num_distinct": self._attr_num_distinct,
+            "y": self.y,
         }
 
+        self._precomp_args_ft = _internal.process_precomp_groups(
+            groups=self.groups,
+            suppress_warnings=suppress_warnings,
+            n_jobs=self.n_jobs,
+            precomp_vals=updated_vals,
+            callbacks=self.callbacks,
+            **self._precomp_config,
+            **self._custom_args_ft)
+
+        self.precomp_updated = tuple(sorted(updated_vals))
+
+        self._compile_binding_plans()
+
         return self
 
+    def _get_known_precomp_args(self) -> t.Dict[str, t.Any]:
+        """Get the precomputed values already computed for the fitted data.
+
+        Raises:
+            TypeError: if the model was not fitted yet.
+        """
+        if self._precomp_args_ft is None:
+            raise TypeError('No precomputed values found. Call "fit" method '
+                            "first.")
+
+        if isinstance(self._precomp_args_ft, _internal.LazyPrecompArgs):
+            return self._precomp_args_ft.known_values
+
+        return dict(self._precomp_args_ft)
+
+    def _update_precomp_vals(self,
+                             precomp_args_prev: t.Dict[str, t.Any],
+                             data_num: np.ndarray,
+                             data_cat: np.ndarray,
+                             y: np.ndarray,
+                             data_num_prev: np.ndarray,
+                             data_cat_prev: np.ndarray,
+                             update_num: bool = True,
+                             update_cat: bool = True) -> t.Dict[str, t.Any]:
+        """Update the precomputed values with the instances appended.
+
+        The new instances are the rows of ``data_num``, ``data_cat`` and ``y``
+        after the rows of ``data_num_prev`` and ``data_cat_prev``, which are the
+        data before ``partial_fit``. The values derived from the numeric (or
+        categorical) data are only updated if ``update_num`` (``update_cat``)
+        is True and the previous data is kept unchanged by the new instances.
+        Check ``_internal.update_precomp_args`` for more information.
+
+        Returns:
+            dict: the updated precomputed values.
+        """
+        num_inst_prev = data_num_prev.shape[0]
+
+        update_num = (update_num
+                      and data_num.shape[1] == data_num_prev.shape[1])
+
+        update_cat = (update_cat
+                      and data_cat.shape[1] == data_cat_prev.shape[1]
+                      and np.array_equal(data_cat[:num_inst_prev],
+                                         data_cat_prev))
+
+        updated_vals, self._partial_fit_stats = (
+            _internal.update_precomp_args(
+                precomp_args=precomp_args_prev,
+                N=data_num,
+                C=data_cat,
+                y=y,
+                num_inst_prev=num_inst_prev,
+                cat_cardinalities=self._cat_cardinalities,
+                update_num=update_num,
+                update_cat=update_cat,
+                partial_fit_stats=self._partial_fit_stats))
+
+        return updated_vals
+
+    def _check_extraction(
+            self,
+            parallel_backend: str = "auto",
+            timeout_per_feature: t.Optional[float] = None,
+            total_timeout: t.Optional[float] = None) -> str:
+        """Check if the model is ready to extract metafeatures.
+
+        Returns:
+            str: ``parallel_backend`` in its canonical form.
+
+        Raises:
+            TypeError: if the model was not fitted yet.
+            ValueError: if ``parallel_backend`` is not a valid option, or if
+                either ``timeout_per_feature`` or ``total_timeout`` is not
+                :obj:`NoneType` nor a positive number.
+        """
+        for timeout_name, timeout_val in (
+                ("timeout_per_feature", timeout_per_feature),
+                ("total_timeout", total_timeout)):
+            if timeout_val is not None and (
+                    isinstance(timeout_val, bool)
+                    or not isinstance(timeout_val, (int, float))
+                    or timeout_val <= 0):
+                raise ValueError(
+                    'Invalid "{0}" argument ({1}). Expecting None or a '
+                    'positive number.'.format(timeout_name, timeout_val))
+
+        if self.X is None or self.y is None:
+            raise TypeError("Fitted data not found. Call "
+                            '"fit" method before "extract".')
+
+        if (not isinstance(self.X, np.ndarray)
+                or not isinstance(self.y, np.ndarray)):
+            self.X, self.y = _internal.check_data(self.X, self.y)
+
+        backend = _internal.process_generic_option(
+            value=parallel_backend, group_name="parallel_backend")
+
+        # None is only accepted with "allow_none", so it is never returned
+        assert backend is not None
+
+        return backend
+
     def extract(
             self,
             remove_nan: bool = True,
             verbose: bool = False,
             enable_parallel: bool = False,
+            parallel_backend: str = "auto",
+            timeout_per_feature: t.Optional[float] = None,
+            total_timeout: t.Optional[float] = None,
             # by_class: bool = False,
+            out_type: t.Type = tuple,
             suppress_warnings: bool = False,
-            **kwargs) -> t.Tuple[t.List, ...]:
+            **kwargs) -> t.Union[t.Tuple[t.List, ...], MFEResult]:
         """Extracts metafeatures from the previously fitted dataset.
 
         Args:
@@ -785,11 +2120,62 @@ class MFE:
                 gument below).
 
             enable_parallel (:obj:`bool`, optional): if True, then the metafea-
-                ture extraction is done with multi-processes. Currently, this
-                argument has no effect by now (to be implemented).
+                ture extraction is done with multi-processes, running the fea-
+                ture-extraction methods in a pool of at most ``n_jobs`` (check
+                ``MFE`` instantiation arguments) worker processes. The summa-
+                rization of the extracted values still happens in the main
+                process. The returned values are the same, and in the same
+                order, as in the sequential extraction.
+
+            parallel_backend (:obj:`str`, optional): type of workers used when
+                ``enable_parallel`` is True. Must be one of the following:
+
+                1. ``process``: every method runs in a pool of processes. The
+                    fitted data is copied to the worker processes, so this op-
+                    tion suits Python-heavy methods (e.g., landmarking cross-
+                    validation loops).
+                2. ``thread``: every method runs in a pool of threads, sharing
+                    the fitted data with no copies. Suitable for methods whose
+                    work is done by routines which release the GIL (e.g., most
+                    of NumPy and SciPy linear algebra routines).
+                3. ``auto``: methods hinted as thread-friendly by its metafea-
+                    ture group class (``THREAD_FRIENDLY_MTDS`` class attribute)
+                    run in threads, and all others run in processes.
+
+            timeout_per_feature (:obj:`float`, optional): maximum time, in se-
+                conds, which each feature-extraction method may run. If not
+                :obj:`NoneType`, every method runs in its own process, which
+                is terminated when this limit is exceeded, so the work done
+                is effectively stopped. The values of a method timed out are
+                set to :obj:`np.nan` and a ``timed out`` warning is invoked
+                (unless ``suppress_warnings`` is True). To tell them apart
+                from values computed as :obj:`np.nan`, use ``out_type=MFERe-
+                sult`` and check its ``timed_out`` attribute. The values of every
+                method finished in time are still returned. If a method re-
+                turns an array, it gets a single :obj:`np.nan` value for each
+                summary function. If ``enable_parallel`` is True, then at
+                most ``n_jobs`` methods run simultaneously; ``parallel_back-
+                end`` is ignored in this case.
+
+            total_timeout (:obj:`float`, optional): maximum time, in seconds,
+                for the extraction of all metafeatures. Any method still run-
+                ning when this limit is exceeded is terminated, and all meth-
+                ods not started yet are not run at all. They are all treated
+                just like the methods timed out by ``timeout_per_feature``.
 
             by_class (:obj:`bool, optional): not implemented yet.
 
+            out_type (:obj:`type`, optional): type of the return value. Must
+                be either :obj:`tuple` (the default return value, described
+                below) or :obj:`MFEResult` (check ``pymfe.result`` module),
+                which keeps the identifiers in a tuple shared by every result
+                with the same identifiers, and the values and times elapsed
+                in contiguous :obj:`np.float64` arrays. The latter is cheaper
+                to keep, convert to NumPy or pandas and stack (check ``MFERe-
+                sult.stack``) for many datasets, but requires every value to
+                be a single number (i.e., it does not support extraction with-
+                out summary functions).
+
             suppress_warnings (:obj:`bool`, optional): if True, do not show
                 warnings about unknown user custom parameters for feature ex-
                 traction and summary methods passed via **kwargs. Note that
@@ -848,14 +2234,15 @@ class MFE:
 
             Raises:
                 TypeError: if calling ``extract`` method before ``fit`` method.
+                ValueError: if ``out_type`` is neither :obj:`tuple` nor :obj:`M-
+                    FEResult`.
         """
-        if self.X is None or self.y is None:
-            raise TypeError("Fitted data not found. Call "
-                            '"fit" method before "extract".')
+        self._check_out_type(out_type)
 
-        if (not isinstance(self.X, np.ndarray)
-                or not isinstance(self.y, np.ndarray)):
-            self.X, self.y = _internal.check_data(self.X, self.y)
+        parallel_backend = self._check_extraction(
+            parallel_backend=parallel_backend,
+            timeout_per_feature=timeout_per_feature,
+            total_timeout=total_timeout)
 
         if verbose:
             print("Started the metafeature extraction process.")
@@ -864,16 +2251,50 @@ class MFE:
             remove_nan=remove_nan,
             verbose=verbose,
             enable_parallel=enable_parallel,
+            parallel_backend=parallel_backend,
+            timeout_per_feature=timeout_per_feature,
+            total_timeout=total_timeout,
             suppress_warnings=suppress_warnings,
             **kwargs)
 
-        if results and results[0]:
-            # Sort results by metafeature name
-            results = tuple(
-                map(list, zip(*sorted(zip(*results),
-                                      key=lambda item: item[0]))))
+        return self._build_output(results, out_type=out_type, verbose=verbose)
+
+    @staticmethod
+    def _check_out_type(out_type: t.Type) -> None:
+        """Check the ``out_type`` argument of the extraction methods.
+
+        Raises:
+            ValueError: if ``out_type`` is neither :obj:`tuple` nor :obj:`M-
+                FEResult`.
+        """
+        if out_type not in (tuple, MFEResult):
+            raise ValueError('Invalid "out_type" argument ({0}). Expecting '
+                             "tuple or MFEResult.".format(out_type))
 
-        res_names, res_vals, res_times = results
+    def _build_output(
+            self,
+            results: _TypeGatheredResults,
+            out_type: t.Type = tuple,
+            verbose: bool = False,
+    ) -> t.Union[t.Tuple[t.List, ...], MFEResult]:
+        """Build the return value of ``extract`` method.
+
+        Args:
+            results (:obj:`tuple`): the values extracted, as returned by
+                ``_gather_results`` method.
+
+            out_type (:obj:`type`, optional): check ``extract`` method.
+
+            verbose (:obj:`bool`, optional): if True, print the number of
+                values and the time elapsed.
+        """
+        res_names, res_vals, res_times, res_timed_out = results
+
+        # Sort results by metafeature name
+        sort_inds = np.argsort(res_names, kind="mergesort")
+        res_names = [res_names[ind] for ind in sort_inds]
+        res_vals, res_times = res_vals[sort_inds], res_times[sort_inds]
+        res_timed_out = res_timed_out[sort_inds]
 
         if verbose:
             if self._timeopt_type_is_avg():
@@ -885,10 +2306,496 @@ class MFE:
                 "Metafeature extraction process done.",
                 "Total of {0} values obtained. Time elapsed "
                 "({1}) = {2:.8f} seconds.".format(
-                    len(res_vals), time_type, sum(res_times)),
+                    res_vals.size, time_type, res_times.sum()),
                 sep="\n")
 
+        if res_vals.dtype == object and out_type is tuple:
+            # Values not summarized, which may not be single numbers
+            if self.timeopt:
+                return res_names, res_vals.tolist(), res_times.tolist()
+
+            return res_names, res_vals.tolist()
+
+        res = MFEResult(names=res_names,
+                        values=res_vals,
+                        times=res_times if self.timeopt else None,
+                        timed_out=res_timed_out)
+
+        if out_type is MFEResult:
+            return res
+
+        return res.to_tuple()
+
+    def iter_extract(
+            self,
+            remove_nan: bool = True,
+            verbose: bool = False,
+            enable_parallel: bool = False,
+            parallel_backend: str = "auto",
+            timeout_per_feature: t.Optional[float] = None,
+            total_timeout: t.Optional[float] = None,
+            suppress_warnings: bool = False,
+            **kwargs) -> t.Iterator[t.Tuple[str, t.Any, float]]:
+        """Extracts metafeatures from the fitted dataset one at a time.
+
+        This is the streaming version of ``extract`` method: every value is
+        yielded as soon as the feature-extraction method which originated it
+        and its summarization finish, so there is no need to wait for all
+        metafeatures to be extracted before handling the first values.
+
+        The arguments are the same of ``extract`` method. Check its documen-
+        tation for more information.
+
+        Yields:
+            tuple(str, any, float): the identifier of a summarized value (in
+                the form ``feature_name.summary_mtd_name``), the value itself
+                and the time elapsed to compute it, according to the ``mea-
+                sure_time`` instantiation argument (this time has no meaning
+                if ``measure_time`` is :obj:`NoneType`).
+
+                The values of a same feature-extraction method are yielded
+                sorted by identifier. If ``enable_parallel`` is False, the
+                feature-extraction methods are run in the same order of the
+                ``features`` attribute; otherwise, they are yielded in their
+                completion order.
+
+        Raises:
+            TypeError: if calling ``iter_extract`` method before ``fit``.
+        """
+        # Checked here, and not inside the generator, to raise any error
+        # right away instead of only in the first iteration
+        parallel_backend = self._check_extraction(
+            parallel_backend=parallel_backend,
+            timeout_per_feature=timeout_per_feature,
+            total_timeout=total_timeout)
+
+        ft_results = self._iter_feature_methods(
+            remove_nan=remove_nan,
+            verbose=verbose,
+            enable_parallel=enable_parallel,
+            parallel_backend=parallel_backend,
+            timeout_per_feature=timeout_per_feature,
+            total_timeout=total_timeout,
+            suppress_warnings=suppress_warnings,
+            **kwargs)
+
+        return (record
+                for names, vals, times, _ in ft_results
+                for record in sorted(zip(names, vals.tolist(), times.tolist()),
+                                     key=lambda item: item[0]))
+
+    def extract_chunked(
+            self,
+            chunks: t.Iterable[np.ndarray],
+            remove_nan: bool = True,
+            verbose: bool = False,
+            suppress_warnings: bool = False,
+            out_type: t.Type = tuple,
+            **kwargs) -> t.Union[t.Tuple[t.List, ...], MFEResult]:
+        """Extracts metafeatures from numerical attributes read by blocks of rows.
+
+        Only the selected metafeatures which can be derived from the suffi-
+        cient statistics of blocks of instances (check ``CHUNKED_FEATURES``
+        attribute of ``MFEStatistical`` class) are extracted, and ``chunks``
+        is read in a single pass. Hence, the memory used is bounded by the
+        size of a block plus the size of the covariance matrix, independent-
+        ly of the number of instances. The values are summarized just like
+        in ``extract`` method, and the model does not need to be fitted.
+
+        Args:
+            chunks (:obj:`Iterable` of :obj:`np.ndarray`): blocks of rows of
+                the numerical attributes, all with the same columns. It may be
+                any iterable (e.g., a generator reading a file). The values
+                are used as they are (i.e., with none of the transformations
+                of ``fit`` method, such as ``rescale``).
+
+            remove_nan (:obj:`bool`, optional): check ``extract`` method.
+
+            verbose (:obj:`bool`, optional): check ``extract`` method.
+
+            suppress_warnings (:obj:`bool`, optional): if True, do not warn
+                about the selected metafeatures not supported, and about un-
+                known user custom arguments. Check also ``extract`` method.
+
+            out_type (:obj:`type`, optional): check ``extract`` method.
+
+            **kwargs: user custom arguments of the metafeatures (e.g., ``ske-
+                wness={"method": 2}``) and summary functions, just like in
+                ``extract`` method.
+
+        Returns:
+            tuple or MFEResult: the same of ``extract`` method. The time ela-
+                psed by each metafeature includes an equal share of the time
+                to read ``chunks``.
+
+        Raises:
+            ValueError: if ``out_type`` is neither :obj:`tuple` nor :obj:`M-
+                FEResult`, if no selected metafeature is supported, or if
+                ``chunks`` has no instances.
+        """
+        self._check_out_type(out_type)
+
+        stat_class = _internal.get_mfe_class("statistical")
+
+        ft_mtd_names = [
+            ft_mtd_name
+            for ft_mtd_name, ft_mtd_callable, _ in self._metadata_mtd_ft
+            if _internal.get_mtd_group(ft_mtd_callable) == "statistical"
+            and _internal.remove_prefix(value=ft_mtd_name,
+                                        prefix=_internal.MTF_PREFIX) in
+            stat_class.CHUNKED_FEATURES
+        ]
+
+        if not ft_mtd_names:
+            raise ValueError("No selected metafeature is supported in the "
+                             "chunked mode. Please select values in "
+                             "{0}.".format(stat_class.CHUNKED_FEATURES))
+
+        if (not suppress_warnings
+                and len(ft_mtd_names) < len(self._metadata_mtd_ft)):
+            warnings.warn(
+                "Metafeatures not supported in the chunked mode will not be "
+                "extracted: {0}.".format([
+                    _internal.remove_prefix(value=ft_mtd_name,
+                                            prefix=_internal.MTF_PREFIX)
+                    for ft_mtd_name, _, _ in self._metadata_mtd_ft
+                    if ft_mtd_name not in ft_mtd_names
+                ]), UserWarning)
+
+        if self._custom_args_sum is None:
+            self._compile_summary_plans()
+
+        if verbose:
+            print("Started the chunked metafeature extraction process.")
+
+        stats, time_stats = _internal.timeit(
+            stat_class.accumulate_chunk_stats, chunks)
+
+        return self._build_output(
+            self._gather_results(
+                self._iter_chunked_feature_methods(
+                    stats=stats,
+                    ft_mtd_names=ft_mtd_names,
+                    time_stats=time_stats,
+                    remove_nan=remove_nan,
+                    verbose=verbose,
+                    suppress_warnings=suppress_warnings,
+                    **kwargs)),
+            out_type=out_type,
+            verbose=verbose)
+
+    def _iter_chunked_feature_methods(
+            self,
+            stats: t.Dict[str, t.Any],
+            ft_mtd_names: t.Sequence[str],
+            time_stats: float,
+            remove_nan: bool = True,
+            verbose: bool = False,
+            suppress_warnings: bool = False,
+            **kwargs) -> t.Iterator[_TypeFeatResultsStatus]:
+        """Derive the metafeatures of ``extract_chunked`` one at a time.
+
+        Args:
+            stats (:obj:`dict`): sufficient statistics of all instances (check
+                ``MFEStatistical.accumulate_chunk_stats``).
+
+            ft_mtd_names (:obj:`Sequence` of :obj:`str`): names of the fea-
+                ture methods to derive from ``stats``.
+
+            time_stats (:obj:`float`): time elapsed to compute ``stats``,
+                shared equally by every feature method.
+
+        Yields:
+            tuple(list, np.ndarray, np.ndarray, bool): check ``_iter_featu-
+                re_methods``.
+        """
+        stat_class = _internal.get_mfe_class("statistical")
+        chunked_args = tuple(
+            arg_name for arg_name in _internal.get_mtd_args(
+                stat_class.finalize_chunk_stats)
+            if arg_name not in ("stats", "features"))
+
+        for ft_mtd_name in ft_mtd_names:
+            ft_name_without_prefix = _internal.remove_prefix(
+                value=ft_mtd_name, prefix=_internal.MTF_PREFIX)
+
+            user_custom_args = kwargs.get(ft_name_without_prefix) or {}
+
+            if not suppress_warnings:
+                _internal.check_unknown_args(
+                    mtd_name=ft_name_without_prefix,
+                    mtd_args=chunked_args,
+                    user_custom_args=user_custom_args)
+
+            if verbose:
+                print("Extracting {} feature...".format(ft_mtd_name))
+
+            time_start = time.time()
+
+            features = stat_class.finalize_chunk_stats(
+                stats=stats,
+                features=(ft_name_without_prefix, ),
+                **{
+                    arg_name: arg_val
+                    for arg_name, arg_val in user_custom_args.items()
+                    if arg_name in chunked_args
+                })[ft_name_without_prefix]
+
+            time_ft = time.time() - time_start + time_stats / len(
+                ft_mtd_names)
+
+            yield self._summarize_feature(
+                ft_mtd_name=ft_mtd_name,
+                features=features,
+                time_ft=time_ft,
+                remove_nan=remove_nan,
+                verbose=verbose,
+                suppress_warnings=suppress_warnings,
+                **kwargs) + (False, )
+
+    def _clear_fitted_data(self) -> None:
+        """Drop the fitted data and every value derived from it."""
+        self.X, self.y = None, None
+        self._custom_args_ft = None
+        self._custom_args_sum = None
+        self._attr_indexes_num = None
+        self._attr_indexes_cat = None
+        self._attr_num_distinct = None
+        self._cat_from_codes = False
+        self._cat_cardinalities = None
+        self._precomp_args_ft = None
+        self._binding_plans = {}
+        self._fit_config = None
+        self._precomp_config = None
+        self._partial_fit_stats = None
+        self.precomp_updated = None
+        self.fingerprint = None
+
+    def _get_unfitted_copy(self) -> "MFE":
+        """Get a shallow copy of the model without any fitted data."""
+        model = _copy.copy(self)
+        MFE._clear_fitted_data(model)
+
+        return model
+
+    @staticmethod
+    def _init_extract_many_worker(model: "MFE") -> None:
+        """Keep the template model within a ``extract_many`` worker process."""
+        MFE._worker_model = model
+
+    @staticmethod
+    def _extract_many_worker(
+            dataset: t.Union[t.Tuple[t.Sequence, t.Sequence], t.Callable],
+            fit_args: t.Dict[str, t.Any],
+            extract_args: t.Dict[str, t.Any],
+            model: t.Optional["MFE"] = None,
+    ) -> t.Tuple[t.Optional[MFEResult], t.Optional[str]]:
+        """Fit and extract metafeatures from a single ``extract_many`` dataset.
+
+        Args:
+            dataset (:obj:`tuple` or :obj:`Callable`): either a (``X``, ``y``)
+                pair, or a callable with no arguments which returns this pair.
+
+            fit_args (:obj:`dict`): extra arguments for ``fit`` method.
+
+            extract_args (:obj:`dict`): extra arguments for ``extract`` me-
+                thod.
+
+            model (:obj:`MFE`, optional): the unfitted model used to extract
+                the metafeatures. If :obj:`NoneType`, use the model kept with-
+                in the worker process (check ``_init_extract_many_worker``).
+
+        Returns:
+            tuple: the first field is the :obj:`MFEResult` returned by ``ex-
+                tract`` method, and the second one is :obj:`NoneType`. If some-
+                thing went wrong, the first field is :obj:`NoneType` and the
+                second one is the error message.
+
+        Raises:
+            TypeError: if ``model`` is :obj:`NoneType` and no model is kept
+                within the current process.
+        """
+        if model is None:
+            model = MFE._worker_model
+
+        if model is None:
+            raise TypeError("No model to extract metafeatures with. Call "
+                            '"_init_extract_many_worker" first.')
+
+        try:
+            X, y = dataset() if callable(dataset) else dataset
+
+            extract_args = dict(extract_args)
+            extract_args.pop("out_type", None)
+
+            res = model.fit(X=X, y=y, **fit_args).extract(
+                out_type=MFEResult, **extract_args)
+
+        except Exception as err:  # pylint: disable=W0703
+            return None, repr(err)
+
+        finally:
+            # Do not keep the dataset in the worker until the next call
+            MFE._clear_fitted_data(model)
+
+        assert isinstance(res, MFEResult)
+
+        return res, None
+
+    def extract_many(
+            self,
+            datasets: t.Iterable[t.Union[t.Tuple[t.Sequence, t.Sequence],
+                                         t.Callable]],
+            fit_args: t.Optional[t.Dict[str, t.Any]] = None,
+            extract_args: t.Optional[t.Dict[str, t.Any]] = None,
+            enable_parallel: bool = False,
+            verbose: bool = False,
+    ) -> t.Tuple[t.Any, ...]:
+        """Extracts metafeatures from many datasets using the same setup.
+
+        The selected groups, features and summary functions (and any other
+        instantiation argument) are resolved only once, at the instantiation
+        of this model, and shared by every dataset. Each dataset is fitted
+        and extracted independently, so a failure in one dataset does not
+        stop the others. This model itself is not fitted by this method.
+
+        Args:
+            datasets (:obj:`Iterable`): datasets to extract metafeatures from.
+                Every item must be either a pair (``X``, ``y``), as expected
+                by ``fit`` method, or a callable with no arguments returning
+                this pair (a ``loader``). Loaders are called only right before
+                their dataset is processed, so the datasets do not need to be
+                all in memory at the same time. This iterable is consumed
+                lazily.
+
+            fit_args (:obj:`dict`, optional): extra arguments passed to ``fit``
+                method for every dataset (e.g., ``{"cat_cols": "auto"}``).
+
+            extract_args (:obj:`dict`, optional): extra arguments passed to
+                ``extract`` method for every dataset. Note that ``out_type`` is
+                always :obj:`MFEResult` in this case.
+
+            enable_parallel (:obj:`bool`, optional): if True, the datasets are
+                spread over a pool of at most ``n_jobs`` (check ``MFE`` ins-
+                tantiation arguments) worker processes. Each worker receives a
+                copy of this model only once, when it is started, and reuses
+                it for every dataset it processes. Note that, in this case,
+                ``datasets`` items (including loaders) must be picklable.
+
+            verbose (:obj:`bool`, optional): if True, print messages related to
+                the progress of the extraction.
+
+        Returns:
+            tuple: a tuple containing three fields, or four if ``measure_time``
+                instantiation argument is not :obj:`NoneType`.
+
+                The first field is a :obj:`list` with the sorted identifiers
+                of every summarized value extracted from at least one dataset
+                (check ``extract`` method return value).
+
+                The second field is a :obj:`np.ndarray` of shape (number of
+                datasets, number of identifiers). The value at row ``i`` and
+                column ``j`` is the value of the ``j``th identifier for the
+                ``i``th dataset, in the iteration order of ``datasets``. Values
+                not extracted from a dataset are filled with :obj:`np.nan`.
+
+                If ``measure_time`` is not :obj:`NoneType`, then the third field
+                is a :obj:`np.ndarray` with the same shape of the previous one,
+                holding the time elapsed for each value.
+
+                The last field is a :obj:`dict` mapping the index of each da-
+                taset which failed to the error message.
+        """
+        if fit_args is None:
+            fit_args = {}
+
+        if extract_args is None:
+            extract_args = {}
+
+        model = self._get_unfitted_copy()
+        results = []  # type: t.List[t.Optional[MFEResult]]
+        errors = {}  # type: t.Dict[int, str]
+        first_names = []  # type: t.List[t.Tuple[str, ...]]
+
+        def register_result(
+                ind: int,
+                res: t.Optional[MFEResult],
+                err: t.Optional[str]) -> None:
+            """Keep the result of the dataset ``ind``.
+
+            Results with the same identifiers as the first result kept share
+            its identifier tuple, so unpickled results do not hold a copy of
+            the identifiers each.
+            """
+            if res is not None:
+                if not first_names:
+                    first_names.append(res.names)
+
+                elif res.names == first_names[0]:
+                    res.names = first_names[0]
+
+            if ind >= len(results):
+                results.extend((ind - len(results) + 1) * [None])
+
+            results[ind] = res
+
+            if err is not None:
+                errors[ind] = err
+
+            if verbose:
+                print("Done with dataset {0}{1}.".format(
+                    ind, "" if err is None else " (failed: {})".format(err)))
+
+        if enable_parallel:
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.n_jobs,
+                    initializer=MFE._init_extract_many_worker,
+                    initargs=(model, )) as executor:
+
+                # Limit the number of datasets submitted but not done yet to
+                # keep only a few of them in memory at the same time
+                max_pending = 2 * (self.n_jobs or os.cpu_count() or 1)
+                datasets_it = enumerate(datasets)
+                futures = {}  # type: t.Dict[concurrent.futures.Future, int]
+
+                for ind, dataset in itertools.islice(datasets_it,
+                                                     max_pending):
+                    futures[executor.submit(MFE._extract_many_worker, dataset,
+                                            fit_args, extract_args)] = ind
+
+                while futures:
+                    done, _ = concurrent.futures.wait(
+                        futures,
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+
+                    for future in done:
+                        ind = futures.pop(future)
+
+                        try:
+                            res, err = future.result()
+
+                        except Exception as err_pool:  # pylint: disable=W0703
+                            res, err = None, repr(err_pool)
+
+                        register_result(ind, res, err)
+
+                    for ind, dataset in itertools.islice(
+                            datasets_it, len(done)):
+                        futures[executor.submit(
+                            MFE._extract_many_worker, dataset, fit_args,
+                            extract_args)] = ind
+
+        else:
+            for ind, dataset in enumerate(datasets):
+                register_result(ind, *MFE._extract_many_worker(
+                    dataset, fit_args, extract_args, model=model))
+
+        res_names, res_vals, res_times = MFEResult.stack(results)
+
         if self.timeopt:
-            return res_names, res_vals, res_times
+            if res_times is None:
+                res_times = np.full(res_vals.shape, fill_value=np.nan)
+
+            return list(res_names), res_vals, res_times, errors
 
-        return res_names, res_vals
+        return list(res_names), res_vals, errors
@@ -60,6 +60,30 @@ class MFEModelBased:
     method of module ``landmarking``).
     """
 
+    # These methods only inspect the precomputed (and small) tree property
+    # table, so running them in threads avoids copying the fitted data to
+    # worker processes for no gain.
+    THREAD_FRIENDLY_MTDS = frozenset((
+        "ft_leaves",
+        "ft_leaves_branch",
+        "ft_leaves_corrob",
+        "ft_leaves_homo",
+        "ft_leaves_per_class",
+        "ft_nodes",
+        "ft_nodes_per_attr",
+        "ft_nodes_per_inst",
+        "ft_nodes_per_level",
+        "ft_nodes_repeated",
+        "ft_tree_depth",
+        "ft_tree_imbalance",
+        "ft_tree_shape",
+        "ft_var_importance",
+    ))  # type: t.FrozenSet[str]
+
+    PRECOMPUTE_PRODUCES = {
+        "precompute_model_based_class": ("model", "table", "tree_depth"),
+    }  # type: t.Dict[str, t.Tuple[str, ...]]
+
     @classmethod
     def precompute_model_based_class(cls, N: np.ndarray, y: np.ndarray,
                                      random_state: t.Optional[int],
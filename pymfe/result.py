@@ -0,0 +1,232 @@
+"""A module dedicated to the columnar results of metafeature extraction.
+
+Unlike the default return value of ``MFE.extract`` (parallel lists with
+one Python object per value), a ``MFEResult`` keeps the metafeature values
+and times elapsed in contiguous :obj:`np.float64` arrays, alongside an im-
+mutable tuple of identifiers. Results with the same identifiers share a
+single identifier tuple (check ``MAX_SHARED_NAMES``), so many results can
+be stacked into a single matrix with no per-value Python objects.
+"""
+import typing as t
+import collections
+
+import numpy as np
+
+import pymfe._lazy as _lazy
+
+MAX_SHARED_NAMES = 32
+"""Maximum number of distinct identifier tuples shared between results."""
+
+_SHARED_NAMES = collections.OrderedDict(
+)  # type: collections.OrderedDict[t.Tuple[str, ...], t.Tuple[str, ...]]
+
+
+def _intern_names(names: t.Sequence[str]) -> t.Tuple[str, ...]:
+    """Get the shared identifier tuple equal to ``names``.
+
+    The last ``MAX_SHARED_NAMES`` distinct tuples are kept, so results with
+    the same identifiers (e.g., extracted by different models, or unpickled
+    from other processes) point to a single tuple.
+    """
+    names = names if isinstance(names, tuple) else tuple(names)
+    shared_names = _SHARED_NAMES.get(names)
+
+    if shared_names is not None:
+        _SHARED_NAMES.move_to_end(names)
+        return shared_names
+
+    _SHARED_NAMES[names] = names
+
+    if len(_SHARED_NAMES) > MAX_SHARED_NAMES:
+        _SHARED_NAMES.popitem(last=False)
+
+    return names
+
+
+class MFEResult:
+    """Columnar result of a single metafeature extraction.
+
+    Attributes:
+        names (:obj:`tuple` of :obj:`str`): sorted identifiers of every sum-
+            marized value (check ``MFE.extract`` method return value).
+
+        values (:obj:`np.ndarray`): one-dimensional :obj:`np.float64` array
+            with the value of each identifier in ``names``.
+
+        times (:obj:`np.ndarray`, optional): one-dimensional :obj:`np.float64`
+            array with the time elapsed for each value in ``values``, or
+            :obj:`NoneType` if the time was not measured (check ``measure_-
+            time`` argument of ``MFE`` instantiation).
+
+        timed_out (:obj:`np.ndarray`): one-dimensional :obj:`bool` array
+            which is True for each value in ``values`` set to :obj:`np.nan`
+            because its feature-extraction method timed out (check ``time-
+            out_per_feature`` argument of ``MFE.extract``), telling them apart
+            from values computed as :obj:`np.nan`.
+    """
+
+    __slots__ = ("names", "values", "times", "timed_out", "_name_inds")
+
+    def __init__(self,
+                 names: t.Sequence[str],
+                 values: t.Sequence[float],
+                 times: t.Optional[t.Sequence[float]] = None,
+                 timed_out: t.Optional[t.Sequence[bool]] = None):
+        """Build a result from its identifiers, values and times.
+
+        Raises:
+            ValueError: if some value is not a single number (e.g., extrac-
+                tion without summary functions), or if ``names``, ``values``
+                ``times`` and ``timed_out`` lengths do not match.
+        """
+        try:
+            values_arr = np.asarray(values, dtype=np.float64)
+
+        except (TypeError, ValueError):
+            values_arr = None
+
+        if values_arr is None or values_arr.ndim != 1:
+            raise ValueError("Every metafeature value must be a single "
+                             "number to build a MFEResult. Use summary "
+                             "functions, or the default tuple output.")
+
+        times_arr = None  # type: t.Optional[np.ndarray]
+
+        if times is not None:
+            times_arr = np.asarray(times, dtype=np.float64)
+
+        if timed_out is None:
+            timed_out_arr = np.zeros(values_arr.size, dtype=bool)
+
+        else:
+            timed_out_arr = np.asarray(timed_out, dtype=bool)
+
+        if len(names) != values_arr.size or (
+                times_arr is not None and times_arr.shape != values_arr.shape
+        ) or timed_out_arr.shape != values_arr.shape:
+            raise ValueError('"names", "values", "times" and "timed_out" '
+                             "lengths do not match.")
+
+        self.names = _intern_names(names)
+        self.values = values_arr
+        self.times = times_arr
+        self.timed_out = timed_out_arr
+        self._name_inds = None  # type: t.Optional[t.Dict[str, int]]
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    def __getitem__(self, name: str) -> float:
+        """Get the value of the identifier ``name``."""
+        if self._name_inds is None:
+            self._name_inds = {
+                cur_name: ind
+                for ind, cur_name in enumerate(self.names)
+            }
+
+        return self.values[self._name_inds[name]]
+
+    def __getstate__(self) -> t.Tuple:
+        return self.names, self.values, self.times, self.timed_out
+
+    def __setstate__(self, state: t.Tuple) -> None:
+        names, self.values, self.times, self.timed_out = state
+        self.names = _intern_names(names)
+        self._name_inds = None
+
+    def __repr__(self) -> str:
+        return "MFEResult(num_values={0}, times={1})".format(
+            len(self), self.times is not None)
+
+    def to_tuple(self) -> t.Tuple[t.List, ...]:
+        """Convert to the default ``MFE.extract`` return value.
+
+        Returns:
+            tuple(list, list) or tuple(list, list, list): the identifiers and
+                the values, and also the times elapsed if they were measured.
+                Missing values are the :obj:`np.nan` object itself, as in the
+                default ``MFE.extract`` return value.
+        """
+        values = self.values.tolist()
+
+        for ind in np.flatnonzero(np.isnan(self.values)):
+            values[ind] = np.nan
+
+        if self.times is None:
+            return list(self.names), values
+
+        return list(self.names), values, self.times.tolist()
+
+    def to_numpy(self) -> np.ndarray:
+        """Get the array of values, with no copies."""
+        return self.values
+
+    def to_pandas(self) -> t.Any:
+        """Get the values as a :obj:`pd.Series` indexed by identifier."""
+        pd = _lazy.import_object("pandas")
+
+        return pd.Series(self.values, index=pd.Index(self.names, name="name"),
+                         name="value")
+
+    @classmethod
+    def stack(
+            cls,
+            results: t.Sequence[t.Optional["MFEResult"]],
+    ) -> t.Tuple[t.Tuple[str, ...], np.ndarray, t.Optional[np.ndarray]]:
+        """Stack many results into a single matrix.
+
+        Args:
+            results (:obj:`Sequence` of :obj:`MFEResult`): results to stack.
+                Items may be :obj:`NoneType` (e.g., for datasets which failed),
+                which are represented by rows filled with :obj:`np.nan`.
+
+        Returns:
+            tuple(tuple, np.ndarray, np.ndarray): the sorted identifiers of
+                every value in at least one result, the matrix of values of
+                shape (len(results), number of identifiers), and the matrix of
+                times with the same shape (or :obj:`NoneType` if no result has
+                the times elapsed). Values missing in a result are filled with
+                :obj:`np.nan`. If every result shares the same identifiers,
+                the rows are just copied into the matrices.
+        """
+        valid_results = [res for res in results if res is not None]
+        names = tuple()  # type: t.Tuple[str, ...]
+
+        if valid_results:
+            names = valid_results[0].names
+
+        same_names = all(res.names is names or res.names == names
+                         for res in valid_results)
+
+        if not same_names:
+            names = tuple(
+                sorted({name
+                        for res in valid_results for name in res.names}))
+
+        res_vals = np.full((len(results), len(names)), fill_value=np.nan)
+        res_times = None  # type: t.Optional[np.ndarray]
+
+        if any(res.times is not None for res in valid_results):
+            res_times = np.full(res_vals.shape, fill_value=np.nan)
+
+        name_inds = None  # type: t.Optional[t.Dict[str, int]]
+
+        if not same_names:
+            name_inds = {name: ind for ind, name in enumerate(names)}
+
+        for ind_res, res in enumerate(results):
+            if res is None:
+                continue
+
+            if name_inds is None:
+                cols = slice(None)  # type: t.Union[slice, t.List[int]]
+
+            else:
+                cols = [name_inds[name] for name in res.names]
+
+            res_vals[ind_res, cols] = res.values
+
+            if res_times is not None and res.times is not None:
+                res_times[ind_res, cols] = res.times
+
+        return names, res_vals, res_times
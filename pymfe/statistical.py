@@ -12,9 +12,10 @@ References:
 import typing as t
 
 import numpy as np
-import scipy
+import scipy.stats
 
 import pymfe._summary as _summary
+import pymfe._codes as _codes
 
 
 class MFEStatistical:
@@ -63,6 +64,70 @@ class MFEStatistical:
     method of module ``landmarking``).
     """
 
+    # Methods bounded by NumPy/SciPy routines which release the GIL (e.g.,
+    # ``np.cov``, ``np.linalg.eigvals`` and ``np.percentile``). They run in
+    # threads with the ``auto`` parallel backend of MFE ``extract`` method,
+    # while methods with Python-level column loops (``ft_nr_norm``, ``ft_-
+    # skewness`` and ``ft_kurtosis``) run in worker processes.
+    THREAD_FRIENDLY_MTDS = frozenset((
+        "ft_can_cor",
+        "ft_cor",
+        "ft_cov",
+        "ft_eigenvalues",
+        "ft_g_mean",
+        "ft_gravity",
+        "ft_h_mean",
+        "ft_iq_range",
+        "ft_mad",
+        "ft_max",
+        "ft_mean",
+        "ft_median",
+        "ft_min",
+        "ft_nr_cor_attr",
+        "ft_nr_disc",
+        "ft_nr_outliers",
+        "ft_range",
+        "ft_sd",
+        "ft_sd_ratio",
+        "ft_sparsity",
+        "ft_t_mean",
+        "ft_var",
+        "ft_w_lambda",
+    ))  # type: t.FrozenSet[str]
+
+    # Maximum size, in bytes, of each block of columns read at a time by the
+    # column-wise methods (e.g., ``ft_mean`` and ``ft_sd``). It bounds the
+    # temporary arrays of these methods and lets the data of memory-mapped
+    # arrays be paged in (and out) by the operating system block by block.
+    COL_BLOCK_BYTES = 2**26  # type: int
+
+    # Metafeatures which ``extract_chunked`` (and ``MFE.extract_chunked``)
+    # derive from the sufficient statistics of blocks of instances, without
+    # all of ``N`` in memory.
+    CHUNKED_FEATURES = (
+        "cor",
+        "cov",
+        "eigenvalues",
+        "kurtosis",
+        "max",
+        "mean",
+        "min",
+        "nr_cor_attr",
+        "range",
+        "sd",
+        "skewness",
+        "var",
+    )  # type: t.Tuple[str, ...]
+
+    # Keys each precomputation method is the source of. Note that ``precom-
+    # pute_statistical_eigen`` also returns ``classes`` and ``class_freqs``,
+    # but only as a by-product, so it consumes (rather than produces) them.
+    PRECOMPUTE_PRODUCES = {
+        "precompute_statistical_class": ("classes", "class_freqs"),
+        "precompute_statistical_eigen": ("eig_vals", "eig_vecs"),
+        "precompute_statistical_cor_cov": ("cov_mat", "abs_corr_mat"),
+    }  # type: t.Dict[str, t.Tuple[str, ...]]
+
     @classmethod
     def precompute_statistical_class(cls,
                                      y: t.Optional[np.ndarray] = None,
@@ -97,11 +162,14 @@ class MFEStatistical:
         return precomp_vals
 
     @classmethod
-    def precompute_statistical_eigen(cls,
-                                     N: t.Optional[np.ndarray] = None,
-                                     y: t.Optional[np.ndarray] = None,
-                                     ddof: int = 1,
-                                     **kwargs) -> t.Dict[str, t.Any]:
+    def precompute_statistical_eigen(
+            cls,
+            N: t.Optional[np.ndarray] = None,
+            y: t.Optional[np.ndarray] = None,
+            ddof: int = 1,
+            classes: t.Optional[np.ndarray] = None,
+            class_freqs: t.Optional[np.ndarray] = None,
+            **kwargs) -> t.Dict[str, t.Any]:
         """Precompute eigenvalues and eigenvectors of LDA Matrix.
 
         Args:
@@ -113,6 +181,11 @@ class MFEStatistical:
             ddof (:obj:`int`, optional): degrees of freedom of covariance ma-
                 trix calculated during LDA.
 
+            classes (:obj:`np.ndarray`, optional): distinct classes of ``y``.
+
+            class_freqs (:obj:`np.ndarray`, optional): absolute class frequen-
+                cies of ``y``.
+
             **kwargs: additional arguments. May have previously precomputed be-
                 fore this method from other precomputed methods, so they can
                 help speed up this precomputation.
@@ -139,9 +212,6 @@ class MFEStatistical:
 
         if (y is not None and N is not None and N.size
                 and not {"eig_vals", "eig_vecs"}.issubset(kwargs)):
-            classes = kwargs.get("classes")
-            class_freqs = kwargs.get("class_freqs")
-
             if classes is None or class_freqs is None:
                 classes, class_freqs = np.unique(y, return_counts=True)
 
@@ -196,7 +266,25 @@ class MFEStatistical:
         precomp_vals = {}
 
         if N is not None and N.size:
-            N = N.astype(float)
+            N = MFEStatistical._as_float(N)
+
+            if N.dtype == np.float32 and N.shape[1] > 1:
+                # Keep the float32 compute mode of MFE ``fit`` method
+                cov_mat = kwargs.get("cov_mat")
+
+                if cov_mat is None:
+                    cov_mat = MFEStatistical._cov_mat_float32(N, ddof=ddof)
+                    precomp_vals["cov_mat"] = cov_mat
+
+                if "abs_corr_mat" not in kwargs:
+                    std_devs = np.sqrt(np.diag(cov_mat))
+
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        precomp_vals["abs_corr_mat"] = np.clip(
+                            abs(cov_mat / np.outer(std_devs, std_devs)),
+                            0.0, 1.0)
+
+                return precomp_vals
 
             if "cov_mat" not in kwargs:
                 precomp_vals["cov_mat"] = np.cov(N, rowvar=False, ddof=ddof)
@@ -212,6 +300,140 @@ class MFEStatistical:
 
         return precomp_vals
 
+    @classmethod
+    def _as_float(cls, N: np.ndarray) -> np.ndarray:
+        """Cast ``N`` to :obj:`float`, keeping it if already floating point.
+
+        Hence, a float32 ``N`` (check ``dtype`` argument of MFE ``fit`` me-
+        thod) is not promoted to float64.
+        """
+        if np.issubdtype(N.dtype, np.floating):
+            return N
+
+        return N.astype(float)
+
+    @classmethod
+    def _cov_mat_float32(cls, N: np.ndarray, ddof: int = 1) -> np.ndarray:
+        """Covariance matrix of a float32 ``N``, computed in float32.
+
+        Unlike ``np.cov``, which always computes in float64, the Gram matrix
+        of the centered ``N`` is computed in single precision. Only the mean
+        of each attribute is accumulated in float64.
+        """
+        num_inst, _ = N.shape
+
+        N_centered = N - N.mean(axis=0, dtype=np.float64).astype(np.float32)
+
+        return (np.dot(N_centered.T, N_centered) /
+                np.float32(num_inst - ddof))
+
+    @classmethod
+    def update_cor_cov(
+            cls,
+            N: np.ndarray,
+            num_inst_prev: int,
+            cov_mat: np.ndarray,
+            num_mean: t.Optional[np.ndarray] = None,
+            ddof: int = 1,
+    ) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Update the covariance and correlation matrices of appended rows.
+
+        The co-moment matrix of the previous instances (recovered from
+        ``cov_mat``) is merged with the co-moment matrix of the new instan-
+        ces (check ``_merge_comoments``). Hence, only the new instances are
+        visited, apart from the mean of the previous instances if ``num_mean``
+        is not given.
+
+        Args:
+            N (:obj:`np.ndarray`): numerical attributes of all instances,
+                with the previous instances first.
+
+            num_inst_prev (:obj:`int`): number of previous instances of ``N``.
+
+            cov_mat (:obj:`np.ndarray`): covariance matrix of the previous
+                instances of ``N``.
+
+            num_mean (:obj:`np.ndarray`, optional): mean of each attribute of
+                the previous instances of ``N``.
+
+            ddof (:obj:`int`, optional): degrees of freedom of ``cov_mat``.
+
+        Returns:
+            tuple(np.ndarray, np.ndarray, np.ndarray): covariance matrix, ab-
+                solute correlation matrix and the mean of each attribute of
+                all instances of ``N``, in this order.
+        """
+        # Only the new instances are converted, even for float32 data
+        N_new = N[num_inst_prev:].astype(float, copy=False)
+
+        if num_mean is None:
+            num_mean = N[:num_inst_prev].mean(axis=0, dtype=np.float64)
+
+        mean_new = N_new.mean(axis=0)
+        N_new_centered = N_new - mean_new
+
+        num_inst, new_mean, comoment = MFEStatistical._merge_comoments(
+            num_inst_a=num_inst_prev,
+            mean_a=num_mean,
+            comoment_a=np.atleast_2d(cov_mat) * (num_inst_prev - ddof),
+            num_inst_b=N_new.shape[0],
+            mean_b=mean_new,
+            comoment_b=np.dot(N_new_centered.T, N_new_centered))
+
+        new_cov_mat = comoment / (num_inst - ddof)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std_devs = np.sqrt(np.diag(new_cov_mat))
+            abs_corr_mat = np.clip(
+                abs(new_cov_mat / np.outer(std_devs, std_devs)), 0.0, 1.0)
+
+        if abs_corr_mat.size == 1:
+            # Same output of ``precompute_statistical_cor_cov`` for a
+            # single numeric attribute
+            abs_corr_mat = abs_corr_mat[0, 0]
+
+            if np.isnan(abs_corr_mat):
+                abs_corr_mat = np.array([np.nan])
+
+        cov_dtype = np.asarray(cov_mat).dtype
+
+        return (new_cov_mat.reshape(np.shape(cov_mat)).astype(cov_dtype),
+                np.asarray(abs_corr_mat).astype(cov_dtype),
+                new_mean)
+
+    @classmethod
+    def _apply_by_col_blocks(cls,
+                             func: t.Callable[..., np.ndarray],
+                             N: np.ndarray,
+                             **kwargs) -> np.ndarray:
+        """Apply a column-wise ``func`` to each block of columns of ``N``.
+
+        The number of columns of each block is such that a block takes at
+        most ``COL_BLOCK_BYTES`` bytes. The results of the blocks are con-
+        catenated, so ``func`` must return one value per column.
+
+        Args:
+            func (:obj:`Callable`): function applied to each block, which is
+                given as its first argument.
+
+            N (:obj:`np.ndarray`): numerical attributes from fitted data.
+
+            **kwargs: extra arguments to ``func``.
+        """
+        num_inst, num_col = N.shape
+
+        block_size = max(
+            1, MFEStatistical.COL_BLOCK_BYTES // max(1, num_inst * N.itemsize))
+
+        if block_size >= num_col:
+            # ``np.asarray`` as a memory-mapped ``N`` yields ``np.memmap``
+            return np.asarray(func(N, **kwargs))
+
+        return np.concatenate([
+            func(N[:, ind_start:ind_start + block_size], **kwargs)
+            for ind_start in range(0, num_col, block_size)
+        ])
+
     @classmethod
     def _linear_disc_mat_eig(
             cls,
@@ -262,10 +484,12 @@ class MFEStatistical:
             """Compute Scatter Between matrix. The doc above has more info."""
             class_vals, class_freqs = class_val_freq
 
-            class_means = np.array(
-                [N[y == cl_val, :].mean(axis=0) for cl_val in class_vals])
+            class_means = np.array([
+                N[y == cl_val, :].mean(axis=0, dtype=np.float64)
+                for cl_val in class_vals
+            ])
 
-            relative_centers = class_means - N.mean(axis=0)
+            relative_centers = class_means - N.mean(axis=0, dtype=np.float64)
 
             scatter_between = np.array([
                 cl_frq * np.outer(rc, rc)
@@ -280,7 +504,9 @@ class MFEStatistical:
         else:
             class_val_freq = (classes, class_freqs)
 
-        N = N.astype(float)
+        # Both scatter matrices are accumulated in float64 even for a float32
+        # ``N``, since single precision leaves spurious near-zero eigenvalues
+        N = MFEStatistical._as_float(N)
 
         scatter_within = compute_scatter_within(
             N, y, class_val_freq, ddof=ddof)
@@ -643,7 +869,8 @@ class MFEStatistical:
     @classmethod
     def ft_iq_range(cls, N: np.ndarray) -> np.ndarray:
         """Compute the interquartile range (IQR) of each attribute in ``N``."""
-        return scipy.stats.iqr(N, axis=0)
+        return MFEStatistical._apply_by_col_blocks(
+            scipy.stats.iqr, N, axis=0)
 
     @classmethod
     def ft_kurtosis(cls, N: np.ndarray, method: int = 3,
@@ -698,28 +925,32 @@ class MFEStatistical:
                 standard deviation of 1.0), so it makes this method result com-
                 parable with this sort of data.
         """
-        median_dev = abs(N - np.median(N, axis=0))
-        return np.median(median_dev, axis=0) * factor
+        def mad(N_block: np.ndarray) -> np.ndarray:
+            """Median Absolute Deviation of each column of ``N_block``."""
+            median_dev = abs(N_block - np.median(N_block, axis=0))
+            return np.median(median_dev, axis=0)
+
+        return MFEStatistical._apply_by_col_blocks(mad, N) * factor
 
     @classmethod
     def ft_max(cls, N: np.ndarray) -> np.ndarray:
         """Get the maximum value from each ``N`` attribute."""
-        return N.max(axis=0)
+        return MFEStatistical._apply_by_col_blocks(np.max, N, axis=0)
 
     @classmethod
     def ft_mean(cls, N: np.ndarray) -> np.ndarray:
         """Returns the mean value of each ``N`` attribute."""
-        return N.mean(axis=0)
+        return MFEStatistical._apply_by_col_blocks(np.mean, N, axis=0)
 
     @classmethod
     def ft_median(cls, N: np.ndarray) -> np.ndarray:
         """Get the median value from each ``N`` attribute."""
-        return np.median(N, axis=0)
+        return MFEStatistical._apply_by_col_blocks(np.median, N, axis=0)
 
     @classmethod
     def ft_min(cls, N: np.ndarray) -> np.ndarray:
         """Get the minimum value from each ``N`` attribute."""
-        return N.min(axis=0)
+        return MFEStatistical._apply_by_col_blocks(np.min, N, axis=0)
 
     @classmethod
     def ft_nr_cor_attr(cls,
@@ -913,7 +1144,7 @@ class MFEStatistical:
     @classmethod
     def ft_range(cls, N: np.ndarray) -> np.ndarray:
         """Compute the range (max - min) of each attribute in ``N``."""
-        return np.ptp(N, axis=0)
+        return MFEStatistical._apply_by_col_blocks(np.ptp, N, axis=0)
 
     @classmethod
     def ft_sd(cls, N: np.ndarray, ddof: int = 1) -> np.ndarray:
@@ -922,7 +1153,8 @@ class MFEStatistical:
         Args:
             ddof (:obj:`float`): degrees of freedom for standard deviation.
         """
-        sd_array = N.std(axis=0, ddof=ddof)
+        sd_array = MFEStatistical._apply_by_col_blocks(
+            np.std, N, axis=0, ddof=ddof)
 
         sd_array = np.array(
             [np.nan if np.isinf(val) else val for val in sd_array])
@@ -1081,7 +1313,9 @@ class MFEStatistical:
     def ft_sparsity(cls,
                     X: np.ndarray,
                     normalize: bool = True,
-                    epsilon: float = 1.0e-8) -> np.ndarray:
+                    epsilon: float = 1.0e-8,
+                    attr_num_distinct: t.Optional[np.ndarray] = None
+                    ) -> np.ndarray:
         """Compute (possibly normalized) sparsity metric for each attribute.
 
         Sparsity ``S`` of a vector ``v`` of numeric values is defined as
@@ -1100,11 +1334,18 @@ class MFEStatistical:
 
             epsilon (:obj:`float`, optional): a small value to prevent division
                 by zero.
+
+            attr_num_distinct (:obj:`np.ndarray`, optional): number of dis-
+                tinct values of each attribute in ``X``, ``phi(v)``. This ar-
+                gument purpose is mainly for benefit from precomputations.
         """
+        num_inst, _ = X.shape
 
-        ans = np.array([attr.size / np.unique(attr).size for attr in X.T])
+        if attr_num_distinct is None:
+            attr_num_distinct = np.array(
+                [_codes.count_distinct(attr) for attr in X.T])
 
-        num_inst, _ = X.shape
+        ans = num_inst / attr_num_distinct
 
         norm_factor = 1.0
         if normalize:
@@ -1135,7 +1376,8 @@ class MFEStatistical:
         Args:
             ddof (:obj:`float`): degrees of freedom for variance.
         """
-        var_array = N.var(axis=0, ddof=ddof)
+        var_array = MFEStatistical._apply_by_col_blocks(
+            np.var, N, axis=0, ddof=ddof)
 
         var_array = np.array(
             [np.nan if np.isinf(val) else val for val in var_array])
@@ -1195,3 +1437,332 @@ class MFEStatistical:
             return np.nan
 
         return np.prod(1.0 / (1.0 + eig_vals))
+
+    @classmethod
+    def chunk_stats(cls, N_chunk: np.ndarray) -> t.Dict[str, t.Any]:
+        """Sufficient statistics of a block of instances of ``N``.
+
+        Args:
+            N_chunk (:obj:`np.ndarray`): 2-D array with some instances (rows)
+                of the numerical attributes.
+
+        Returns:
+            dict: with the following items (all about each column):
+
+            - ``num_inst`` (:obj:`int`): number of instances.
+            - ``mean`` (:obj:`np.ndarray`): mean.
+            - ``comoment`` (:obj:`np.ndarray`): co-moment matrix, i.e., the
+                sum of the products of the centered columns. Its diagonal
+                is the second central power sum.
+            - ``pow_sum_3`` and ``pow_sum_4`` (:obj:`np.ndarray`): third and
+                fourth central power sums.
+            - ``min`` and ``max`` (:obj:`np.ndarray`): extreme values.
+        """
+        N_chunk = np.asarray(N_chunk, dtype=float)
+
+        mean = N_chunk.mean(axis=0)
+        N_centered = N_chunk - mean
+        N_centered_sqr = N_centered * N_centered
+
+        return {
+            "num_inst": N_chunk.shape[0],
+            "mean": mean,
+            "comoment": np.dot(N_centered.T, N_centered),
+            "pow_sum_3": np.sum(N_centered_sqr * N_centered, axis=0),
+            "pow_sum_4": np.sum(N_centered_sqr * N_centered_sqr, axis=0),
+            "min": N_chunk.min(axis=0),
+            "max": N_chunk.max(axis=0),
+        }
+
+    @classmethod
+    def _merge_comoments(
+            cls,
+            num_inst_a: int,
+            mean_a: np.ndarray,
+            comoment_a: np.ndarray,
+            num_inst_b: int,
+            mean_b: np.ndarray,
+            comoment_b: np.ndarray,
+    ) -> t.Tuple[int, np.ndarray, np.ndarray]:
+        """Merge the means and co-moment matrices of two disjoint blocks.
+
+        Follows the pairwise update of Chan et al., so the instances of both
+        blocks are not visited again. Used by both ``merge_chunk_stats`` and
+        ``update_cor_cov`` methods.
+
+        Returns:
+            tuple(int, np.ndarray, np.ndarray): number of instances, mean of
+                each attribute and co-moment matrix of both blocks together.
+        """
+        num_inst = num_inst_a + num_inst_b
+
+        delta = mean_b - mean_a
+
+        comoment = (comoment_a + comoment_b +
+                    np.outer(delta, delta) * num_inst_a * num_inst_b /
+                    num_inst)
+
+        return num_inst, mean_a + delta * num_inst_b / num_inst, comoment
+
+    @classmethod
+    def merge_chunk_stats(cls,
+                          stats_a: t.Dict[str, t.Any],
+                          stats_b: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        """Merge the sufficient statistics of two disjoint blocks of instances.
+
+        The central power sums are merged with the pairwise formulas of Chan
+        et al. (check ``_merge_comoments``) and Pébay, so no instance is vi-
+        sited again.
+
+        Args:
+            stats_a (:obj:`dict`): statistics of a block, as returned by the
+                ``chunk_stats`` method.
+
+            stats_b (:obj:`dict`): statistics of other block.
+
+        Returns:
+            dict: statistics of both blocks together.
+        """
+        num_inst_a, num_inst_b = stats_a["num_inst"], stats_b["num_inst"]
+
+        num_inst, mean, comoment = MFEStatistical._merge_comoments(
+            num_inst_a=num_inst_a,
+            mean_a=stats_a["mean"],
+            comoment_a=stats_a["comoment"],
+            num_inst_b=num_inst_b,
+            mean_b=stats_b["mean"],
+            comoment_b=stats_b["comoment"])
+
+        delta = stats_b["mean"] - stats_a["mean"]
+        delta_sqr = delta * delta
+
+        pow_sum_2_a = np.diag(stats_a["comoment"])
+        pow_sum_2_b = np.diag(stats_b["comoment"])
+
+        pow_sum_3 = (stats_a["pow_sum_3"] + stats_b["pow_sum_3"] +
+                     delta_sqr * delta * num_inst_a * num_inst_b *
+                     (num_inst_a - num_inst_b) / num_inst**2 +
+                     3.0 * delta * (num_inst_a * pow_sum_2_b -
+                                    num_inst_b * pow_sum_2_a) / num_inst)
+
+        pow_sum_4 = (stats_a["pow_sum_4"] + stats_b["pow_sum_4"] +
+                     delta_sqr * delta_sqr * num_inst_a * num_inst_b *
+                     (num_inst_a**2 - num_inst_a * num_inst_b +
+                      num_inst_b**2) / num_inst**3 +
+                     6.0 * delta_sqr * (num_inst_a**2 * pow_sum_2_b +
+                                        num_inst_b**2 * pow_sum_2_a) /
+                     num_inst**2 +
+                     4.0 * delta * (num_inst_a * stats_b["pow_sum_3"] -
+                                    num_inst_b * stats_a["pow_sum_3"]) /
+                     num_inst)
+
+        return {
+            "num_inst": num_inst,
+            "mean": mean,
+            "comoment": comoment,
+            "pow_sum_3": pow_sum_3,
+            "pow_sum_4": pow_sum_4,
+            "min": np.minimum(stats_a["min"], stats_b["min"]),
+            "max": np.maximum(stats_a["max"], stats_b["max"]),
+        }
+
+    @classmethod
+    def extract_chunked(
+            cls,
+            chunks: t.Iterable[np.ndarray],
+            features: t.Optional[t.Iterable[str]] = None,
+            ddof: int = 1,
+            method: int = 3,
+            bias: bool = True,
+            threshold: float = 0.5,
+            normalize: bool = True,
+            epsilon: float = 1.0e-8,
+    ) -> t.Dict[str, t.Any]:
+        """Extract statistical metafeatures reading ``N`` by blocks of rows.
+
+        The sufficient statistics of each block (check ``chunk_stats``) are
+        merged into the statistics of all instances in a single pass (check
+        ``accumulate_chunk_stats``), and then the metafeatures are derived
+        from them (check ``finalize_chunk_stats``). Hence, the memory used is
+        bounded by the size of a block plus the size of the covariance ma-
+        trix, independently of the number of instances.
+
+        The metafeatures supported (check ``CHUNKED_FEATURES``) have the same
+        values given by the corresponding ``ft_`` methods, up to floating
+        point errors. The values are not summarized: use ``MFE.extract_chun-
+        ked`` to get them in the same form of ``MFE.extract``.
+
+        Args:
+            chunks (:obj:`Iterable` of :obj:`np.ndarray`): blocks of rows of
+                the numerical attributes, all with the same columns. It may be
+                any iterable (e.g., a generator reading a file).
+
+            features (:obj:`Iterable` of :obj:`str`, optional): names of the
+                metafeatures to extract, without the ``ft_`` prefix. If :obj:`
+                NoneType`, all supported metafeatures are extracted.
+
+            ddof (:obj:`int`, optional): degrees of freedom of the variance,
+                standard deviation and covariance.
+
+            method (:obj:`int`, optional): check ``ft_skewness`` and ``ft_-
+                kurtosis``.
+
+            bias (:obj:`bool`, optional): check ``ft_skewness`` and ``ft_-
+                kurtosis``.
+
+            threshold (:obj:`float`, optional): check ``ft_nr_cor_attr``.
+
+            normalize (:obj:`bool`, optional): check ``ft_nr_cor_attr``.
+
+            epsilon (:obj:`float`, optional): check ``ft_nr_cor_attr``.
+
+        Returns:
+            dict: the value of each metafeature, keyed by its name.
+
+        Raises:
+            ValueError: if some metafeature is not supported, or if ``chunks``
+                has no instances.
+        """
+        if features is None:
+            features = MFEStatistical.CHUNKED_FEATURES
+
+        features = tuple(features)
+
+        unsupported = set(features).difference(MFEStatistical.CHUNKED_FEATURES)
+
+        if unsupported:
+            raise ValueError("Metafeatures not supported in the chunked mode: "
+                             "{0}.".format(sorted(unsupported)))
+
+        return MFEStatistical.finalize_chunk_stats(
+            stats=MFEStatistical.accumulate_chunk_stats(chunks),
+            features=features,
+            ddof=ddof,
+            method=method,
+            bias=bias,
+            threshold=threshold,
+            normalize=normalize,
+            epsilon=epsilon)
+
+    @classmethod
+    def accumulate_chunk_stats(
+            cls, chunks: t.Iterable[np.ndarray]) -> t.Dict[str, t.Any]:
+        """Sufficient statistics of all blocks of instances in ``chunks``.
+
+        Args:
+            chunks (:obj:`Iterable` of :obj:`np.ndarray`): check ``extract_-
+                chunked``. It is iterated only once.
+
+        Returns:
+            dict: the statistics of all instances (check ``chunk_stats``).
+
+        Raises:
+            ValueError: if ``chunks`` has no instances.
+        """
+        stats = None  # type: t.Optional[t.Dict[str, t.Any]]
+
+        for N_chunk in chunks:
+            if len(N_chunk) == 0:
+                continue
+
+            chunk_stats = MFEStatistical.chunk_stats(N_chunk)
+
+            if stats is None:
+                stats = chunk_stats
+
+            else:
+                stats = MFEStatistical.merge_chunk_stats(stats, chunk_stats)
+
+        if stats is None:
+            raise ValueError('"chunks" has no instances.')
+
+        return stats
+
+    @classmethod
+    def finalize_chunk_stats(cls,
+                             stats: t.Dict[str, t.Any],
+                             features: t.Sequence[str],
+                             ddof: int = 1,
+                             method: int = 3,
+                             bias: bool = True,
+                             threshold: float = 0.5,
+                             normalize: bool = True,
+                             epsilon: float = 1.0e-8) -> t.Dict[str, t.Any]:
+        """Derive the chunked mode metafeatures from sufficient statistics.
+
+        The arguments not described below are the same of ``extract_chunk-
+        ed`` method.
+
+        Args:
+            stats (:obj:`dict`): statistics of all instances, as returned by
+                ``accumulate_chunk_stats``.
+
+            features (:obj:`Sequence` of :obj:`str`): names of the metafea-
+                tures to derive (check ``CHUNKED_FEATURES``).
+
+        Returns:
+            dict: the value of each metafeature, keyed by its name.
+        """
+        num_inst = stats["num_inst"]
+        num_attr = stats["mean"].size
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov_mat = stats["comoment"] / (num_inst - ddof)
+            var_array = np.diag(cov_mat).copy()
+            var_array[np.isinf(var_array)] = np.nan
+            sd_array = np.sqrt(var_array)
+
+            moment_2 = np.diag(stats["comoment"]) / num_inst
+            moment_3 = stats["pow_sum_3"] / num_inst
+            moment_4 = stats["pow_sum_4"] / num_inst
+
+            abs_corr_mat = abs(cov_mat / np.outer(sd_array, sd_array))
+
+            skew_arr = moment_3 / moment_2**1.5
+            kurt_arr = moment_4 / moment_2**2.0 - 3.0
+
+            if not bias and num_inst > 2:
+                skew_arr *= ((num_inst * (num_inst - 1.0))**0.5 /
+                             (num_inst - 2.0))
+
+            if not bias and num_inst > 3:
+                kurt_arr = (((num_inst**2 - 1.0) * (kurt_arr + 3.0) -
+                             3.0 * (num_inst - 1.0)**2) /
+                            ((num_inst - 2.0) * (num_inst - 3.0)))
+
+        tril_inds = np.tril_indices(num_attr, k=-1)
+        abs_corr_vals = abs_corr_mat[tril_inds]
+
+        norm_factor = 1
+
+        if normalize:
+            norm_factor = 2.0 / (epsilon + num_attr * (num_attr - 1.0))
+
+        res = {
+            "mean": stats["mean"],
+            "var": var_array,
+            "sd": sd_array,
+            "min": stats["min"],
+            "max": stats["max"],
+            "range": stats["max"] - stats["min"],
+            "cov": abs(cov_mat[tril_inds]),
+            "cor": abs_corr_vals,
+            "nr_cor_attr": sum(abs_corr_vals >= threshold) * norm_factor,
+            "skewness": _summary.adjust_skewness(
+                skew_arr, num_vals=num_inst, method=method),
+            "kurtosis": _summary.adjust_kurtosis(
+                kurt_arr, num_vals=num_inst, method=method),
+        }  # type: t.Dict[str, t.Any]
+
+        # The only metafeature which is not cheap to derive from the stats
+        if "eigenvalues" in features:
+            try:
+                res["eigenvalues"] = np.linalg.eigvals(cov_mat)
+
+            except (np.linalg.LinAlgError, ValueError):
+                res["eigenvalues"] = np.array([np.nan])
+
+        return {
+            ft_name: res[ft_name]
+            for ft_name in features if ft_name in res
+        }
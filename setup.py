@@ -16,7 +16,8 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/ealcobaca/pymfe",
     download_url="https://github.com/ealcobaca/pymfe/releases",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(
+        exclude=("benchmarks", "benchmarks.*")),
     install_requires=["numpy", "scipy", "sklearn", "patsy", "pandas"],
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,87 @@
+"""Test module for the performance benchmarks."""
+import json
+
+from benchmarks import compare
+from benchmarks import datasets
+from benchmarks import imports
+from benchmarks import run
+from benchmarks.__main__ import main
+
+GNAME = "benchmarks"
+
+
+def _report(fit_time, feature_time, peak_memory=None):
+    return {
+        "meta": {},
+        "results": [{
+            "config": "n=1000,p=10,classes=2,cat=0.0",
+            "group": "statistical",
+            "fit": fit_time,
+            "extract": 1.0,
+            "peak_memory": peak_memory,
+            "precompute": {},
+            "features": {"mean": feature_time},
+        }],
+    }
+
+
+class TestBenchmarks:
+        """TestClass dedicated to test the benchmark suite."""
+
+        def test_iter_configs(self):
+            configs = list(datasets.iter_configs(max_values=10**6))
+
+            assert configs
+            assert all(config.num_inst * config.num_attr <= 10**6
+                       for config in configs)
+
+        def test_make_dataset(self):
+            config = datasets.DatasetConfig(100, 10, 3, 0.5)
+            X, y, cat_cols = datasets.make_dataset(config, random_state=0)
+
+            assert X.shape == (100, 10)
+            assert set(y).issubset({0, 1, 2})
+            assert cat_cols == [5, 6, 7, 8, 9]
+
+        def test_run(self):
+            configs = [datasets.DatasetConfig(100, 5, 2, 0.4)]
+            report = run.run(configs, groups=("general", "statistical"))
+
+            assert len(report["results"]) == 2
+
+            result = report["results"][1]
+
+            assert result["group"] == "statistical"
+            assert result["fit"] > 0.0 and result["peak_memory"] > 0
+            assert "mean" in result["features"]
+            assert result["precompute"]
+
+        def test_compare(self):
+            baseline = _report(fit_time=1.0, feature_time=0.001,
+                               peak_memory=2**24)
+            current = _report(fit_time=1.5, feature_time=0.01,
+                              peak_memory=2**24)
+
+            regressions = compare.compare(baseline, current)
+
+            assert [key[2] for key, _, _ in regressions] == ["fit"]
+            assert not compare.compare(baseline, baseline)
+
+        def test_main_compare(self, tmp_path):
+            paths = []
+
+            for ind, fit_time in enumerate((1.0, 2.0)):
+                paths.append(str(tmp_path / "report_{}.json".format(ind)))
+
+                with open(paths[-1], "w") as report_file:
+                    json.dump(_report(fit_time, 0.1), report_file)
+
+            assert main(["compare", paths[0], paths[0]]) == 0
+            assert main(["compare", paths[0], paths[1]]) == 1
+
+        def test_imports_no_heavy_modules(self):
+            report = imports.run()
+
+            assert report["import"]["heavy_modules"] == []
+            assert report["general"]["heavy_modules"] == []
+            assert main(["imports"]) == 0
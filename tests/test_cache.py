@@ -0,0 +1,182 @@
+"""Test module for the persistent cache of extracted metafeatures."""
+import os
+
+import pytest
+import numpy as np
+
+from pymfe.mfe import MFE
+import pymfe._cache as _cache
+from tests.utils import load_xy
+
+GNAME = "mfe-cache"
+
+
+def _get_cache_size(cache_dir):
+    return sum(
+        os.path.getsize(os.path.join(cache_dir, file_name))
+        for file_name in os.listdir(cache_dir)
+        if file_name.endswith(_cache.CACHE_FILE_EXT))
+
+
+class TestCache:
+        """TestClass dedicated to test the metafeature persistent cache."""
+
+        @pytest.mark.parametrize("dt_id", (0, 2))
+        def test_cached_values(self, dt_id, tmp_path):
+            X, y = load_xy(dt_id)
+            cache_dir = str(tmp_path)
+
+            names, vals = MFE(
+                groups=("general", "statistical"),
+                random_state=1234).fit(X=X.values, y=y.values).extract()
+
+            model = MFE(groups=("general", "statistical"),
+                        random_state=1234,
+                        cache_dir=cache_dir)
+
+            for _ in range(2):
+                names_c, vals_c = model.fit(X=X.values,
+                                            y=y.values).extract()
+
+                assert names == names_c and np.allclose(
+                    np.array(vals, dtype=float),
+                    np.array(vals_c, dtype=float),
+                    equal_nan=True)
+
+            assert len(os.listdir(cache_dir)) == len(model.features)
+
+        def test_cache_new_features_only(self, tmp_path, capsys):
+            X, y = load_xy(2)
+            cache_dir = str(tmp_path)
+
+            MFE(features=["mean", "sd"], cache_dir=cache_dir).fit(
+                X=X.values, y=y.values).extract()
+
+            capsys.readouterr()
+
+            MFE(features=["mean", "sd", "var"], cache_dir=cache_dir).fit(
+                X=X.values, y=y.values).extract(verbose=True)
+
+            out = capsys.readouterr().out
+
+            assert "Loaded ft_mean feature from cache." in out
+            assert "Loaded ft_sd feature from cache." in out
+            assert "Extracting ft_var feature..." in out
+            assert "Extracting ft_mean feature..." not in out
+
+        @pytest.mark.parametrize(
+            "fit_args, extract_args",
+            [
+                ({"rescale": "min-max"}, {}),
+                ({}, {"sd": {"ddof": 2}}),
+                ({}, {"mean": {"trim": 0.1}}),
+            ])
+        def test_cache_key_changes(self, fit_args, extract_args, tmp_path):
+            X, y = load_xy(2)
+            cache_dir = str(tmp_path)
+            model = MFE(features=["sd"], summary=["mean"],
+                        cache_dir=cache_dir)
+
+            model.fit(X=X.values, y=y.values).extract()
+            model.fit(X=X.values, y=y.values, **fit_args).extract(
+                suppress_warnings=True, **extract_args)
+
+            assert len(os.listdir(cache_dir)) == 2
+
+        def test_cache_eviction(self, tmp_path):
+            X, y = load_xy(2)
+            cache_dir = str(tmp_path)
+
+            MFE(groups="statistical", cache_dir=cache_dir).fit(
+                X=X.values, y=y.values).extract()
+
+            max_size = _get_cache_size(cache_dir) // 2
+
+            MFE(groups="general", cache_dir=cache_dir,
+                cache_max_size=max_size).fit(X=X.values,
+                                             y=y.values).extract()
+
+            assert 0 < _get_cache_size(cache_dir) <= max_size
+
+        @pytest.mark.parametrize("dt_id", (0, 1, 2))
+        def test_fingerprint_stable(self, dt_id):
+            X, y = load_xy(dt_id)
+
+            fp_1 = MFE().fit(X=X.values, y=y.values).fingerprint
+            fp_2 = MFE(groups="general").fit(
+                X=X.values.copy(), y=y.values.copy()).fingerprint
+
+            assert isinstance(fp_1, str) and fp_1 == fp_2
+
+        def test_fingerprint_chunk_size(self):
+            X, y = load_xy(0)
+            model = MFE().fit(X=X.values, y=y.values)
+
+            fp_chunked = _cache.fingerprint_data(
+                X=model.X,
+                y=model.y,
+                attr_indexes_num=model._attr_indexes_num,
+                attr_indexes_cat=model._attr_indexes_cat,
+                chunk_size=7)
+
+            assert fp_chunked == model.fingerprint
+
+        def test_fingerprint_changes(self):
+            X, y = load_xy(2)
+            X_mod = X.values.copy()
+            X_mod[0, 0] += 1.0
+
+            fp = MFE().fit(X=X.values, y=y.values).fingerprint
+
+            assert fp != MFE().fit(X=X_mod, y=y.values).fingerprint
+            assert fp != MFE().fit(X=X.values,
+                                   y=y.values[::-1]).fingerprint
+            assert fp != MFE().fit(X=X.values, y=y.values,
+                                   cat_cols=[0]).fingerprint
+
+        def test_key_large_arrays(self):
+            arr = np.arange(5000, dtype=float)
+            arr_mod = arr.copy()
+            arr_mod[2500] += 1.0
+
+            assert repr(arr) == repr(arr_mod)
+            assert _cache.get_key(arr) == _cache.get_key(arr.copy())
+            assert _cache.get_key(arr) != _cache.get_key(arr_mod)
+            assert _cache.get_key({"sd": {"q": arr}}) != _cache.get_key(
+                {"sd": {"q": arr_mod}})
+            assert _cache.get_key(arr) != _cache.get_key(arr.astype(int))
+            assert _cache.get_key(arr) != _cache.get_key(arr.reshape(50, -1))
+            assert _cache.get_key([1, 2]) != _cache.get_key((1, 2))
+
+        @pytest.mark.parametrize("chunk_size", (1, 3, 1000))
+        def test_fingerprint_object_cols(self, chunk_size):
+            X = np.array([["a", 1], ["b", 2], ["a", "1"], [None, 2.5]],
+                         dtype=object)
+            X_mod = X.copy()
+            X_mod[2, 1] = 1
+            y = np.array(["x", "y", "x", "y"], dtype=object)
+
+            def fingerprint(data, chunk_size=_cache.FINGERPRINT_CHUNK_SIZE):
+                return _cache.fingerprint_data(
+                    X=data, y=y, attr_indexes_num=[],
+                    attr_indexes_cat=[0, 1], chunk_size=chunk_size)
+
+            assert fingerprint(X, chunk_size) == fingerprint(X.copy())
+            assert fingerprint(X) != fingerprint(X_mod)
+
+        def test_fingerprint_cat_codes(self):
+            X = np.array([["b", 1], ["a", 2], ["b", 2], ["c", 1]],
+                         dtype=object)
+            y = np.array([0, 1, 0, 1])
+
+            # Same columns factorized with other orders of the codes
+            cat_codes = np.array([[2, 0], [0, 1], [2, 1], [1, 0]],
+                                 dtype=np.int8)
+
+            def fingerprint(data, codes=None):
+                return _cache.fingerprint_data(
+                    X=data, y=y, attr_indexes_num=[], attr_indexes_cat=[0, 1],
+                    cat_codes=codes)
+
+            assert fingerprint(X, cat_codes) == fingerprint(X)
+            assert fingerprint(X) != fingerprint(X[:, ::-1])
@@ -0,0 +1,154 @@
+"""Test module for the instrumentation callbacks of MFE models."""
+import pytest
+
+from pymfe.mfe import MFE
+from pymfe import callbacks
+from tests.utils import load_xy
+
+GNAME = "mfe-callbacks"
+
+
+class EventRecorder(callbacks.MFECallback):
+    """Keep every event received, alongside the name of its hook."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_precompute_start(self, event):
+        self.events.append(("on_precompute_start", event))
+
+    def on_precompute_end(self, event):
+        self.events.append(("on_precompute_end", event))
+
+    def on_feature_start(self, event):
+        self.events.append(("on_feature_start", event))
+
+    def on_feature_end(self, event):
+        self.events.append(("on_feature_end", event))
+
+    def on_summary_start(self, event):
+        self.events.append(("on_summary_start", event))
+
+    def on_summary_end(self, event):
+        self.events.append(("on_summary_end", event))
+
+    def get(self, hook_name):
+        return [event for hook, event in self.events if hook == hook_name]
+
+
+class FeatureEndOnly:
+    """Callback implementing a single hook, without the base class."""
+
+    def __init__(self):
+        self.names = []
+
+    def on_feature_end(self, event):
+        self.names.append(event.name)
+
+
+class TestCallbacks:
+        """TestClass dedicated to test MFE instrumentation callbacks."""
+
+        @pytest.mark.parametrize(
+            "enable_parallel, lazy_precomp",
+            [
+                (False, False),
+                (True, False),
+                (False, True),
+            ])
+        def test_precompute_events(self, enable_parallel, lazy_precomp):
+            X, y = load_xy(2)
+            recorder = EventRecorder()
+
+            model = MFE(groups="statistical", features="cov",
+                        callbacks=[recorder])
+            model.fit(X.values, y.values, enable_parallel=enable_parallel,
+                      lazy_precomp=lazy_precomp)
+
+            if lazy_precomp:
+                assert not recorder.get("on_precompute_start")
+                model.extract()
+
+            starts = recorder.get("on_precompute_start")
+            ends = recorder.get("on_precompute_end")
+
+            assert starts and len(starts) == len(ends)
+            assert {event.name for event in starts} == {
+                event.name for event in ends}
+
+            for event in ends:
+                assert event.stage == "precompute"
+                assert event.group == "statistical"
+                assert event.wall_time >= 0.0 and event.cpu_time >= 0.0
+                assert event.outcome in callbacks.OUTCOMES
+
+        @pytest.mark.parametrize(
+            "extract_args",
+            [
+                {},
+                {"enable_parallel": True, "parallel_backend": "thread"},
+                {"timeout_per_feature": 60},
+            ])
+        def test_feature_summary_events(self, extract_args):
+            X, y = load_xy(2)
+            recorder = EventRecorder()
+
+            model = MFE(groups=("general", "statistical"),
+                        features=("nr_inst", "mean", "sd"),
+                        summary=("mean", "sd"),
+                        callbacks=[recorder]).fit(X.values, y.values)
+
+            names, _ = model.extract(**extract_args)
+
+            ends = {
+                event.name: event
+                for event in recorder.get("on_feature_end")
+            }
+
+            assert len(recorder.get("on_feature_start")) == len(ends) == 3
+            assert ends["nr_inst"].group == "general"
+            assert ends["mean"].group == "statistical"
+            assert ends["mean"].shape == X.shape
+            assert ends["mean"].outcome == "value"
+            assert ends["mean"].cpu_time is not None
+
+            summary_names = [
+                event.name for event in recorder.get("on_summary_end")
+            ]
+
+            assert sorted(summary_names) == sorted(
+                name for name in names if name != "nr_inst")
+
+            for event in recorder.get("on_summary_end"):
+                assert event.stage == "summary"
+                assert event.shape == (X.shape[1], )
+
+        def test_total_timeout_expired(self):
+            X, y = load_xy(0)
+            recorder = EventRecorder()
+
+            model = MFE(groups="general", n_jobs=2, callbacks=[recorder])
+            model.fit(X.values, y.values)
+            model.extract(total_timeout=1e-9, enable_parallel=True,
+                          suppress_warnings=True)
+
+            # No process is started past the deadline
+            assert not recorder.get("on_feature_start")
+
+        def test_partial_hooks(self):
+            X, y = load_xy(0)
+            callback = FeatureEndOnly()
+
+            model = MFE(groups="general", callbacks=[callback])
+            model.fit(X.values, y.values).extract()
+
+            assert sorted(callback.names) == sorted(model.features)
+
+        def test_no_callbacks(self):
+            X, y = load_xy(2)
+
+            model = MFE(groups="general", callbacks=None)
+            res = model.fit(X.values, y.values).extract()
+
+            assert model.callbacks == tuple()
+            assert res[0]
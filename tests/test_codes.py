@@ -0,0 +1,107 @@
+"""Test module for the integer codes of categorical attributes."""
+import pytest
+import numpy as np
+import pandas as pd
+
+import pymfe._internal as _internal
+import pymfe._codes as _codes
+from pymfe.mfe import MFE
+from tests.utils import load_xy
+
+GNAME = "codes"
+
+
+class TestCodes:
+        """TestClass dedicated to test the categorical codes."""
+
+        @pytest.mark.parametrize(
+            "col",
+            [
+                np.array(["b", "a", "c", "a"], dtype=object),
+                np.array([3, -1, 3, 7]),
+                np.array([True, False, False]),
+                np.array([0.5, 2.5, 0.5, np.nan]),
+                np.array([10**12, 0, 10**12]),
+            ])
+        def test_factorize_col(self, col):
+            codes, cardinality = _codes.factorize_col(col)
+            uniques, codes_exp = np.unique(col, return_inverse=True)
+
+            assert cardinality == uniques.size
+            assert np.array_equal(codes, codes_exp.ravel())
+
+        def test_factorize_col_mixed_types(self):
+            col = np.array(["a", 1, "a", None], dtype=object)
+
+            codes, cardinality = _codes.factorize_col(col)
+
+            assert cardinality == 3
+            assert codes[0] == codes[2] and np.unique(codes).size == 3
+
+        @pytest.mark.parametrize(
+            "cardinality, dtype",
+            [
+                (2, np.int8),
+                (300, np.int16),
+                (40000, np.int32),
+            ])
+        def test_factorize_dtype(self, cardinality, dtype):
+            data = np.arange(cardinality).astype(str).reshape(-1, 1)
+
+            codes, cardinalities = _codes.factorize(data, None, data[:, :0])
+
+            assert codes.dtype == dtype
+            assert np.array_equal(cardinalities, [cardinality])
+
+        def test_value_counts(self):
+            values = np.array([4, 0, 4, 4, 2])
+
+            assert np.array_equal(_codes.value_counts(values), [1, 1, 3])
+            assert np.array_equal(
+                _codes.value_counts(values.astype(str)), [1, 1, 3])
+            assert _codes.count_distinct(values) == 3
+
+        def test_one_hot(self):
+            X, _ = load_xy(0)
+            data_cat = X.select_dtypes(include=object).values
+
+            codes, cardinalities = _codes.factorize(data_cat)
+
+            res = _internal.transform_cat(
+                data_cat, cat_codes=codes, cat_cardinalities=cardinalities)
+
+            assert np.allclose(res, _internal.transform_cat(data_cat))
+
+        @pytest.mark.parametrize("dt_id", (0, 1))
+        def test_fit_codes(self, dt_id):
+            X, y = load_xy(dt_id)
+
+            model = MFE(groups="info-theory").fit(X=X.values, y=y.values)
+            data_cat = model._custom_args_ft["C"]
+
+            assert data_cat.dtype == np.int8
+            assert np.array_equal(
+                model._cat_cardinalities,
+                [np.unique(col).size for col in data_cat.T])
+
+        def test_contingency_tables(self):
+            X, y = load_xy(1)
+
+            codes, cardinalities = _codes.factorize(X.values)
+            classes, class_codes = np.unique(y.values, return_inverse=True)
+
+            tables = _codes.contingency_tables(
+                codes, cardinalities, class_codes.ravel(), classes.size)
+
+            assert len(tables) == codes.shape[1]
+
+            for ind, table in enumerate(tables):
+                table_exp = pd.crosstab(X.values[:, ind], y.values).values
+
+                assert np.array_equal(table, table_exp)
+                assert np.array_equal(
+                    table,
+                    _codes.contingency_table(codes[:, ind],
+                                             class_codes.ravel(),
+                                             cardinalities[ind],
+                                             classes.size))
@@ -1,4 +1,6 @@
 """Test module for MFE class errors and warnings."""
+import warnings
+
 import pytest
 
 from pymfe.mfe import MFE
@@ -75,6 +77,76 @@ class TestErrorsWarnings:
         with pytest.raises(ValueError):
             MFE(folds=1.5)
 
+    @pytest.mark.parametrize(
+        "n_jobs",
+        [
+            0,
+            -1,
+            1.5,
+            "all",
+        ])
+    def test_error_n_jobs(self, n_jobs):
+        with pytest.raises(ValueError):
+            MFE(n_jobs=n_jobs)
+
+    @pytest.mark.parametrize(
+        "cache_max_size",
+        [
+            0,
+            -1024,
+            1.5,
+            "1MB",
+        ])
+    def test_error_cache_max_size(self, cache_max_size):
+        with pytest.raises(ValueError):
+            MFE(cache_max_size=cache_max_size)
+
+    @pytest.mark.parametrize(
+        "backend",
+        [
+            "",
+            "invalid",
+            "processes",
+        ])
+    def test_error_invalid_parallel_backend(self, backend):
+        with pytest.raises(ValueError):
+            X, y = load_xy(2)
+            model = MFE().fit(X=X.values, y=y.values)
+            model.extract(enable_parallel=True, parallel_backend=backend)
+
+    @pytest.mark.parametrize("out_type", [list, dict, "tuple"])
+    def test_error_invalid_out_type(self, out_type):
+        with pytest.raises(ValueError):
+            X, y = load_xy(2)
+            model = MFE().fit(X=X.values, y=y.values)
+            model.extract(out_type=out_type)
+
+    @pytest.mark.parametrize(
+        "timeout_per_feature, total_timeout",
+        [
+            (0, None),
+            (-1.0, None),
+            (None, "10"),
+            (None, True),
+        ])
+    def test_error_invalid_timeout(self, timeout_per_feature, total_timeout):
+        with pytest.raises(ValueError):
+            X, y = load_xy(2)
+            model = MFE().fit(X=X.values, y=y.values)
+            model.extract(timeout_per_feature=timeout_per_feature,
+                          total_timeout=total_timeout)
+
+    def test_error_partial_fit_not_fitted(self):
+        with pytest.raises(TypeError):
+            X, y = load_xy(2)
+            MFE().partial_fit(X=X.values, y=y.values)
+
+    def test_error_partial_fit_columns(self):
+        with pytest.raises(ValueError):
+            X, y = load_xy(2)
+            model = MFE().fit(X=X.values, y=y.values)
+            model.partial_fit(X=X.values[:, 1:], y=y.values)
+
     def test_error_cat_cols_1(self):
         with pytest.raises(ValueError):
             X, y = load_xy(0)
@@ -213,6 +285,18 @@ class TestErrorsWarnings:
             X, y = load_xy(0)
             MFE().fit(X=X.values, y=y.values, rescale=rescale)
 
+    @pytest.mark.parametrize(
+        "dtype",
+        [
+            "",
+            "float16",
+            "int64",
+        ])
+    def test_error_invalid_dtype(self, dtype):
+        with pytest.raises(ValueError):
+            X, y = load_xy(0)
+            MFE().fit(X=X.values, y=y.values, dtype=dtype)
+
     def test_error_invalid_rescale_2(self):
         with pytest.raises(TypeError):
             X, y = load_xy(0)
@@ -254,6 +338,19 @@ class TestErrorsWarnings:
             model = MFE(features="sd").fit(X=X.values, y=y.values)
             model.extract(sd={"ddof": 1, "invalid": "value?"})
 
+    def test_warning_invalid_argument_once(self):
+        X, y = load_xy(0)
+        model = MFE(features=["mean", "sd", "var"],
+                    summary=["mean", "histogram"]).fit(X=X.values,
+                                                       y=y.values)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            model.extract(histogram={"bins": 5, "invalid": "value?"})
+
+        assert len([warn for warn in caught
+                    if "invalid" in str(warn.message)]) == 1
+
     def test_verbose(self, capsys):
         X, y = load_xy(0)
         model = MFE(features=["freq_class",
@@ -2,6 +2,7 @@
 import pytest
 
 from pymfe.mfe import MFE
+from pymfe import _internal
 from tests.utils import load_xy
 import numpy as np
 
@@ -105,3 +106,44 @@ class TestGeneral():
 
         else:
             assert np.allclose(value, exp_value)
+
+    @pytest.mark.parametrize("dt_id, check_bool", [
+        (0, False),
+        (0, True),
+        (1, True),
+        (2, True),
+    ])
+    def test_cat_cols_auto(self, dt_id, check_bool):
+        X, y = load_xy(dt_id)
+        mfe = MFE(groups="general").fit(X.values, y.values,
+                                       check_bool=check_bool)
+
+        cat_cols_exp = [
+            ind for ind in range(X.shape[1])
+            if not _internal.isnumeric(X.values[:, ind]) or (
+                check_bool and X.iloc[:, ind].nunique(dropna=False) == 2)
+        ]
+
+        assert list(mfe._attr_indexes_cat) == cat_cols_exp
+
+        if check_bool:
+            assert len(mfe._attr_num_distinct) == X.shape[1]
+
+    def test_attr_num_distinct_reused(self):
+        X, y = load_xy(1)
+        mfe = MFE(groups="general").fit(X.values, y.values,
+                                       check_bool=True,
+                                       precomp_groups="general")
+
+        assert (mfe._precomp_args_ft["attr_num_distinct"]
+                is mfe._attr_num_distinct)
+
+    def test_cat_cols_auto_sample(self):
+        X = np.array([[1, 0.5], [2, "a"]] * 1000 + [[3, 1.5], ["b", 1]],
+                     dtype=object)
+
+        cat_cols, num_distinct = _internal.infer_cat_cols(
+            X, check_bool=True, sample_size=16)
+
+        assert cat_cols.tolist() == [True, True]
+        assert num_distinct.tolist() == [4, 4]
@@ -1,7 +1,11 @@
 """Test module for MFE class output details."""
+import pickle
+import warnings
 import pytest
+import numpy as np
 
 from pymfe.mfe import MFE
+from pymfe.result import MFEResult
 from tests.utils import load_xy
 
 GNAME = "mfe-output-details"
@@ -64,3 +68,312 @@ class TestErrorsWarnings:
             vals, names, time = res
 
             assert len(vals) == len(names) == len(time)
+
+        @pytest.mark.parametrize(
+            "dt_id, n_jobs, backend",
+            [
+                (0, 2, "process"),
+                (0, 2, "thread"),
+                (0, 2, "auto"),
+                (2, None, "process"),
+                (2, None, "thread"),
+                (2, None, "auto"),
+            ])
+        def test_parallel_extraction(self, dt_id, n_jobs, backend):
+            X, y = load_xy(dt_id)
+            model = MFE(random_state=1234, n_jobs=n_jobs).fit(X=X.values,
+                                                               y=y.values)
+
+            names_seq, vals_seq = model.extract(suppress_warnings=True)
+            names_par, vals_par = model.extract(enable_parallel=True,
+                                                parallel_backend=backend,
+                                                suppress_warnings=True)
+
+            assert names_seq == names_par and np.allclose(
+                np.array(vals_seq, dtype=float),
+                np.array(vals_par, dtype=float),
+                equal_nan=True)
+
+        @pytest.mark.parametrize("enable_parallel", (False, True))
+        def test_extract_many(self, enable_parallel):
+            X_0, y_0 = load_xy(0)
+            X_2, y_2 = load_xy(2)
+
+            datasets = [
+                (X_0.values, y_0.values),
+                (X_2.values, y_2.values[:-1]),
+                (X_2.values, y_2.values),
+            ]
+
+            model = MFE(groups=("general", "statistical"),
+                        measure_time="total", n_jobs=2)
+
+            names, vals, times, errors = model.extract_many(
+                datasets, enable_parallel=enable_parallel)
+
+            assert model.X is None
+            assert vals.shape == times.shape == (len(datasets), len(names))
+            assert list(errors.keys()) == [1]
+            assert np.all(np.isnan(vals[1, :]))
+
+            for ind in (0, 2):
+                res_names, res_vals, _ = model.fit(
+                    *datasets[ind]).extract()
+
+                cols = [names.index(name) for name in res_names]
+
+                assert np.allclose(vals[ind, cols],
+                                   np.array(res_vals, dtype=float),
+                                   equal_nan=True)
+
+        @pytest.mark.parametrize("measure_time", (None, "total"))
+        def test_extract_result(self, measure_time):
+            X, y = load_xy(0)
+            model = MFE(groups=("general", "statistical"),
+                        measure_time=measure_time).fit(X=X.values, y=y.values)
+
+            res = model.extract(out_type=MFEResult)
+            res_tuple = model.extract()
+
+            assert res.values.dtype == np.float64
+            assert res.values.flags["C_CONTIGUOUS"]
+            assert list(res.names) == res_tuple[0]
+            assert np.allclose(res.values,
+                               np.array(res_tuple[1], dtype=float),
+                               equal_nan=True)
+            assert (res.times is None) == (measure_time is None)
+            assert len(res.to_tuple()) == len(res_tuple)
+
+            assert model.extract(out_type=MFEResult).names is res.names
+
+            name = res.names[0]
+            assert np.allclose(res[name], res.to_pandas()[name],
+                               equal_nan=True)
+
+        def test_extract_result_shared_names(self):
+            X, y = load_xy(0)
+            res = MFE(groups="general").fit(X.values, y.values).extract(
+                out_type=MFEResult)
+            res_other = MFE(groups="general").fit(X.values, y.values).extract(
+                out_type=MFEResult)
+
+            assert res_other.names is res.names
+            assert pickle.loads(pickle.dumps(res)).names is res.names
+
+        def test_extract_result_stack(self):
+            X_0, y_0 = load_xy(0)
+            X_2, y_2 = load_xy(2)
+
+            model = MFE(groups="general")
+            res_0 = model.fit(X_0.values, y_0.values).extract(
+                out_type=MFEResult)
+            res_2 = model.fit(X_2.values, y_2.values).extract(
+                out_type=MFEResult)
+
+            names, vals, times = MFEResult.stack([res_0, None, res_2])
+
+            assert times is None
+            assert vals.shape == (3, len(names))
+            assert np.all(np.isnan(vals[1, :]))
+            assert np.allclose(vals[0, :], res_0.values, equal_nan=True)
+            assert np.allclose(vals[2, :], res_2.values, equal_nan=True)
+
+        @pytest.mark.parametrize("out_type", (tuple, MFEResult))
+        def test_extract_summary_all(self, out_type):
+            X, y = load_xy(0)
+            model = MFE(groups=("general", "statistical"),
+                        summary="all").fit(X=X.values, y=y.values)
+
+            res = model.extract(out_type=out_type, suppress_warnings=True)
+
+            if out_type is MFEResult:
+                res = res.to_tuple()
+
+            names, vals = res
+
+            assert len(names) == len(vals)
+            assert any(name.startswith("sd.quantiles.") for name in names)
+            assert any(name.startswith("sd.histogram.") for name in names)
+
+        def test_extract_result_not_summarized(self):
+            X, y = load_xy(2)
+            model = MFE(features="sd", summary=None).fit(X.values, y.values)
+
+            with pytest.raises(ValueError):
+                model.extract(out_type=MFEResult)
+
+        @pytest.mark.parametrize("enable_parallel", (False, True))
+        def test_iter_extract(self, enable_parallel):
+            X, y = load_xy(2)
+            model = MFE(groups=("general", "statistical"),
+                        measure_time="total", n_jobs=2).fit(X=X.values,
+                                                            y=y.values)
+
+            names, vals, times = model.extract()
+
+            records = sorted(model.iter_extract(
+                enable_parallel=enable_parallel,
+                parallel_backend="thread"))
+
+            assert [rec[0] for rec in records] == names
+            assert np.allclose(np.array([rec[1] for rec in records],
+                                        dtype=float),
+                               np.array(vals, dtype=float),
+                               equal_nan=True)
+            assert len(times) == len(records)
+
+        def test_iter_extract_not_fitted(self):
+            with pytest.raises(TypeError):
+                MFE().iter_extract()
+
+        @pytest.mark.parametrize(
+            "timeout_per_feature, total_timeout, enable_parallel",
+            [
+                (1e-4, None, False),
+                (None, 1e-4, False),
+                (1e-4, None, True),
+            ])
+        def test_extraction_timed_out(self, timeout_per_feature,
+                                      total_timeout, enable_parallel):
+            X, y = load_xy(2)
+            model = MFE(groups="landmarking", random_state=1234,
+                        n_jobs=2).fit(X=X.values, y=y.values)
+
+            names, _ = model.extract(suppress_warnings=True)
+
+            with pytest.warns(RuntimeWarning, match="timed out"):
+                names_to, vals_to = model.extract(
+                    timeout_per_feature=timeout_per_feature,
+                    total_timeout=total_timeout,
+                    enable_parallel=enable_parallel)
+
+            assert names == names_to
+            assert np.all(np.isnan(np.array(vals_to, dtype=float)))
+
+            res = model.extract(timeout_per_feature=timeout_per_feature,
+                                total_timeout=total_timeout,
+                                enable_parallel=enable_parallel,
+                                suppress_warnings=True,
+                                out_type=MFEResult)
+
+            assert res.timed_out.dtype == bool and np.all(res.timed_out)
+
+        def test_extraction_timeout_lazy_precomp(self):
+            X, y = load_xy(0)
+            model = MFE(features="eigenvalues").fit(
+                X=X.values, y=y.values, lazy_precomp=True)
+
+            names, vals = model.extract()
+            model.fit(X=X.values, y=y.values, lazy_precomp=True)
+            names_to, vals_to = model.extract(timeout_per_feature=60)
+
+            # Evaluated by the process running the method, not beforehand
+            assert not model._precomp_args_ft.evaluated
+            assert names == names_to and np.allclose(vals, vals_to)
+
+        @pytest.mark.parametrize("enable_parallel", (False, True))
+        def test_extraction_in_time(self, enable_parallel):
+            X, y = load_xy(0)
+            model = MFE(groups=("general", "statistical"),
+                        n_jobs=2).fit(X=X.values, y=y.values)
+
+            names, vals = model.extract(suppress_warnings=True)
+            names_to, vals_to = model.extract(
+                timeout_per_feature=60,
+                total_timeout=600,
+                enable_parallel=enable_parallel,
+                suppress_warnings=True)
+
+            assert names == names_to and np.allclose(
+                np.array(vals, dtype=float),
+                np.array(vals_to, dtype=float),
+                equal_nan=True)
+
+            res = model.extract(timeout_per_feature=60,
+                                enable_parallel=enable_parallel,
+                                suppress_warnings=True,
+                                out_type=MFEResult)
+
+            assert not np.any(res.timed_out)
+
+        def test_fit_without_copy(self):
+            X, y = load_xy(2)
+            X_arr, y_arr = np.ascontiguousarray(X.values), y.values
+
+            names, vals = MFE(groups=("general", "statistical")).fit(
+                X=X_arr, y=y_arr, transform_num=False).extract()
+
+            model = MFE(groups=("general", "statistical"))
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                model.fit(X=X_arr, y=y_arr, transform_num=False, copy=False)
+
+            assert np.shares_memory(model.X, X_arr)
+            assert np.shares_memory(model._custom_args_ft["N"], X_arr)
+            assert not model.X.flags.writeable and X_arr.flags.writeable
+
+            names_nc, vals_nc = model.extract()
+
+            assert names == names_nc and np.allclose(
+                np.array(vals, dtype=float),
+                np.array(vals_nc, dtype=float),
+                equal_nan=True)
+
+        @pytest.mark.parametrize(
+            "to_list, fit_args",
+            [
+                (True, {"transform_num": False}),
+                (False, {"transform_num": True}),
+                (False, {"transform_num": False, "rescale": "min-max"}),
+            ])
+        def test_fit_without_copy_warnings(self, to_list, fit_args):
+            X, y = load_xy(2)
+            X_arr = X.values.tolist() if to_list else X.values
+
+            with pytest.warns(UserWarning, match="copied"):
+                MFE().fit(X=X_arr, y=y.values, copy=False, **fit_args)
+
+        @pytest.mark.parametrize("dt_id", (0, 1, 2))
+        def test_fit_dataframe(self, dt_id):
+            X, y = load_xy(dt_id)
+
+            model = MFE(groups=("general", "statistical", "info-theory"),
+                        random_state=1234)
+
+            names, vals = model.fit(X=X.values, y=y.values).extract()
+            names_df, vals_df = model.fit(X=X, y=y).extract()
+
+            assert model._custom_args_ft["N"].dtype == float
+            assert names == names_df and np.allclose(
+                np.array(vals, dtype=float),
+                np.array(vals_df, dtype=float),
+                equal_nan=True)
+
+        def test_fit_dataframe_categorical(self):
+            X, y = load_xy(0)
+            X_cat = X.astype({
+                col: "category"
+                for col in X.columns if X[col].dtype == object
+            })
+
+            model = MFE(groups=("general", "info-theory"), random_state=1234)
+
+            names, vals = model.fit(X=X.values, y=y.values).extract()
+            names_cat, vals_cat = model.fit(X=X_cat, y=y).extract()
+
+            assert model._cat_from_codes
+            assert model._custom_args_ft["C"].dtype.kind == "i"
+            assert names == names_cat and np.allclose(
+                np.array(vals, dtype=float),
+                np.array(vals_cat, dtype=float),
+                equal_nan=True)
+
+        def test_fit_dataframe_num_no_copy(self):
+            X, y = load_xy(2)
+            X_num = X.astype(float)
+
+            model = MFE(groups="statistical").fit(X=X_num, y=y, copy=False)
+
+            assert np.shares_memory(model._custom_args_ft["N"],
+                                    X_num.to_numpy())
@@ -0,0 +1,118 @@
+"""Test module for the incremental update of fitted data (partial_fit)."""
+import pytest
+import numpy as np
+
+from pymfe.mfe import MFE
+from tests.utils import load_xy
+
+GNAME = "mfe-partial-fit"
+
+
+def _partial_fit_extract(dt_id, groups, num_splits, fit_args=None,
+                         **kwargs):
+    X, y = load_xy(dt_id)
+
+    if fit_args is None:
+        fit_args = {}
+
+    splits = np.array_split(np.arange(y.size), num_splits)
+
+    model = MFE(groups=groups, random_state=1234, **kwargs)
+    model.fit(X=X.values[splits[0]], y=y.values[splits[0]],
+              precomp_groups="all", **fit_args)
+
+    for split in splits[1:]:
+        model.partial_fit(X=X.values[split], y=y.values[split])
+
+    full_model = MFE(groups=groups, random_state=1234, **kwargs).fit(
+        X=X.values, y=y.values, precomp_groups="all", **fit_args)
+
+    return model, full_model
+
+
+class TestPartialFit:
+        """TestClass dedicated to test MFE incremental updates."""
+
+        @pytest.mark.parametrize(
+            "dt_id, groups, num_splits, fit_args",
+            [
+                (1, ("general", "info-theory"), 2, None),
+                (1, ("general", "info-theory"), 4, None),
+                (2, ("general", "statistical"), 2, None),
+                (2, ("general", "statistical"), 3, None),
+                (2, ("statistical", "info-theory"), 2, {"rescale": "robust"}),
+                (0, ("general", "statistical", "info-theory"), 3,
+                 {"transform_num": False}),
+            ])
+        def test_partial_fit_values(self, dt_id, groups, num_splits,
+                                    fit_args):
+            model, full_model = _partial_fit_extract(
+                dt_id, groups, num_splits, fit_args)
+
+            names, vals = model.extract(suppress_warnings=True)
+            names_full, vals_full = full_model.extract(suppress_warnings=True)
+
+            assert names == names_full
+            assert np.allclose(
+                np.array(vals, dtype=float),
+                np.array(vals_full, dtype=float),
+                equal_nan=True)
+
+            assert model.fingerprint == full_model.fingerprint
+
+        @pytest.mark.parametrize(
+            "dt_id, groups, updated, recomputed",
+            [
+                (1, ("info-theory", ), {"attr_ent", "joint_ent", "mut_inf"},
+                 set()),
+                (2, ("statistical", ), {"classes", "cov_mat", "abs_corr_mat"},
+                 {"eig_vals", "eig_vecs"}),
+                (2, ("statistical", "landmarking"), {"cov_mat"},
+                 {"skf"}),
+            ])
+        def test_partial_fit_updated(self, dt_id, groups, updated,
+                                     recomputed):
+            model, full_model = _partial_fit_extract(dt_id, groups, 2)
+
+            assert updated.issubset(model.precomp_updated)
+            assert recomputed.isdisjoint(model.precomp_updated)
+            assert recomputed.issubset(model._precomp_args_ft)
+
+        def test_partial_fit_rescale_not_updated(self):
+            model, _ = _partial_fit_extract(
+                2, ("statistical", ), 2, fit_args={"rescale": "min-max"})
+
+            assert "cov_mat" not in model.precomp_updated
+            assert "classes" in model.precomp_updated
+
+        def test_partial_fit_lazy(self):
+            model, full_model = _partial_fit_extract(
+                2, ("general", "statistical"), 2,
+                fit_args={"lazy_precomp": True})
+
+            _, vals = model.extract(suppress_warnings=True)
+            _, vals_full = full_model.extract(suppress_warnings=True)
+
+            assert np.allclose(vals, vals_full, equal_nan=True)
+
+        def test_partial_fit_new_categories(self):
+            X = np.array([["a", "x"], ["b", "x"], ["a", "y"], ["b", "y"],
+                          ["c", "x"], ["a", "z"], ["c", "z"], ["b", "x"]],
+                         dtype=object)
+            y = np.array([0, 1, 0, 1, 2, 2, 1, 0])
+
+            model = MFE(groups="info-theory", random_state=1234)
+            model.fit(X=X[:4], y=y[:4], precomp_groups="all")
+            model.partial_fit(X=X[4:], y=y[4:])
+
+            full_model = MFE(groups="info-theory", random_state=1234).fit(
+                X=X, y=y, precomp_groups="all")
+
+            assert {"attr_ent", "joint_ent", "mut_inf"}.issubset(
+                model.precomp_updated)
+
+            _, vals = model.extract(suppress_warnings=True)
+            _, vals_full = full_model.extract(suppress_warnings=True)
+
+            assert not np.any(np.isnan(np.array(vals, dtype=float)))
+            assert np.allclose(vals, vals_full)
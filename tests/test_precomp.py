@@ -0,0 +1,165 @@
+"""Test module for MFE precomputation scheduling."""
+import pytest
+import numpy as np
+
+from pymfe.mfe import MFE
+import pymfe._internal as _internal
+from tests.utils import load_xy
+
+GNAME = "mfe-precomputation"
+
+
+class TestPrecomputation:
+        """TestClass dedicated to test MFE precomputation scheduling."""
+
+        def test_precomp_order_dependencies(self):
+            mtds = _internal._get_all_prefixed_mtds(
+                prefix=_internal.PRECOMPUTE_PREFIX,
+                groups=_internal.VALID_GROUPS,
+            )["methods"]
+
+            # Reverse to force the scheduler to reorder dependent methods
+            sorted_mtds, dependencies = _internal._sort_precomp_mtds(
+                mtds[::-1])
+
+            names = [mtd_name for mtd_name, _ in sorted_mtds]
+
+            assert len(names) == len(mtds)
+            assert ("precompute_class_freq"
+                    in dependencies["precompute_entropy"])
+
+            for mtd_name, mtd_deps in dependencies.items():
+                for dep_name in mtd_deps:
+                    assert names.index(dep_name) < names.index(mtd_name)
+
+        def test_precomp_order_cycle(self):
+            class _Cyclic:
+                PRECOMPUTE_PRODUCES = {
+                    "precompute_a": ("val_a",),
+                    "precompute_b": ("val_b",),
+                }
+
+                @classmethod
+                def precompute_a(cls, val_b=None, **kwargs):
+                    return {"val_a": 1}
+
+                @classmethod
+                def precompute_b(cls, val_a=None, **kwargs):
+                    return {"val_b": 2}
+
+            mtds = (("precompute_a", _Cyclic.precompute_a),
+                    ("precompute_b", _Cyclic.precompute_b))
+
+            sorted_mtds, dependencies = _internal._sort_precomp_mtds(mtds)
+
+            assert sorted_mtds == mtds
+            assert dependencies["precompute_b"] == {"precompute_a"}
+
+        @pytest.mark.parametrize(
+            "dt_id, n_jobs",
+            [
+                (0, 2),
+                (1, None),
+                (2, 2),
+            ])
+        def test_parallel_fit(self, dt_id, n_jobs):
+            X, y = load_xy(dt_id)
+
+            model = MFE(n_jobs=n_jobs, random_state=1234)
+
+            precomp_serial = model.fit(
+                X=X.values, y=y.values)._precomp_args_ft
+
+            precomp_parallel = model.fit(
+                X=X.values, y=y.values,
+                enable_parallel=True)._precomp_args_ft
+
+            assert precomp_serial.keys() == precomp_parallel.keys()
+
+            assert np.array_equal(precomp_serial["classes"],
+                                  precomp_parallel["classes"])
+
+            for key in ("class_freqs", "cov_mat", "eig_vals",
+                        "class_ent", "attr_ent", "mut_inf"):
+                if key in precomp_serial:
+                    assert np.allclose(precomp_serial[key],
+                                       precomp_parallel[key],
+                                       equal_nan=True)
+
+            res_serial = model.fit(X=X.values, y=y.values).extract()
+            res_parallel = model.fit(
+                X=X.values, y=y.values, enable_parallel=True).extract()
+
+            assert res_serial[0] == res_parallel[0]
+            assert np.allclose(np.array(res_serial[1], dtype=float),
+                               np.array(res_parallel[1], dtype=float),
+                               equal_nan=True)
+
+        @pytest.mark.parametrize(
+            "features, expected_evaluated",
+            [
+                ("nr_inst", set()),
+                ("eigenvalues", {"precompute_statistical_cor_cov"}),
+                ("mut_inf", {"precompute_class_freq",
+                             "precompute_cont_tables",
+                             "precompute_entropy"}),
+                ("can_cor", {"precompute_statistical_class",
+                                 "precompute_statistical_eigen"}),
+            ])
+        def test_lazy_precomp_evaluation(self, features, expected_evaluated):
+            X, y = load_xy(0)
+
+            model = MFE(features=features).fit(
+                X=X.values, y=y.values, lazy_precomp=True)
+
+            assert not model._precomp_args_ft.evaluated
+
+            model.extract()
+
+            assert model._precomp_args_ft.evaluated == expected_evaluated
+
+        @pytest.mark.parametrize("dt_id", (0, 1, 2))
+        def test_lazy_precomp_values(self, dt_id):
+            X, y = load_xy(dt_id)
+
+            model = MFE(groups=("general", "statistical", "info-theory"),
+                        random_state=1234)
+
+            res_eager = model.fit(X=X.values, y=y.values).extract()
+            res_lazy = model.fit(
+                X=X.values, y=y.values, lazy_precomp=True).extract()
+
+            assert res_eager[0] == res_lazy[0]
+            assert np.allclose(np.array(res_eager[1], dtype=float),
+                               np.array(res_lazy[1], dtype=float),
+                               equal_nan=True)
+
+        def test_registry(self, monkeypatch):
+            registry = _internal.get_registry("statistical")
+
+            assert _internal.get_registry("statistical") is registry
+            assert _internal.MTD_REGISTRY["statistical"] is registry
+
+            mtd_name, mtd_callable, mtd_args = next(
+                mtd_tuple for mtd_tuple in registry[_internal.MTF_PREFIX]
+                if mtd_tuple[0] == "ft_mean")
+
+            assert mtd_args == ("N", )
+            assert _internal.get_mtd_group(mtd_callable) == "statistical"
+            assert _internal.get_mtd_args(mtd_callable) == mtd_args
+
+            with pytest.raises(TypeError):
+                registry[_internal.MTF_PREFIX] = tuple()
+
+            X, y = load_xy(0)
+            model = MFE(groups="statistical")
+
+            # The registered methods must not be inspected again
+            def _fail(*args, **kwargs):
+                raise AssertionError("Registered methods inspected again.")
+
+            monkeypatch.setattr(_internal, "_get_prefixed_mtds_from_class",
+                                _fail)
+            monkeypatch.setattr(_internal, "_extract_mtd_args", _fail)
+
+            model.fit(X.values, y.values).extract()
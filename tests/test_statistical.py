@@ -2,6 +2,8 @@
 import pytest
 
 from pymfe.mfe import MFE
+from pymfe.result import MFEResult
+import pymfe.statistical as statistical
 from tests.utils import load_xy
 import numpy as np
 
@@ -268,3 +270,158 @@ class TestStatistical():
             mfe = MFE(groups=["statistical"], features="nr_norm")
             mfe.fit(X.values, y.values, precomp_groups=None)
             mfe.extract(nr_norm={"failure": failure, "method": test})
+
+    @pytest.mark.parametrize(
+        "ft_name",
+        ["iq_range", "mad", "max", "mean", "median", "min", "range", "sd",
+         "var"])
+    def test_col_blocks(self, ft_name, monkeypatch):
+        """Test column-wise metafeatures computed by blocks of columns."""
+        X, y = load_xy(2)
+        mfe = MFE(groups=["statistical"], features=ft_name,
+                  summary=None).fit(X.values, y.values)
+        value = mfe.extract()[1]
+
+        # Force one column per block
+        monkeypatch.setattr(statistical.MFEStatistical, "COL_BLOCK_BYTES", 1)
+        value_blocks = mfe.extract()[1]
+
+        assert np.allclose(value, value_blocks, equal_nan=True)
+
+    def test_memmap(self, tmp_path):
+        """Test extraction from memory-mapped data."""
+        X, y = load_xy(2)
+        X_arr = np.ascontiguousarray(X.values, dtype=float)
+        path = str(tmp_path / "X.npy")
+        np.save(path, X_arr)
+
+        X_mmap = np.load(path, mmap_mode="r")
+
+        mfe = MFE(groups=["statistical"], random_state=1234)
+        mfe.fit(X_mmap, y.values, transform_num=False)
+
+        assert isinstance(mfe.X, np.memmap)
+        assert np.shares_memory(mfe._custom_args_ft["N"], X_mmap)
+
+        names, vals = mfe.extract()
+        names_exp, vals_exp = MFE(
+            groups=["statistical"], random_state=1234).fit(
+                X_arr, y.values, transform_num=False).extract()
+
+        assert names == names_exp
+        assert np.allclose(vals, vals_exp, equal_nan=True)
+
+    @pytest.mark.parametrize("precomp_groups", [None, "all"])
+    def test_dtype_float32(self, precomp_groups):
+        """Test metafeatures extracted in the float32 compute mode.
+
+        The maximum deviation from the float64 values is documented by the
+        tolerances below: a relative error of 1e-3, or an absolute error of
+        1e-5 for values close to zero (e.g., eigenvalues and correlations of
+        nearly independent attributes).
+        """
+        X, y = load_xy(2)
+
+        mfe = MFE(groups=["statistical"], random_state=1234)
+        mfe.fit(X.values, y.values, precomp_groups=precomp_groups,
+                dtype="float32")
+
+        assert mfe._custom_args_ft["N"].dtype == np.float32
+
+        if precomp_groups:
+            assert mfe._precomp_args_ft["cov_mat"].dtype == np.float32
+            assert mfe._precomp_args_ft["abs_corr_mat"].dtype == np.float32
+
+        names, vals = mfe.extract(suppress_warnings=True)
+        names_exp, vals_exp = MFE(
+            groups=["statistical"], random_state=1234).fit(
+                X.values, y.values, precomp_groups=precomp_groups,
+                dtype="float64").extract(suppress_warnings=True)
+
+        assert names == names_exp
+        assert np.allclose(
+            np.array(vals, dtype=float),
+            np.array(vals_exp, dtype=float),
+            rtol=1e-3,
+            atol=1e-5,
+            equal_nan=True)
+
+    @pytest.mark.parametrize(
+        "num_chunks, method, bias",
+        [
+            (1, 3, True),
+            (4, 3, True),
+            (7, 1, False),
+            (13, 2, False),
+        ])
+    def test_extract_chunked(self, num_chunks, method, bias):
+        """Test metafeatures extracted from blocks of instances."""
+        X, y = load_xy(2)
+        N = X.values.astype(float)
+        features = statistical.MFEStatistical.CHUNKED_FEATURES
+
+        names, vals = MFE(groups=["statistical"], features=features,
+                          summary=None).fit(N, y.values).extract(
+                              skewness={"method": method, "bias": bias},
+                              kurtosis={"method": method, "bias": bias})
+
+        res = statistical.MFEStatistical.extract_chunked(
+            (chunk for chunk in np.array_split(N, num_chunks)),
+            method=method,
+            bias=bias)
+
+        assert sorted(res) == sorted(names)
+
+        for ft_name, ft_value in zip(names, vals):
+            # Scalar features (e.g., 'nr_cor_attr') can not be sorted
+            assert np.allclose(
+                np.sort(np.real(np.atleast_1d(res[ft_name]))),
+                np.sort(np.real(np.atleast_1d(ft_value))),
+                equal_nan=True)
+
+    @pytest.mark.parametrize("summary", (("mean", "sd"), ("histogram", )))
+    def test_mfe_extract_chunked(self, summary):
+        """Test summarized metafeatures extracted from blocks of instances."""
+        X, y = load_xy(2)
+        N = X.values.astype(float)
+        features = statistical.MFEStatistical.CHUNKED_FEATURES
+
+        names, vals = MFE(groups=["statistical"], features=features,
+                          summary=summary).fit(N, y.values).extract(
+                              skewness={"method": 2})
+
+        model = MFE(groups=["statistical"], features=features,
+                    summary=summary, measure_time="total")
+
+        res = model.extract_chunked(
+            (chunk for chunk in np.array_split(N, 5)),
+            skewness={"method": 2},
+            out_type=MFEResult)
+
+        assert list(res.names) == names
+        assert res.times is not None
+        assert np.allclose(res.values,
+                           np.array(vals, dtype=float),
+                           equal_nan=True)
+
+    def test_mfe_extract_chunked_errors(self):
+        """Test invalid arguments of the chunked mode of MFE models."""
+        chunks = [np.ones((5, 2))]
+
+        with pytest.raises(ValueError):
+            MFE(features="h_mean").extract_chunked(chunks)
+
+        with pytest.warns(UserWarning, match="h_mean"):
+            MFE(features=["mean", "h_mean"]).extract_chunked(chunks)
+
+        with pytest.raises(ValueError):
+            MFE(features="mean").extract_chunked(iter([]))
+
+    def test_extract_chunked_errors(self):
+        """Test invalid arguments of the chunked mode."""
+        with pytest.raises(ValueError):
+            statistical.MFEStatistical.extract_chunked(
+                [np.ones((5, 2))], features=["mean", "h_mean"])
+
+        with pytest.raises(ValueError):
+            statistical.MFEStatistical.extract_chunked(iter([]))
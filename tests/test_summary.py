@@ -0,0 +1,99 @@
+"""Test module for the summary functions."""
+import pytest
+import numpy as np
+
+import pymfe._internal as _internal
+import pymfe._lazy as _lazy
+import pymfe._summary as _summary
+
+GNAME = "summary"
+
+
+def _values(size=101, dtype=np.float32):
+    return np.random.RandomState(1234).gamma(2.0, size=size).astype(dtype)
+
+
+class TestSummary:
+        """TestClass dedicated to test the summary functions."""
+
+        @pytest.mark.parametrize(
+            "sm_mtd_name, sm_mtd_args",
+            [
+                ("mean", {}),
+                ("sd", {"ddof": 1}),
+                ("var", {"ddof": 1}),
+                ("var", {"ddof": 0}),
+                ("count", {}),
+                ("iq_range", {}),
+                ("kurtosis", {}),
+                ("kurtosis", {"method": 1}),
+                ("kurtosis", {"method": 2}),
+                ("kurtosis", {"bias": False}),
+                ("max", {}),
+                ("median", {}),
+                ("min", {}),
+                ("quantiles", {}),
+                ("quantiles", {"package": "scipy"}),
+                ("quantiles", {"numpy_interpolation": "nearest"}),
+                ("range", {}),
+                ("skewness", {}),
+                ("skewness", {"method": 2}),
+                ("skewness", {"bias": False}),
+                ("histogram", {"bins": 5}),
+            ])
+        @pytest.mark.parametrize("size", (1, 2, 10, 101))
+        def test_call_summary(self, sm_mtd_name, sm_mtd_args, size):
+            values = _values(size=size)
+            sm_mtd_callable = _lazy.resolve(
+                _summary.SUMMARY_METHODS[sm_mtd_name])
+
+            res = _internal.summarize_stats(
+                _summary.SummaryStats(values), sm_mtd_name,
+                sm_mtd_callable, sm_mtd_args)
+
+            res_exp = _internal.summarize(values, sm_mtd_callable,
+                                          sm_mtd_args)
+
+            assert np.allclose(res, res_exp, rtol=1e-4, equal_nan=True)
+
+        def test_shared_stats(self):
+            sum_stats = _summary.SummaryStats(_values())
+
+            for sm_mtd_name in ("median", "min", "max", "quantiles"):
+                _summary.call_summary(sum_stats, sm_mtd_name, None)
+
+            sorted_vals = sum_stats.sorted_values
+
+            for sm_mtd_name in ("mean", "sd", "skewness", "kurtosis"):
+                _summary.call_summary(sum_stats, sm_mtd_name, None)
+
+            assert sum_stats.sorted_values is sorted_vals
+            assert np.array_equal(sorted_vals, np.sort(sum_stats.values))
+
+        @pytest.mark.parametrize(
+            "features, expected",
+            [
+                (np.array([1, 2, 3]), [1.0, 2.0, 3.0]),
+                ([1, None, "a", 2.5], [1.0, 2.5]),
+                (np.array([0.5, np.nan]), [0.5, np.nan]),
+            ])
+        def test_clean_feature_values(self, features, expected):
+            values = _internal.clean_feature_values(features)
+
+            assert values.dtype == np.float32
+            assert np.allclose(values, expected, equal_nan=True)
+
+        def test_degenerate_moments(self):
+            values = np.full(10, fill_value=3.0, dtype=np.float32)
+            sum_stats = _summary.SummaryStats(values)
+
+            assert sum_stats.moments_are_degenerate()
+
+            for sm_mtd_name in ("skewness", "kurtosis"):
+                sm_mtd_callable = _summary.SUMMARY_METHODS[sm_mtd_name]
+
+                res = _internal.summarize_stats(
+                    sum_stats, sm_mtd_name, sm_mtd_callable)
+
+                assert np.allclose(res, sm_mtd_callable(values),
+                                   equal_nan=True)